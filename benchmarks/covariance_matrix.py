@@ -0,0 +1,37 @@
+"""
+Times covariance_matrix and correlation_matrix against calling StatList.covariance and stats.R for every pair of lists.
+Run from the repository root: python -m benchmarks.covariance_matrix [n] [columns]
+"""
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from washmath import Precision, StatList
+from washmath.stats import R, correlation_matrix, covariance_matrix
+
+
+def main(n:int=10_000, columns:int=10):
+	rng = Random(0)
+	data = [[round(rng.uniform(0, 1_000), 2) for _ in range(n)] for _ in range(columns)]
+	for precision in (Precision.FLOAT, Precision.EXACT):
+		statlists = [StatList(values, precision=precision) for values in data]
+
+		begin = perf_counter()
+		[[x.covariance(y) for y in statlists] for x in statlists]
+		print(f"{precision}: StatList.covariance for every pair: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+		begin = perf_counter()
+		covariance_matrix(*statlists)
+		print(f"{precision}: covariance_matrix: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+		begin = perf_counter()
+		[[R(x, y).r for y in statlists] for x in statlists]
+		print(f"{precision}: stats.R for every pair: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+		begin = perf_counter()
+		correlation_matrix(*statlists, chunk_size=n // 4)
+		print(f"{precision}: correlation_matrix, 4 chunks: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+
+if __name__ == "__main__":
+	main(*(int(argument) for argument in argv[1:3]))
@@ -0,0 +1,33 @@
+"""
+Compares an exact sum of squared deviations done with a loop over Fractions against the same sum on a FractionArray.
+Run from the repository root: python -m benchmarks.fraction_array [n]
+"""
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from washmath import Fraction, FractionArray
+
+
+def loop_variance(values, mean) -> Fraction:
+	return sum([(point - mean) ** 2 for point in values], start=Fraction(0)) / (len(values) - 1)
+
+
+def array_variance(values, mean) -> Fraction:
+	differences = FractionArray(values) - mean
+	return differences.dot(differences) / (len(values) - 1)
+
+
+def main(n:int=100_000):
+	rng = Random(0)
+	values = [Fraction(rng.randint(0, 10_000), 100) for _ in range(n)]
+	mean = sum(values, start=Fraction(0)) / n
+
+	for name, function in (("Fraction loop", loop_variance), ("FractionArray", array_variance)):
+		begin = perf_counter()
+		variance = function(values, mean)
+		print(f"{name}: {(perf_counter() - begin) * 1_000:.1f} ms, variance {float(variance):.6f}")
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 100_000)
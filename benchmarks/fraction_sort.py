@@ -0,0 +1,28 @@
+"""
+Times sorting a list of Fractions with exact comparisons, with a float key, and with sort_exact.
+Run from the repository root: python -m benchmarks.fraction_sort [n]
+"""
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from washmath import Fraction, sort_exact
+
+
+def main(n:int=100_000):
+	rng = Random(0)
+	values = [Fraction(rng.randint(0, 10 ** 6), rng.randint(1, 1_000)) for _ in range(n)]
+
+	for name, key in (("Fraction.__lt__", None), ("float key (inexact)", float)):
+		begin = perf_counter()
+		sorted(values, key=key)
+		print(f"{name}: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+	copy = values.copy()
+	begin = perf_counter()
+	sort_exact(copy)
+	print(f"sort_exact: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 100_000)
@@ -0,0 +1,41 @@
+"""
+Compares ways of adding a list of Fractions exactly.
+Run from the repository root: python -m benchmarks.fraction_sum [n]
+"""
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from washmath import Fraction, FractionArray, fsum_exact
+
+
+def builtin_sum(values) -> Fraction:
+	return sum(values, start=Fraction(0))
+
+
+def deferred_sum(values) -> Fraction:
+	with Fraction.deferred_reduction():
+		return sum(values, start=Fraction(0)).reduce()
+
+
+def array_sum(values) -> Fraction:
+	return FractionArray(values).sum()
+
+
+def main(n:int=200_000):
+	rng = Random(0)
+	datasets = {
+		"integers": [Fraction(rng.randint(0, 1_000)) for _ in range(n)],
+		"shared denominator": [Fraction(rng.randint(0, 10_000), 100) for _ in range(n)],
+		"decimal denominators": [Fraction(rng.randint(0, 10 ** 6), 10 ** rng.randint(1, 6)) for _ in range(n)],
+	}
+	for dataset, values in datasets.items():
+		print(dataset)
+		for name, function in (("sum(start=Fraction(0))", builtin_sum), ("deferred_reduction", deferred_sum), ("fsum_exact", fsum_exact), ("FractionArray.sum", array_sum)):
+			begin = perf_counter()
+			total = function(values)
+			print(f"\t{name}: {(perf_counter() - begin) * 1_000:.1f} ms ({float(total):.6g})")
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 200_000)
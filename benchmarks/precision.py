@@ -0,0 +1,31 @@
+"""
+Times long exact computations under each Precision policy.
+Run from the repository root: python -m benchmarks.precision [n]
+"""
+from sys import argv
+from time import perf_counter
+
+from washmath import Fraction, Polynomial, Precision, euler
+
+
+POLICIES = (Precision.EXACT, Precision.bounded(10 ** 9), Precision.FLOAT)
+
+
+def main(n:int=2_000):
+	print(f"euler, h=0.01, {n:,} steps")
+	for precision in POLICIES:
+		begin = perf_counter()
+		y = euler(0.01, 0, 1, lambda x, y: y - x * x / 3, n=n, precision=precision)
+		print(f"\t{precision}: {(perf_counter() - begin) * 1_000:.1f} ms ({float(y):.12g})")
+
+	power = n // 10
+	print(f"(x/3 + 2/7) ** {power:,}")
+	for precision in POLICIES:
+		polynomial = Polynomial({1: Fraction(1, 3), 0: Fraction(2, 7)}, precision=precision)
+		begin = perf_counter()
+		polynomial ** power
+		print(f"\t{precision}: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 2_000)
@@ -0,0 +1,44 @@
+"""
+Times streaming values into a QuantileSketch against keeping them in a float StatList, and prints the rank error of the sketch's median, p95, and p99.
+Run from the repository root: python -m benchmarks.quantile_sketch [n]
+"""
+from sys import argv
+from time import perf_counter
+
+import numpy as np
+
+from washmath import Precision, StatList
+from washmath.stats import QuantileSketch
+
+
+def main(n:int=1_000_000):
+	values = np.random.default_rng(0).lognormal(size=n)
+	chunks = np.array_split(values, max(n // 10_000, 1))
+	probabilities = [0.5, 0.95, 0.99]
+
+	begin = perf_counter()
+	sketch = QuantileSketch()
+	for chunk in chunks:
+		sketch.update(chunk)
+	estimates = sketch.quantiles(probabilities)
+	print(f"QuantileSketch, {n:,} values in chunks of 10,000: {(perf_counter() - begin) * 1_000:.1f} ms, {sketch.centroids} centroids")
+
+	begin = perf_counter()
+	sketch = QuantileSketch()
+	for value in values[:n // 10].tolist():
+		sketch.add(value)
+	sketch.quantiles(probabilities)
+	print(f"QuantileSketch, {n // 10:,} values added one at a time: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+	begin = perf_counter()
+	statlist = StatList(values.tolist(), precision=Precision.FLOAT)
+	statlist.quantiles(probabilities)
+	print(f"float StatList holding all {n:,} values: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+	ordered = np.sort(values)
+	for probability, estimate in zip(probabilities, estimates):
+		print(f"p{probability * 100:g}: rank error {abs(np.searchsorted(ordered, estimate) / n - probability):.2e}")
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 1_000_000)
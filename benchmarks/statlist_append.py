@@ -0,0 +1,28 @@
+"""
+Times building a StatList one append at a time, then reading its statistics once.
+The appends should scale linearly, since they only clear the cached statistics.
+Run from the repository root: python -m benchmarks.statlist_append [n]
+"""
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from washmath import StatList
+
+
+def main(n:int=20_000):
+	rng = Random(0)
+	for size in (n // 8, n // 4, n // 2, n):
+		values = [rng.randint(0, 100) for _ in range(size)]
+		statlist = StatList(1, 2)
+		begin = perf_counter()
+		for value in values:
+			statlist.append(value)
+		appended = perf_counter() - begin
+		statlist.mean, statlist.variance, statlist.median
+		read = perf_counter() - begin - appended
+		print(f"{size:,} appends: {appended * 1_000:.1f} ms ({appended / size * 1e6:.2f} µs each), then mean, variance, and median: {read * 1_000:.1f} ms")
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 20_000)
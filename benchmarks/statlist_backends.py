@@ -0,0 +1,36 @@
+"""
+Compares the exact Fraction backend of StatList with the NumPy float64 backend (allow_fractions=False).
+The float backend is not a separate array container: the list still holds Python floats, and a float64 copy of them, _array, is built the first time
+a statistic needs it and cached until the values change. Every mutation drops it, so the next statistic pays an O(n) copy of 8 bytes per value again.
+The timings below include building that copy once. The exact backend counts the mode in one O(n) pass over a Counter, and the float backend uses
+np.unique, O(n log n).
+Run from the repository root: python -m benchmarks.statlist_backends [n]
+"""
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from washmath import StatList
+
+PROPERTIES = ("sum", "mean", "variance", "standard_deviation", "standard_error", "min", "max", "median", "Q1", "Q3", "outliers", "average_deviation", "mode")
+
+
+def run(values, allow_fractions:bool) -> tuple[float, float]:
+	begin = perf_counter()
+	statlist = StatList(values, allow_fractions=allow_fractions)
+	built = perf_counter()
+	for name in PROPERTIES:
+		getattr(statlist, name)
+	return built - begin, perf_counter() - built
+
+
+def main(n:int=1_000_000):
+	rng = Random(0)
+	values = [round(rng.gauss(500, 100), 3) for _ in range(n)]
+	for name, allow_fractions in (("float64", False), ("exact", True)):
+		construction, statistics = run(values, allow_fractions)
+		print(f"{name} backend, {n:,} values: construction {construction * 1_000:,.0f} ms, statistics {statistics * 1_000:,.0f} ms")
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 1_000_000)
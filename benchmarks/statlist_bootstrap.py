@@ -0,0 +1,35 @@
+"""
+Times StatList.bootstrap against building a StatList for every resample and reading the statistic from it, and with a process pool.
+Run from the repository root: python -m benchmarks.statlist_bootstrap [n] [n_resamples]
+"""
+from os import cpu_count
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from washmath import Precision, StatList
+
+
+def main(n:int=1_000, n_resamples:int=10_000):
+	rng = Random(0)
+	values = [round(rng.uniform(0, 1_000), 2) for _ in range(n)]
+	for precision in (Precision.FLOAT, Precision.EXACT):
+		statlist = StatList(values, precision=precision)
+		for stat in ("median", "mean", "IQR"):
+			resamples = max(1, n_resamples // 100)
+			begin = perf_counter()
+			for _ in range(resamples):
+				getattr(StatList(rng.choices(statlist, k=n), precision=precision), stat)
+			print(f"{precision}: {stat}, a StatList per resample: {(perf_counter() - begin) / resamples * n_resamples * 1_000:.1f} ms for {n_resamples} (from {resamples})")
+
+			begin = perf_counter()
+			statlist.bootstrap(stat, n_resamples, seed=0)
+			print(f"{precision}: {stat}, StatList.bootstrap: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+			begin = perf_counter()
+			statlist.bootstrap(stat, n_resamples, seed=0, workers=cpu_count())
+			print(f"{precision}: {stat}, StatList.bootstrap with {cpu_count()} workers: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+
+if __name__ == "__main__":
+	main(*(int(argument) for argument in argv[1:3]))
@@ -0,0 +1,37 @@
+"""
+Times building an exact StatList and reading its moments serially, against StatList.from_chunks and StatSummary.reduce with a ProcessPoolExecutor.
+Run from the repository root: python -m benchmarks.statlist_chunks [n]
+"""
+from concurrent.futures import ProcessPoolExecutor
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from washmath import StatList
+from washmath.stats import StatSummary
+
+
+def main(n:int=200_000, chunk_size:int=25_000):
+	rng = Random(0)
+	values = [round(rng.uniform(0, 1_000), 3) for _ in range(n)]
+	chunks = [values[start:start + chunk_size] for start in range(0, n, chunk_size)]
+
+	begin = perf_counter()
+	statlist = StatList(values)
+	statlist.mean, statlist.variance, statlist.min, statlist.max
+	print(f"StatList, serial: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+	with ProcessPoolExecutor() as executor:
+		executor.submit(int).result()  # Starts the workers before timing
+		begin = perf_counter()
+		statlist = StatList.from_chunks(chunks, executor=executor)
+		statlist.mean, statlist.variance, statlist.min, statlist.max
+		print(f"StatList.from_chunks, {len(chunks)} chunks on a process pool: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+		begin = perf_counter()
+		summary = StatSummary.reduce(chunks, executor=executor)
+		print(f"StatSummary.reduce, {len(chunks)} chunks on a process pool: {(perf_counter() - begin) * 1_000:.1f} ms, {len(summary.to_bytes())} bytes")
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 200_000)
@@ -0,0 +1,54 @@
+"""
+Times StatList construction and measures the memory held by its Fraction elements.
+Run from the repository root: python -m benchmarks.statlist_construction [n]
+"""
+from random import Random
+from sys import argv, getsizeof
+from time import perf_counter
+from tracemalloc import start, stop, get_traced_memory, reset_peak
+
+from washmath import Fraction, StatList
+
+
+def fraction_size(fraction) -> int:
+	"""The bytes used by one Fraction, including its instance dictionary if it has one"""
+	size = getsizeof(fraction)
+	if hasattr(fraction, "__dict__"):
+		size += getsizeof(fraction.__dict__)
+	return size
+
+
+def bench_fractions(values) -> tuple[float, int]:
+	start()
+	reset_peak()
+	begin = perf_counter()
+	fractions = [Fraction(value) for value in values]
+	elapsed = perf_counter() - begin
+	_, peak = get_traced_memory()
+	stop()
+	del fractions
+	return elapsed, peak
+
+
+def bench_statlist(values) -> float:
+	begin = perf_counter()
+	StatList(*values)
+	return perf_counter() - begin
+
+
+def main(n:int=10_000):
+	rng = Random(0)
+	integers = [rng.randint(0, 1_000) for _ in range(n)]
+	floats = [round(rng.uniform(0, 1_000), 3) for _ in range(n)]
+	likert = [rng.randint(1, 5) for _ in range(n)]  # Few distinct values, all shared by Fraction.set_intern_range
+	half_points = [rng.randint(0, 20) / 2 for _ in range(n)]
+
+	print(f"Bytes per Fraction: {fraction_size(Fraction(1, 3))}")
+	for name, values in (("int", integers), ("float", floats), ("likert", likert), ("half point", half_points)):
+		elapsed, peak = bench_fractions(values)
+		print(f"{n:,} {name} Fractions: {elapsed * 1_000:.1f} ms, peak {peak / 1_024:,.0f} KiB")
+		print(f"{n:,} {name} StatList: {bench_statlist(values) * 1_000:.1f} ms")
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 10_000)
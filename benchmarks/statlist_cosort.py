@@ -0,0 +1,33 @@
+"""
+Times StatList.cosort, which finds the order once with a stable argsort, against sorting the pairs with sorted(zip()) and building new StatLists from them.
+Run from the repository root: python -m benchmarks.statlist_cosort [n]
+"""
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from washmath import Precision, StatList
+
+
+def main(n:int=1_000_000):
+	rng = Random(0)
+	keys = [rng.randrange(n // 10 + 1) for _ in range(n)]
+	dependent = [round(rng.uniform(0, 1_000), 2) for _ in range(n)]
+	for precision in (Precision.FLOAT, Precision.EXACT):
+		x, y = StatList(keys, precision=precision), StatList(dependent, precision=precision)
+		x.calculate_attributes()
+
+		begin = perf_counter()
+		pairs = sorted(zip(x, y), key=lambda pair: pair[0])
+		sorted_x, sorted_y = StatList([key for key, _ in pairs], precision=precision), StatList([value for _, value in pairs], precision=precision)
+		sorted_x.mean, sorted_x.variance
+		print(f"{precision}: sorted pairs and new StatLists: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+		begin = perf_counter()
+		sorted_x, sorted_y = StatList.cosort(x, y)
+		sorted_x.mean, sorted_x.variance
+		print(f"{precision}: StatList.cosort: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 1_000_000)
@@ -0,0 +1,70 @@
+"""
+Times StatList.fromCsv on a generated csv file of three columns, 1 GB by default, parsing the whole file with numpy in chunks.
+The line by line parser it replaced, and the conversion to exact Fractions, are timed on the first 10 MB.
+Run from the repository root: python -m benchmarks.statlist_csv [megabytes]
+"""
+from os import remove
+from sys import argv
+from tempfile import mkstemp
+from time import perf_counter
+
+import numpy as np
+
+from washmath import Precision, StatList
+from washmath.stats.csv_reader import read_columns
+
+
+def write_csv(path:str, megabytes:int) -> None:
+	"""Writes a header and then repeats one block of random rows until the file is the given size"""
+	rng = np.random.default_rng(0)
+	rows = rng.integers(0, 1_000_000, size=(100_000, 3)) / 1_000
+	block = "".join(f"{a:.3f},{b:.3f},{c:.3f}\n" for a, b, c in rows.tolist()).encode()
+	with open(path, "wb") as file:
+		file.write(b"a,b,c\n")
+		for _ in range(max(megabytes * (1 << 20) // len(block), 1)):
+			file.write(block)
+
+
+def read_lines(path:str) -> list:
+	"""The parser fromCsv used before, which read every line into Python strings"""
+	data = open(path).readlines()
+	hold = [[] for _ in range(len(data[0].split(",")))]
+	for line in data[1:]:
+		for i, cell in enumerate(line.split(",")):
+			hold[i].append(float(cell.strip()))
+	return hold
+
+
+def main(megabytes:int=1024):
+	_, path = mkstemp(suffix=".csv")
+	_, small = mkstemp(suffix=".csv")
+	try:
+		write_csv(path, megabytes)
+		write_csv(small, 10)
+
+		begin = perf_counter()
+		read_columns(path)
+		print(f"read_columns, {megabytes} MB: {perf_counter() - begin:.2f} s")
+
+		begin = perf_counter()
+		columns = StatList.fromCsv(path, columns=["a"], precision=Precision.FLOAT)
+		print(f"fromCsv, {megabytes} MB, one float column of {len(columns[0]):,} values: {perf_counter() - begin:.2f} s")
+
+		begin = perf_counter()
+		read_lines(small)
+		print(f"line by line parser, 10 MB: {perf_counter() - begin:.2f} s")
+
+		begin = perf_counter()
+		StatList.fromCsv(small, precision=Precision.FLOAT)
+		print(f"fromCsv, 10 MB, float columns: {perf_counter() - begin:.2f} s")
+
+		begin = perf_counter()
+		StatList.fromCsv(small)
+		print(f"fromCsv, 10 MB, exact columns: {perf_counter() - begin:.2f} s")
+	finally:
+		remove(path)
+		remove(small)
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 1024)
@@ -0,0 +1,43 @@
+"""
+Times (x - mean) ** 2 / n evaluated as one StatList.lazy chain against building a StatList for every step, and the statistics of 3 * x + 2
+carried over from x against calculating them again.
+Run from the repository root: python -m benchmarks.statlist_lazy [n]
+"""
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from washmath import Precision, StatList
+
+
+def main(n:int=100_000):
+	rng = Random(0)
+	values = [round(rng.uniform(0, 1_000), 2) for _ in range(n)]
+	for precision in (Precision.FLOAT, Precision.EXACT):
+		statlist = StatList(values, precision=precision)
+		mean = statlist.mean
+
+		begin = perf_counter()
+		step = StatList([value - mean for value in statlist], precision=precision)
+		step = StatList([value ** 2 for value in step], precision=precision)
+		StatList([value / n for value in step], precision=precision).sum
+		print(f"{precision}: (x - mean) ** 2 / n with a StatList per step: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+		begin = perf_counter()
+		((statlist.lazy() - mean) ** 2 / n).evaluate().sum
+		print(f"{precision}: (x - mean) ** 2 / n as one lazy chain: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+		statlist.calculate_attributes()
+		begin = perf_counter()
+		scaled = StatList([3 * value + 2 for value in statlist], precision=precision)
+		scaled.mean, scaled.variance, scaled.median, scaled.Q1, scaled.Q3, scaled.standard_deviation
+		print(f"{precision}: statistics of 3 * x + 2, calculated again: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+		begin = perf_counter()
+		scaled = (statlist.lazy() * 3 + 2).evaluate()
+		scaled.mean, scaled.variance, scaled.median, scaled.Q1, scaled.Q3, scaled.standard_deviation
+		print(f"{precision}: statistics of 3 * x + 2, carried over from x: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 100_000)
@@ -0,0 +1,48 @@
+"""
+Times the mode of a StatList on a multimodal data set with a few distinct values and on a data set where almost every value is distinct,
+against counting each distinct value with list.count, which is quadratic when the values are mostly distinct.
+Run from the repository root: python -m benchmarks.statlist_mode [n]
+"""
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from washmath import Precision, StatList
+
+
+def count_each(values:list):
+	"""The mode found by calling list.count once per distinct value"""
+	mode, times = None, 0
+	for value in set(values):
+		count = values.count(value)
+		if count > times:
+			mode, times = value, count
+	return mode
+
+
+def main(n:int=100_000):
+	rng = Random(0)
+	datasets = {
+		"multimodal": [rng.choice((1, 2, 3, 4, 5)) for _ in range(n)],
+		"large cardinality": [rng.randrange(n * 100) / 100 for _ in range(n)],
+	}
+	for name, values in datasets.items():
+		for precision in (Precision.EXACT, Precision.FLOAT):
+			statlist = StatList(values, precision=precision)
+			begin = perf_counter()
+			statlist.modes()
+			statlist.mode
+			print(f"{name}, {precision}: mode and modes of {n:,} values: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+		small = values[:n // 20]  # list.count is too slow to time on the whole large cardinality set
+		begin = perf_counter()
+		count_each(small)
+		print(f"{name}: list.count for each distinct value of {len(small):,} values: {(perf_counter() - begin) * 1_000:.1f} ms")
+		statlist = StatList(small)
+		begin = perf_counter()
+		statlist.mode
+		print(f"{name}: StatList.mode of the same {len(small):,} values: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 100_000)
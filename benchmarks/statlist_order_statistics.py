@@ -0,0 +1,39 @@
+"""
+Times the median and quartiles of a StatList found by selection, the order statistics read from one shared sort, and quantiles for many percentiles.
+Run from the repository root: python -m benchmarks.statlist_order_statistics [n]
+"""
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from washmath import Precision, StatList
+
+
+def main(n:int=100_000):
+	rng = Random(0)
+	values = [round(rng.uniform(0, 1_000), 2) for _ in range(n)]
+	for precision in (Precision.EXACT, Precision.FLOAT):
+		statlist = StatList(values, precision=precision)
+		begin = perf_counter()
+		statlist.median, statlist.Q1, statlist.Q3
+		print(f"{precision}: median, Q1, Q3 of {n:,} values by selection: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+		statlist = StatList(values, precision=precision)
+		begin = perf_counter()
+		statlist.sorted_view()
+		statlist.median, statlist.Q1, statlist.Q3
+		print(f"{precision}: median, Q1, Q3 of {n:,} values after sorting: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+	statlist = StatList(values)
+	statlist.sorted_view()
+	begin = perf_counter()
+	statlist.min, statlist.max, statlist.median, statlist.Q1, statlist.Q3
+	print(f"min, max, median, Q1, Q3 of {n:,} values from the sorted view: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+	begin = perf_counter()
+	statlist.quantiles([percentile / 100 for percentile in range(101)])
+	print(f"quantiles for 101 percentiles, after the sort: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 100_000)
@@ -0,0 +1,37 @@
+"""
+Times StatList.rolling and StatList.ewm against building a StatList for every window.
+Run from the repository root: python -m benchmarks.statlist_rolling [n]
+"""
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from washmath import Precision, StatList
+
+
+def main(n:int=50_000, window:int=500):
+	rng = Random(0)
+	values = [round(rng.uniform(0, 1_000), 2) for _ in range(n)]
+	for precision in (Precision.FLOAT, Precision.EXACT, Precision.bounded(10 ** 6)):
+		statlist = StatList(values, precision=precision)
+		rolling = statlist.rolling(window)
+		for name in ("mean", "var", "min", "max", "median"):
+			begin = perf_counter()
+			getattr(rolling, name)()
+			print(f"{precision}: rolling({window}).{name}() of {n:,} values: {(perf_counter() - begin) * 1_000:.1f} ms")
+		if precision == Precision.EXACT:
+			continue  # The exact denominators grow with every value, so ewm is only timed with the bounded precision
+		begin = perf_counter()
+		statlist.ewm(span=window).var()
+		print(f"{precision}: ewm(span={window}).var(): {(perf_counter() - begin) * 1_000:.1f} ms")
+
+	windows = n // 100
+	begin = perf_counter()
+	for start in range(windows):
+		window_list = StatList(values[start:start + window], precision=Precision.FLOAT)
+		window_list.mean, window_list.variance, window_list.min, window_list.max, window_list.median
+	print(f"A float StatList per window, first {windows:,} windows only: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 50_000)
@@ -0,0 +1,44 @@
+"""
+Compares pickling a StatList with its binary format.
+Run from the repository root: python -m benchmarks.statlist_serialization [n]
+"""
+from os import remove
+from pickle import dumps, loads
+from random import Random
+from sys import argv
+from tempfile import mkstemp
+from time import perf_counter
+
+from washmath import StatList
+
+
+def timed(function, *args):
+	begin = perf_counter()
+	result = function(*args)
+	return result, (perf_counter() - begin) * 1_000
+
+
+def main(n:int=5_000):
+	rng = Random(0)
+	statlist = StatList([round(rng.uniform(0, 1_000), 2) for _ in range(n)], title="readings")
+
+	pickled, dump_time = timed(dumps, (list(statlist), statlist.__dict__))  # What pickle stored before StatList.__reduce__
+	_, load_time = timed(loads, pickled)
+	print(f"pickle: {len(pickled):,} bytes, dump {dump_time:.1f} ms, load {load_time:.1f} ms")
+
+	for summary, compact in ((True, False), (True, True), (False, False)):
+		data, dump_time = timed(statlist.to_bytes, summary, compact)
+		_, load_time = timed(StatList.from_bytes, data)
+		print(f"to_bytes(summary={summary}, compact={compact}): {len(data):,} bytes, dump {dump_time:.1f} ms, load {load_time:.1f} ms")
+
+	_, path = mkstemp(suffix=".wmsl")
+	try:
+		statlist.save(path)
+		_, load_time = timed(StatList.load, path, True)
+		print(f"load(mmap=True): {load_time:.1f} ms")
+	finally:
+		remove(path)
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 5_000)
@@ -0,0 +1,32 @@
+"""
+Times a StatList used as a live accumulator: append one reading, then read the running statistics, for every reading.
+Run from the repository root: python -m benchmarks.statlist_streaming [n]
+"""
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from washmath import Precision, StatList
+
+
+def stream(values, **kwargs) -> float:
+	statlist = StatList(**kwargs)
+	begin = perf_counter()
+	for value in values:
+		statlist.append(value)
+		statlist.mean, statlist.variance if len(statlist) > 1 else None, statlist.min, statlist.max
+	return perf_counter() - begin
+
+
+def main(n:int=20_000):
+	rng = Random(0)
+	values = [round(rng.uniform(0, 100), 2) for _ in range(n)]
+	for name, kwargs in (("exact", {}), ("float", {"precision": Precision.FLOAT})):
+		for incremental in (True, False):
+			count = n if incremental else n // 20  # Recalculating on every read is quadratic
+			elapsed = stream(values[:count], incremental=incremental, **kwargs)
+			print(f"{name}, incremental={incremental}: {count:,} appends in {elapsed * 1_000:.1f} ms ({elapsed / count * 1e6:.1f} µs each)")
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 20_000)
@@ -0,0 +1,32 @@
+"""
+Times the statistics of data aggregated into (value, count) pairs with a WeightedStatList against expanding it into a StatList with every value repeated.
+Run from the repository root: python -m benchmarks.weighted_statlist [distinct values]
+"""
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from washmath import Precision, StatList
+from washmath.stats import WeightedStatList
+
+
+def read(statlist) -> None:
+	statlist.mean, statlist.variance, statlist.standard_error, statlist.median, statlist.Q1, statlist.Q3, statlist.mode
+
+
+def main(distinct:int=1_000):
+	rng = Random(0)
+	counts = {round(rng.uniform(0, 1_000), 2): rng.randrange(1, 400) for _ in range(distinct)}
+	expanded = [value for value, count in counts.items() for _ in range(count)]
+	for precision in (Precision.FLOAT, Precision.EXACT):
+		begin = perf_counter()
+		read(WeightedStatList.from_counts(counts, precision=precision))
+		print(f"{precision}: WeightedStatList of {len(counts):,} pairs: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+		begin = perf_counter()
+		read(StatList(expanded, precision=precision))
+		print(f"{precision}: StatList of the {len(expanded):,} expanded values: {(perf_counter() - begin) * 1_000:.1f} ms")
+
+
+if __name__ == "__main__":
+	main(int(argv[1]) if len(argv) > 1 else 1_000)
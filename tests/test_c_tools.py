@@ -0,0 +1,14 @@
+from unittest import TestCase
+from washmath.c_tools import gcd, P
+
+
+class TestCTools(TestCase):
+	def test_gcd(self):
+		self.assertEqual(gcd(12, 18), 6)
+		self.assertEqual(gcd(2 ** 70, 2 ** 66), 2 ** 66)
+		self.assertEqual(gcd(3 ** 50, 3 ** 45 * 2), 3 ** 45)
+
+	def test_P(self):
+		self.assertEqual(P(10, 3), 604_800)
+		self.assertEqual(P(25, 13), 2_490_952_020_480_000)
+		self.assertEqual(P(30, 2), 132_626_429_906_095_529_318_154_240_000_000)
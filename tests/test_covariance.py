@@ -0,0 +1,36 @@
+from unittest import TestCase
+import numpy as np
+from washmath import Fraction, Precision, StatList
+from washmath.stats import R, correlation_matrix, covariance_matrix
+
+
+class TestCovarianceMatrix(TestCase):
+	def setUp(self):
+		self.statlists = [
+			StatList([3, Fraction(1, 2), 4, 1, 5.5, 9]),
+			StatList([2, 7, Fraction(1, 3), 8, 2, 8]),
+			StatList([1, 4, 1, 5, 9, 2]),
+		]
+
+	def test_exact(self):
+		covariances = covariance_matrix(*self.statlists)
+		for i, x in enumerate(self.statlists):
+			for j, y in enumerate(self.statlists):
+				self.assertEqual(covariances[i][j], x.covariance(y))
+		self.assertEqual(covariance_matrix(*self.statlists, chunk_size=4), covariances)
+		self.assertEqual(covariance_matrix(*self.statlists, sample=True)[2][2], self.statlists[2].variance)
+		correlations = correlation_matrix(*self.statlists)
+		self.assertEqual(correlations[1][1], 1)
+		self.assertAlmostEqual(float(correlations[0][1]), float(R(self.statlists[0], self.statlists[1]).r), places=12)
+
+	def test_float(self):
+		rows = np.array([[float(value) for value in statlist] for statlist in self.statlists])
+		covariances = covariance_matrix(*self.statlists, precision=Precision.FLOAT, chunk_size=4)
+		self.assertTrue(np.allclose(covariances, np.cov(rows, bias=True)))
+		self.assertTrue(np.allclose(correlation_matrix(*self.statlists, precision=Precision.FLOAT), np.corrcoef(rows)))
+
+	def test_errors(self):
+		with self.assertRaises(ValueError):
+			covariance_matrix([1, 2], [1, 2, 3])
+		with self.assertRaises(ValueError):
+			correlation_matrix([1, 1, 1], [1, 2, 3])
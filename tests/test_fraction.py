@@ -1,5 +1,6 @@
+from threading import Thread
 from unittest import TestCase
-from washmath import Fraction
+from washmath import Fraction, FractionAccumulator, fsum_exact, sort_exact
 
 
 class TestFraction(TestCase):
@@ -80,3 +81,162 @@ class TestFraction(TestCase):
 
 		self.assertEqual(frac3.numerator, 1)
 		self.assertEqual(frac3.denominator, 2)
+
+	def test_integer_storage(self):
+		for fraction in (
+			Fraction(3.08, 4),
+			Fraction(0.5, 0.25),
+			Fraction(Fraction(1, 3), 0.5),
+			Fraction(1, 3) ** 0.5,
+		):
+			self.assertIsInstance(fraction.numerator, int)
+			self.assertIsInstance(fraction.denominator, int)
+
+		self.assertEqual(Fraction(3.08, 4), Fraction(77, 100))
+		self.assertFalse(hasattr(Fraction(1, 2), "__dict__"))
+
+	def test_sign(self):
+		frac = Fraction(1, -2)
+		self.assertEqual(frac.numerator, -1)
+		self.assertEqual(frac.denominator, 2)
+		self.assertEqual(-frac, Fraction(1, 2))
+
+	def test_reflected_operators(self):
+		self.assertEqual(1 + Fraction(1, 2), Fraction(3, 2))
+		self.assertEqual(1 - Fraction(1, 4), Fraction(3, 4))
+		self.assertEqual(3 * Fraction(1, 6), Fraction(1, 2))
+		self.assertEqual(1 / Fraction(2, 3), Fraction(3, 2))
+
+	def test_from_float(self):
+		self.assertEqual(Fraction.from_float(0.1 + 0.2), Fraction(30_000_000_000_000_004, 10 ** 17))
+		self.assertEqual(Fraction.from_float(0.1 + 0.2, max_denominator=1_000), Fraction(3, 10))
+		self.assertEqual(Fraction.from_float(0.1, exact=True).denominator, 2 ** 55)
+		self.assertEqual(Fraction.from_float(3.14159, max_denominator=100), Fraction(311, 99))
+		self.assertEqual(Fraction.from_float(-0.7, max_denominator=2), Fraction(-1, 2))
+		self.assertRaises(ValueError, Fraction.from_float, float("nan"))
+
+	def test_deferred_reduction(self):
+		with Fraction.deferred_reduction():
+			total = Fraction(1, 6) + Fraction(1, 3)
+			self.assertEqual(total._denominator, 6)
+			self.assertEqual(total, Fraction(1, 2))
+			self.assertEqual((total.numerator, total.denominator, repr(total), hash(total)), (1, 2, repr(Fraction(1, 2)), hash(0.5)))
+			self.assertEqual(total._denominator, 6)  # Comparing and reading a value never changes it
+
+			total = sum([Fraction(1, 4)] * 4, start=Fraction(0))
+		self.assertEqual(total.numerator, 1)
+		self.assertEqual(total.denominator, 1)
+		self.assertEqual(hash(Fraction(2, 4, auto_reduce=False) * 2), hash(Fraction(1)))
+
+		results = []
+		with Fraction.deferred_reduction():
+			thread = Thread(target=lambda: results.append(Fraction(2, 4)._denominator))
+			thread.start()
+			thread.join()
+			large = Fraction(3 * 2 ** 300, 3) + Fraction(0)
+		self.assertEqual(results, [2])  # Reduced, since the block is only open in the main thread
+		self.assertEqual(large._denominator, 1)
+
+	def test_auto_reduce_propagation(self):
+		lazy = Fraction(2, 4, auto_reduce=False)
+		result = lazy * Fraction(2, 3)
+		self.assertFalse(result.auto_reduce)
+		self.assertEqual(result.numerator, 4)
+		self.assertEqual(result.denominator, 12)
+		self.assertEqual(str(result), "1/3 (0.3333333333333333)")
+
+	def test_fsum_exact(self):
+		values = [Fraction(1, 3), Fraction(1, 6), 2, 0.25, Fraction(-5, 12), Fraction(1, 6)]
+		self.assertEqual(fsum_exact(values), sum(values, start=Fraction(0)))
+		self.assertEqual(fsum_exact(range(10)), Fraction(45))
+		self.assertEqual(fsum_exact([]), Fraction(0))
+
+		accumulator = FractionAccumulator([Fraction(1, 2)])
+		accumulator += Fraction(1, 3)
+		accumulator.add(1)
+		self.assertEqual(accumulator.total, Fraction(11, 6))
+
+	def test_comparisons(self):
+		self.assertTrue(Fraction(1, 3) < Fraction(1, 2))
+		self.assertTrue(Fraction(1, 3) <= Fraction(2, 6))
+		self.assertTrue(Fraction(3, 2) > 1)
+		self.assertFalse(Fraction(3, 2) == 1)
+		self.assertFalse(Fraction(1, 10) == 0.1)
+		self.assertTrue(Fraction.from_float(0.1, exact=True) == 0.1)
+		self.assertTrue(Fraction(1, 10) < 0.1)  # 0.1 is slightly more than 1/10 in binary
+		self.assertTrue(Fraction(1, 3) < 0.34)
+		self.assertFalse(Fraction(1, 2) < float("nan"))
+		self.assertTrue(Fraction(1, 2) != float("nan"))
+		self.assertNotEqual(Fraction(1, 10) - 0.1, 0)  # Arithmetic uses the same exact value as the comparison
+		self.assertEqual(Fraction(1, 2) - 0.5, 0)
+
+		big = 10 ** 30
+		self.assertTrue(Fraction(big + 1, big) > Fraction(big, big - 1) - Fraction(1, big))
+		self.assertTrue(Fraction(big + 1, big) < Fraction(big + 2, big))
+
+	def test_hash(self):
+		self.assertEqual(hash(Fraction(2)), hash(2))
+		self.assertEqual(hash(Fraction(1, 2)), hash(0.5))
+		self.assertEqual(len({Fraction(1, 2), Fraction(2, 4), 0.5}), 1)
+		self.assertEqual(len({Fraction(1, 10), 0.1}), 2)
+		self.assertEqual(hash(Fraction.from_float(0.1, exact=True)), hash(0.1))
+
+	def test_sort_exact(self):
+		big = 10 ** 20
+		values = [Fraction(big + 2, big), Fraction(big + 1, big), Fraction(1, 2), 1, Fraction(big + 3, big), 0.25]
+		sort_exact(values)
+		self.assertEqual(values, [0.25, Fraction(1, 2), 1, Fraction(big + 1, big), Fraction(big + 2, big), Fraction(big + 3, big)])
+
+		sort_exact(values, reverse=True)
+		self.assertEqual(values, [Fraction(big + 3, big), Fraction(big + 2, big), Fraction(big + 1, big), 1, Fraction(1, 2), 0.25])
+
+	def test_large_values(self):
+		big = 2 ** 4_000
+		frac = Fraction(big * 3, big * 9)
+		self.assertEqual(frac.numerator, 1)
+		self.assertEqual(frac.denominator, 3)
+		self.assertIsInstance(frac.numerator, int)
+
+		frac = Fraction(2 ** 70 + 1, 2 ** 64) * Fraction(2 ** 64, 3)
+		self.assertEqual(frac, Fraction(2 ** 70 + 1, 3))
+
+	def test_interning(self):
+		self.assertIs(Fraction(1), Fraction(1))
+		self.assertIs(Fraction(-3, 4), Fraction.from_float(-0.75))
+		self.assertIs(Fraction(2.5), Fraction(5, 2))
+		self.assertIsNot(Fraction(1, auto_reduce=False), Fraction(1))
+		self.assertIsNot(Fraction(10 ** 6), Fraction(10 ** 6))
+
+		shared = Fraction(1, 2)
+		alias = shared
+		shared += 1
+		self.assertEqual(alias, Fraction(1, 2))
+		self.assertEqual(shared, Fraction(3, 2))
+		self.assertIs(Fraction(2, 4), alias)
+		self.assertIs(Fraction(-6, -2), Fraction(3))
+		with self.assertRaises(AttributeError):
+			alias.numerator = 3
+		with self.assertRaises(AttributeError):
+			Fraction(10 ** 6, 7).numerator = 3  # Read only whether or not the value is shared
+		with self.assertRaises(AttributeError):
+			alias.auto_reduce = False
+		with self.assertRaises(AttributeError):
+			Fraction(10 ** 6, 7).auto_reduce = False
+		self.assertIs(type(alias), Fraction)
+		self.assertIsNot(alias.copy(), alias)
+		self.assertEqual(Fraction(1, 2), 0.5)
+
+	def test_pickle(self):
+		from pickle import dumps, loads
+		self.assertIs(loads(dumps(Fraction(2))), Fraction(2))
+		frac = loads(dumps(Fraction(0, 18, persistent_denominator=True)))
+		self.assertEqual(frac.denominator, 18)
+
+	def test_limit_denominator(self):
+		frac = Fraction(355000001, 113000000)
+		self.assertEqual(frac.limit_denominator(1_000), Fraction(355, 113))
+		self.assertEqual(Fraction(-31415926, 10 ** 7).limit_denominator(100), Fraction(-311, 99))
+		frac = Fraction(1, 3)
+		self.assertIs(frac.limit_denominator(10), frac)
+		with self.assertRaises(ValueError):
+			Fraction(1, 3).limit_denominator(0)
@@ -0,0 +1,56 @@
+from unittest import TestCase
+from washmath import Fraction, FractionArray
+
+
+class TestFractionArray(TestCase):
+	def test_initialization(self):
+		array = FractionArray([1, 0.5, Fraction(2, 6)])
+		self.assertEqual(array.tolist(), [Fraction(1), Fraction(1, 2), Fraction(1, 3)])
+
+		array = FractionArray([2, 3], [-4, 9])
+		self.assertEqual(list(array.numerators), [-1, 1])
+		self.assertEqual(list(array.denominators), [2, 3])
+
+		self.assertRaises(ZeroDivisionError, FractionArray, [1], [0])
+
+	def test_arithmetic(self):
+		a = FractionArray([Fraction(1, 2), Fraction(1, 3)])
+		b = FractionArray([Fraction(1, 4), Fraction(2, 3)])
+
+		self.assertEqual((a + b).tolist(), [Fraction(3, 4), Fraction(1)])
+		self.assertEqual((a - b).tolist(), [Fraction(1, 4), Fraction(-1, 3)])
+		self.assertEqual((a * b).tolist(), [Fraction(1, 8), Fraction(2, 9)])
+		self.assertEqual((a / b).tolist(), [Fraction(2), Fraction(1, 2)])
+		self.assertEqual((1 - a).tolist(), [Fraction(1, 2), Fraction(2, 3)])
+		self.assertEqual(list(a < b), [False, True])
+		self.assertEqual(list(a == Fraction(1, 2)), [True, False])
+
+	def test_overflow(self):
+		big = 2 ** 62 + 1
+		array = FractionArray([Fraction(1, big), Fraction(1, big - 2)])
+		self.assertEqual(array.dtype, "int64")
+
+		total = array.sum()
+		self.assertEqual(total, Fraction(1, big) + Fraction(1, big - 2))
+
+		squares = array * array
+		self.assertEqual(squares.dtype, object)
+		self.assertEqual(squares[0], Fraction(1, big * big))
+
+		coprime = FractionArray([Fraction(1, 3 * 2 ** 61), Fraction(1, 2 ** 62)])  # The common denominator passes int64
+		self.assertEqual(coprime.sum(), Fraction(1, 3 * 2 ** 61) + Fraction(1, 2 ** 62))
+
+	def test_reductions(self):
+		array = FractionArray([Fraction(1, n) for n in range(1, 20)])
+		expected = Fraction(0)
+		for n in range(1, 20):
+			expected += Fraction(1, n)
+		self.assertEqual(array.sum(), expected)
+		self.assertEqual(array.dot(array), sum((Fraction(1, n * n) for n in range(1, 20)), start=Fraction(0)))
+		self.assertEqual(FractionArray().sum(), 0)
+
+		primes = [n for n in range(2, 600) if all(n % factor for factor in range(2, int(n ** 0.5) + 1))]
+		expected = Fraction(0)
+		for prime in primes:
+			expected += Fraction(1, prime)
+		self.assertEqual(FractionArray([Fraction(1, prime) for prime in primes]).sum(), expected)
@@ -0,0 +1,55 @@
+from threading import Thread
+from unittest import TestCase
+from washmath import Fraction, Polynomial, Precision, StatList, euler
+
+
+class TestPrecision(TestCase):
+	def test_apply(self):
+		self.assertEqual(Precision.EXACT.apply(0.1), 0.1)
+		self.assertEqual(Precision.bounded(10).apply(Fraction(314, 100)), Fraction(22, 7))
+		self.assertEqual(Precision.bounded(10).apply(0.3333), Fraction(1, 3))
+		self.assertIsInstance(Precision.FLOAT.apply(Fraction(1, 4)), float)
+		with self.assertRaises(ValueError):
+			Precision.bounded(0)
+
+	def test_default(self):
+		self.assertEqual(Precision.default(), Precision.EXACT)
+		with Precision.FLOAT:
+			self.assertEqual(Precision.default(), Precision.FLOAT)
+			with Precision.bounded(100):
+				self.assertEqual(Precision.default(), Precision.bounded(100))
+			self.assertEqual(Precision.default(), Precision.FLOAT)
+		self.assertEqual(Precision.default(), Precision.EXACT)
+
+		seen = []
+		with Precision.FLOAT:
+			thread = Thread(target=lambda: seen.append(Precision.default()))
+			thread.start()
+			thread.join()
+		self.assertEqual(seen, [Precision.EXACT])  # The block only applies to its own thread
+
+	def test_euler(self):
+		function = lambda x, y: y - x
+		exact = euler(0.1, 0, 2, function, n=30)
+		bounded = euler(0.1, 0, 2, function, n=30, precision=Precision.bounded(10 ** 6))
+		approximate = euler(0.1, 0, 2, function, n=30, precision=Precision.FLOAT)
+		self.assertIsInstance(exact, Fraction)
+		self.assertLessEqual(bounded.denominator, 10 ** 6)
+		self.assertIsInstance(approximate, float)
+		self.assertAlmostEqual(float(bounded), float(exact), places=5)
+		self.assertAlmostEqual(approximate, float(exact), places=9)
+
+	def test_polynomial(self):
+		polynomial = Polynomial({1: Fraction(1, 3), 0: Fraction(2, 7)}, precision=Precision.bounded(1_000))
+		self.assertTrue(all(coefficient.denominator <= 1_000 for coefficient in (polynomial ** 5)._dict.values()))
+		self.assertIsInstance((polynomial * Polynomial({1: 1}, precision=Precision.FLOAT))._dict[2], Fraction)
+
+	def test_statlist(self):
+		data = StatList([0.1, 0.2, 1 / 3, 2], precision=Precision.FLOAT)
+		self.assertIsInstance(data[0], float)
+		self.assertIsInstance(data.variance, float)
+		self.assertEqual(StatList([1 / 3, 2], max_denominator=10)[0], Fraction(1, 3))
+		for result in (data + [3], data - 2, data * data, data / data, data // 2, data % 2, data ** 2, data ** data):
+			self.assertEqual((result.precision, result.allow_fractions), (Precision.FLOAT, data.allow_fractions))
+		bounded = StatList([1 / 3, 2], precision=Precision.bounded(10))
+		self.assertEqual((bounded ** 2).precision, bounded.precision)
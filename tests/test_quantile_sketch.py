@@ -0,0 +1,27 @@
+import numpy as np
+from unittest import TestCase
+from washmath import StatList
+from washmath.stats import QuantileSketch
+
+
+class TestQuantileSketch(TestCase):
+	def test_small_stream_is_exact(self):
+		values = [3, 1, 4, 1, 5, 9, 2, 6]
+		sketch, statlist = QuantileSketch(values), StatList(values)
+		self.assertEqual(sketch.median, statlist.median)
+		self.assertEqual(sketch.quantiles([0, 0.1, 1]), [1, 1, 9])
+		self.assertEqual((len(sketch), sketch.sum, sketch.min, sketch.max), (8, 31, 1, 9))
+		self.assertAlmostEqual(sketch.variance, float(statlist.variance))
+		with self.assertRaises(ValueError):
+			QuantileSketch().median
+
+	def test_accuracy_and_merge(self):
+		values = np.random.default_rng(0).normal(size=200_000)
+		ordered = np.sort(values)
+		sketch = QuantileSketch(values[:100_000], compression=100)
+		sketch.merge(QuantileSketch(iter(values[100_000:].tolist())))
+		self.assertEqual(len(sketch), len(values))
+		self.assertLessEqual(sketch.centroids, 100)
+		probabilities = [0.01, 0.25, 0.5, 0.75, 0.95, 0.99]
+		for probability, estimate in zip(probabilities, sketch.quantiles(probabilities)):
+			self.assertLess(abs(np.searchsorted(ordered, estimate) / len(values) - probability), 0.002, probability)
@@ -0,0 +1,63 @@
+from concurrent.futures import ProcessPoolExecutor
+from os import remove
+from tempfile import mkstemp
+from unittest import TestCase
+from washmath import Fraction, Precision, StatList
+from washmath.stats import StatSummary
+
+
+class TestStatSummary(TestCase):
+	values = [3, Fraction(1, 3), 2.5, 7, Fraction(22, 7), 0, 9, 2.5, Fraction(5, 4), 11]
+
+	def test_merge(self):
+		statlist = StatList(self.values)
+		left = StatSummary(self.values[:3])
+		left.merge(StatSummary(self.values[3:7]))
+		left.merge(StatSummary(self.values[7:]))
+		right = StatSummary(self.values[3:])
+		right.merge(StatSummary([]))
+		combined = StatSummary.combine([StatSummary(self.values[:3]), right])
+		for summary in (left, combined):
+			self.assertEqual((summary.count, summary.sum, summary.min, summary.max), (10, statlist.sum, 0, 11))
+			self.assertEqual(summary.variance, statlist.variance)
+		self.assertEqual(len(right), 7)
+
+	def test_merge_float(self):
+		for first, second in ((True, False), (False, True)):
+			merged = StatSummary(self.values[:4], exact=first)
+			other = StatSummary(self.values[4:], exact=second)
+			merged.merge(other)
+			self.assertFalse(merged.exact)
+			for name in ("sum", "mean", "m2"):
+				self.assertIsInstance(getattr(merged, name), float, name)
+			self.assertAlmostEqual(merged.variance, float(StatList(self.values).variance))
+			self.assertIsInstance(other.mean, Fraction if second else float)
+		empty = StatSummary(exact=False)
+		empty.merge(StatSummary(self.values))
+		self.assertIsInstance(empty.sum, float)
+
+	def test_bytes(self):
+		summary = StatSummary(self.values, sketch=True)
+		loaded = StatSummary.from_bytes(summary.to_bytes())
+		self.assertEqual((loaded.count, loaded.mean, loaded.m2, loaded.max), (summary.count, summary.mean, summary.m2, summary.max))
+		self.assertEqual(loaded.quantiles([0.5]), summary.quantiles([0.5]))
+		_, path = mkstemp(suffix=".wmss")
+		try:
+			summary.save(path)
+			self.assertEqual(StatSummary.load(path).variance, summary.variance)
+		finally:
+			remove(path)
+		with self.assertRaises(ValueError):
+			StatSummary.from_bytes(b"not a summary")
+
+	def test_from_chunks(self):
+		chunks = [self.values[:4], self.values[4:], []]
+		with ProcessPoolExecutor(2) as executor:
+			statlist = StatList.from_chunks(chunks, executor=executor, title="shards")
+		expected = StatList(self.values)
+		self.assertEqual(statlist, expected)
+		self.assertEqual(statlist.title, "shards")
+		for name in ("sum", "mean", "variance", "standard_deviation", "min", "max", "median"):
+			self.assertEqual(getattr(statlist, name), getattr(expected, name), name)
+		floats = StatList.from_chunks(chunks, precision=Precision.FLOAT)
+		self.assertAlmostEqual(floats.variance, float(expected.variance))
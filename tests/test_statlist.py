@@ -0,0 +1,230 @@
+from os import remove
+from pickle import dumps, loads
+from tempfile import mkstemp
+from unittest import TestCase
+import numpy as np
+from washmath import Fraction, Precision, StatList
+
+
+class TestStatList(TestCase):
+	def test_bytes(self):
+		statlist = StatList([1, 2.5, Fraction(1, 3), 7, 7, 2 ** 70], title="readings")
+		for data in (statlist.to_bytes(), statlist.to_bytes(compact=True), statlist.to_bytes(summary=False)):
+			loaded = StatList.from_bytes(data)
+			self.assertEqual(loaded, statlist)
+			self.assertEqual(loaded.title, "readings")
+			self.assertEqual(loaded.mean, statlist.mean)
+			self.assertEqual(loaded.variance, statlist.variance)
+			self.assertEqual(loaded.outliers, statlist.outliers)
+		with self.assertRaises(ValueError):
+			StatList.from_bytes(b"not a statlist" * 3)
+
+		floats = StatList([1.5, 2.25, 3.0], precision=Precision.FLOAT)
+		loaded = loads(dumps(floats))
+		self.assertEqual(loaded, floats)
+		self.assertEqual(loaded.precision, Precision.FLOAT)
+
+		for values in ([], [5], [5, Fraction(1, 2)]):
+			loaded = StatList.from_bytes(StatList(values).to_bytes())
+			self.assertEqual(list(loaded), values)
+			if len(values) == 1:
+				self.assertEqual(loaded.median, 5)
+				with self.assertRaises(IndexError):
+					loaded.Q1
+			if len(values) == 2:
+				self.assertEqual(loaded.variance, StatList(values).variance)
+
+	def test_save_load(self):
+		statlist = StatList([0.1, 0.2, 0.3, 0.4], title="t")
+		_, path = mkstemp()
+		try:
+			statlist.save(path)
+			self.assertEqual(StatList.load(path), statlist)
+			self.assertEqual(StatList.load(path, mmap=True).median, statlist.median)
+		finally:
+			remove(path)
+
+	def test_cached_statistics(self):
+		statlist = StatList(1, 2, 3, 4, 5)
+		self.assertEqual(statlist.mean, 3)
+		statlist.append(10)
+		self.assertEqual(statlist.mean, Fraction(25, 6))
+		self.assertEqual(statlist.max, 10)
+		self.assertEqual(statlist.pop(), 10)
+		self.assertEqual(statlist.max, 5)
+		statlist[0] = 11
+		self.assertEqual(statlist.sum, 25)
+		del statlist[0]
+		self.assertEqual(statlist.min, 2)
+		statlist.reverse()
+		self.assertEqual(statlist, [5, 4, 3, 2])
+
+	def test_quantiles(self):
+		statlist = StatList(3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5)
+		self.assertEqual(statlist.sorted_view(), (1, 1, 2, 3, 3, 4, 5, 5, 5, 6, 9))
+		self.assertEqual(statlist.quantiles([0, 0.25, 0.5, 0.9, 1]), [1, Fraction(5, 2), 4, 6, 9])  # Same as numpy.quantile
+		self.assertEqual((statlist.min, statlist.Q1, statlist.median, statlist.Q3, statlist.max), (1, 2, 4, 5, 9))
+		statlist.append(0)
+		self.assertEqual(statlist.sorted_view()[0], 0)
+		with self.assertRaises(ValueError):
+			statlist.quantiles([1.5])
+
+	def test_incremental(self):
+		values = [0.5, 3, Fraction(7, 3), 10, 2.25]
+		statlist = StatList(values[:2], incremental=True)
+		self.assertEqual(statlist.mean, Fraction(7, 4))
+		for value in values[2:4]:
+			statlist.append(value)
+		statlist.extend(values[4:])
+		expected = StatList(values)
+		for name in ("sum", "mean", "variance", "standard_deviation", "standard_error", "min", "max", "median"):
+			self.assertEqual(getattr(statlist, name), getattr(expected, name), name)
+
+		statlist.remove(10)
+		self.assertEqual(statlist.variance, StatList(0.5, 3, Fraction(7, 3), 2.25).variance)
+		self.assertEqual(statlist.max, 3)
+
+	def test_float_backend(self):
+		values = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 7.5]
+		exact = StatList(values)
+		floats = StatList(values, allow_fractions=False)
+		self.assertEqual(floats.precision, Precision.FLOAT)
+		for name in ("sum", "mean", "mode", "min", "max", "median", "Q1", "Q3", "variance", "standard_deviation", "standard_error", "average_deviation"):
+			self.assertIsInstance(getattr(floats, name), float, name)
+			self.assertAlmostEqual(getattr(floats, name), float(getattr(exact, name)), places=12, msg=name)
+		self.assertEqual(floats.outliers, (1.0, 1.0))
+		self.assertEqual(floats.quantiles([0.1, 0.5]), [1.1, 4.5])
+		self.assertTrue(exact == values)
+		self.assertTrue(StatList([0.1]) == [0.1])  # The float is read the way the list stores it
+		self.assertFalse(StatList([0.1]) == [0.2])
+
+		floats[0] = Fraction(21, 2)
+		self.assertEqual(floats.max, 10.5)
+		self.assertIsInstance(floats[0], float)
+		with self.assertRaises(ValueError):
+			StatList(values, allow_fractions=False, precision=Precision.EXACT)
+
+	def test_modes(self):
+		values = [4, 2, 2, 4, Fraction(1, 2), 0.5, 7]
+		for statlist in (StatList(values), StatList(values, precision=Precision.FLOAT)):
+			self.assertEqual(statlist.mode, 4)
+			self.assertEqual(statlist.modes(), [4, 2, 0.5])
+			self.assertEqual(statlist.most_common(2), [(4, 2), (2, 2)])
+			self.assertEqual(statlist.most_common()[-1], (7, 1))
+		self.assertEqual(StatList().modes(), [])
+		self.assertIsNone(StatList().mode)
+
+	def test_selection(self):
+		values = [5, Fraction(1, 3), 2.5, 1 / 3, 7, Fraction(1, 3), 9, 0, 2.5, Fraction(10, 4)]
+		for precision in (Precision.EXACT, Precision.FLOAT):
+			selected, ordered = StatList(values, precision=precision), StatList(values, precision=precision)
+			ordered.sorted_view()
+			for name in ("median", "Q1", "Q3", "min", "max", "IQR", "outlier_range"):
+				self.assertEqual(getattr(selected, name), getattr(ordered, name), name)
+			self.assertNotIn("_sorted", selected.__dict__)
+		self.assertEqual(StatList._getMedian(values), StatList(values).median)
+
+	def test_from_csv(self):
+		handle, path = mkstemp(suffix=".csv")
+		try:
+			with open(handle, "w") as file:
+				file.write("height,5,weight\n1.5,2,3\n2.5,4,6\n\n0.25,1,9\n")
+			height, unnamed, weight = StatList.fromCsv(path)
+			self.assertEqual((height.title, unnamed.title, weight.title), ("height", "", "weight"))
+			self.assertEqual(height, [Fraction(3, 2), Fraction(5, 2), Fraction(1, 4)])
+			self.assertEqual(unnamed, [5, 2, 4, 1])
+			weight, height = StatList.fromCsv(path, columns=["weight", 0], precision=Precision.FLOAT)
+			self.assertEqual((weight.title, weight.mean, height.max), ("weight", 6.0, 2.5))
+			with self.assertRaises(ValueError):
+				StatList.fromCsv(path, columns=["width"])
+		finally:
+			remove(path)
+
+	def test_rolling(self):
+		values = [3, Fraction(1, 2), 4, 1, 5.5, 9, 2, 6, 5, 3]
+		for precision in (Precision.EXACT, Precision.FLOAT):
+			statlist = StatList(values, precision=precision)
+			rolling = statlist.rolling(4)
+			windows = [StatList(values[i:i + 4], precision=precision) for i in range(len(values) - 3)]
+			for name, statistic in (("mean", "mean"), ("var", "variance"), ("min", "min"), ("max", "max"), ("median", "median")):
+				expected = [getattr(window, statistic) for window in windows]
+				if precision.is_float:
+					self.assertTrue(all(abs(a - b) < 1e-12 for a, b in zip(getattr(rolling, name)(), expected)), name)
+				else:
+					self.assertEqual(list(getattr(rolling, name)()), expected, name)
+		self.assertEqual(list(StatList([1, 2, 3, 4]).ewm(alpha=0.5).mean()), [1, Fraction(3, 2), Fraction(9, 4), Fraction(25, 8)])
+		self.assertEqual(StatList([1, 2], precision=Precision.FLOAT).ewm(span=3).var().tolist(), [0, 0.25])
+		with self.assertRaises(ValueError):
+			StatList(values).rolling(11)
+		trending = [1e9 + 10 * i + (i * 7919 % 13) / 10 for i in range(2_000)]
+		windows = np.lib.stride_tricks.sliding_window_view(np.array(trending), 20)
+		expected = windows.var(axis=1, ddof=1)
+		variances = StatList(trending, precision=Precision.FLOAT).rolling(20).var()
+		self.assertTrue(np.allclose(variances, expected, rtol=1e-9, atol=0))
+
+	def test_lazy(self):
+		values = [3, Fraction(1, 2), 4, 1, 5.5, 9, 2, 6, 5, 3]
+		statlist = StatList(values)
+		statlist.calculate_attributes()
+		scaled = (-2 * statlist.lazy() / 4 + 1).evaluate()
+		self.assertIn("_variance", scaled.__dict__)
+		expected = StatList([-Fraction(value) / 2 + 1 for value in values])
+		for name in ("sum", "mean", "mode", "min", "max", "median", "Q1", "Q3", "IQR", "variance", "average_deviation"):
+			self.assertEqual(getattr(scaled, name), getattr(expected, name), name)
+		squares = ((statlist.lazy() - statlist.mean) ** 2 / len(values)).evaluate()
+		self.assertNotIn("_variance", squares.__dict__)
+		self.assertEqual(squares.sum, statlist.variance * 9 / 10)
+		self.assertEqual(list(statlist.map(abs)), [abs(value) for value in statlist])
+		self.assertEqual((StatList([1.5, 3], precision=Precision.FLOAT) * 2).precision, Precision.FLOAT)
+		scaled = StatList([1, 2], title="t", incremental=True) / 2
+		self.assertEqual((scaled.title, scaled.incremental), ("t", True))
+
+	def test_cosort(self):
+		keys = StatList([3, Fraction(1, 2), 3, 2, 0.5])
+		keys.calculate_attributes()
+		x, y, z = StatList.cosort(keys, [1, 2, 3, 4, 5], StatList([10, 20, 30, 40, 50]))
+		self.assertEqual(list(x), [Fraction(1, 2), Fraction(1, 2), 2, 3, 3])
+		self.assertEqual(list(y), [2, 5, 4, 1, 3])
+		self.assertEqual(list(z), [20, 50, 40, 10, 30])
+		self.assertIn("_variance", x.__dict__)
+		self.assertEqual(x.variance, StatList(list(x)).variance)
+		x, y = StatList.cosort(StatList(keys, precision=Precision.FLOAT), [1, 2, 3, 4, 5], reverse=True)
+		self.assertEqual(list(y), [1, 3, 4, 2, 5])
+		self.assertEqual(StatList.sortMultipleLists(StatList([2, 1]), StatList([5, 6])), (StatList([1, 2]), StatList([6, 5])))
+		with self.assertRaises(ValueError):
+			StatList.cosort([1, 2], [1])
+		incremental = StatList([3, 1, 2], incremental=True)
+		incremental.append(5)
+		incremental.mean
+		ordered, = StatList.cosort(incremental)
+		ordered.append(0)
+		self.assertEqual((ordered.sum, ordered.mean), (11, Fraction(11, 5)))
+		self.assertEqual(incremental.sum, 11)
+
+	def test_reorder(self):
+		statlist = StatList([3.0, 1.0, 2.0], precision=Precision.FLOAT)
+		statlist.calculate_attributes()
+		statlist.sort()
+		self.assertEqual(list(statlist.rolling(1).max()), [1, 2, 3])
+		self.assertIn("_variance", statlist.__dict__)
+		statlist.reverse()
+		self.assertEqual(list(StatList.cosort(statlist, [1, 2, 3])[1]), [3, 2, 1])
+		statlist = StatList([1, 1, 2, 2])
+		self.assertEqual(statlist.mode, 1)
+		statlist.reverse()
+		self.assertEqual(statlist.mode, 2)
+		statlist.sort()
+		self.assertEqual((list(statlist), statlist.mode), ([1, 1, 2, 2], 1))
+
+	def test_bootstrap(self):
+		statlist = StatList([3, Fraction(1, 2), 4, 1, 5.5, 9, 2, 6, 5, 3, Fraction(7, 3)])
+		result = statlist.bootstrap("IQR", n_resamples=500, seed=1)
+		self.assertEqual(result.estimate, statlist.IQR)
+		self.assertIsInstance(result.low, Fraction)
+		self.assertLessEqual(result.low, result.high)
+		self.assertEqual(len(result.distribution), 500)
+		floats = StatList(statlist, precision=Precision.FLOAT).bootstrap("IQR", n_resamples=500, seed=1)
+		self.assertAlmostEqual(float(result.low), floats.low)
+		self.assertEqual(statlist.bootstrap("mean", n_resamples=300, seed=2).interval, statlist.bootstrap("mean", n_resamples=300, seed=2, workers=2).interval)
+		with self.assertRaises(ValueError):
+			statlist.bootstrap("mode")
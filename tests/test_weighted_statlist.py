@@ -0,0 +1,48 @@
+from pickle import dumps, loads
+from unittest import TestCase
+from washmath import Fraction, Precision, StatList
+from washmath.stats import WeightedStatList
+
+
+class TestWeightedStatList(TestCase):
+	def test_matches_expanded(self):
+		counts = {3: 2, Fraction(1, 2): 3, 4.25: 1, 9: 4}
+		expanded = [value for value, count in counts.items() for _ in range(count)]
+		for precision in (Precision.EXACT, Precision.FLOAT):
+			weighted, statlist = WeightedStatList.from_counts(counts, precision=precision), StatList(expanded, precision=precision)
+			self.assertEqual(weighted.total_weight, 10)
+			self.assertEqual(weighted.count(3), 1)
+			for name in ("sum", "mean", "mode", "min", "max", "median", "Q1", "Q3", "variance", "standard_error", "average_deviation"):
+				self.assertAlmostEqual(float(getattr(weighted, name)), float(getattr(statlist, name)), places=12, msg=name)
+			self.assertEqual(weighted.quantiles([0.1, 0.75]), statlist.quantiles([0.1, 0.75]))
+
+	def test_changes_keep_weights(self):
+		weighted = WeightedStatList([5, 1, 3], [1, 2, 3], title="t")
+		weighted.append(2, weight=4)
+		weighted.sort()
+		self.assertEqual((list(weighted), weighted.weights), ([1, 2, 3, 5], [2, 4, 3, 1]))
+		weighted.remove(3)
+		self.assertEqual((weighted.pop(), weighted.weights, weighted.mode), (5, [2, 4], 2))
+		loaded = loads(dumps(weighted))
+		self.assertEqual((loaded.weights, loaded.title), ([2, 4], "t"))
+		with self.assertRaises(ValueError):
+			WeightedStatList([1, 2], [1, 0])
+		weighted = WeightedStatList([1, 2, 3], [1, 1, 2])
+		self.assertEqual(((weighted * 2).mean, (weighted / 2).weights, (weighted ** 2).sum), (Fraction(9, 2), [1, 1, 2], 23))
+		with self.assertRaises(TypeError):
+			weighted + [4]
+		weighted = WeightedStatList([1, 2, 3, 100], [3, 3, 3, 5])
+		expanded = StatList([value for value, weight in zip(weighted, weighted.weights) for _ in range(int(weight))])
+		self.assertEqual(weighted.outlier_weight(), len(expanded.outliers))
+		self.assertIn(["Number of Outliers", len(expanded.outliers)], weighted.dataSummary(tab=False))
+		weighted = WeightedStatList([1.0, 2.0, 3.0], [1, 1, 10], allow_fractions=False)
+		weighted.median
+		weighted.sort(reverse=True)
+		self.assertEqual(weighted.sum, 33.0)
+		weighted.reverse()
+		self.assertEqual((weighted.sum, weighted.mean), (33.0, 2.75))
+
+	def test_importance_weights(self):
+		weighted = WeightedStatList([1, 2, 3], [Fraction(1, 2), Fraction(1, 4), Fraction(1, 4)], frequency=False)
+		self.assertEqual(weighted.mean, Fraction(7, 4))
+		self.assertEqual(weighted.variance, Fraction(11, 10))
@@ -1,7 +1,7 @@
 __author__ = "Len Washington III"
 
 
-from .classes import Fraction, Vector, PI, Trig, SIN, COS, TAN, ATAN, E
+from .classes import Fraction, FractionAccumulator, fsum_exact, sort_exact, argsort_exact, FractionArray, Precision, Vector, PI, Trig, SIN, COS, TAN, ATAN, E
 from .c_tools import factorial, factorial_without, gcd, P, C, sign
 from .stats import *
 from .calc import *
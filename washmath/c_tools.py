@@ -1,5 +1,6 @@
-from ctypes import CDLL, c_long, c_int, c_float, c_ulonglong
+from ctypes import CDLL, c_long, c_int, c_float, c_ulonglong, sizeof
 from ctypes.util import find_library
+from math import gcd as _big_gcd, comb
 from pathlib import Path
 from os.path import dirname, realpath
 
@@ -14,13 +15,16 @@ _c_lib.P.restype = c_ulonglong
 _c_lib.C.restype = c_ulonglong
 _c_lib.sign.restype = c_int
 
+_C_LONG_MAX = 2 ** (8 * sizeof(c_long) - 1) - 1
+_MAX_EXACT_FACTORIAL = 20  # 21! does not fit in an unsigned long long
+
 
 def sign(n:int) -> c_int:
     return _c_lib.sign(c_int(n))
 
 
 def factorial(n:int) -> c_ulonglong|int:
-    if n <= 20:
+    if n <= _MAX_EXACT_FACTORIAL:
         return _c_lib.factorial(c_int(n))
     total = 1
     for i in range(1, n+1):
@@ -44,16 +48,25 @@ def factorial_without(n:int, r:int) -> int:
     return total
 
 # TODO: Continue writing test cases
-def gcd(a:int, b:int) -> c_ulonglong:
-    return _c_lib.gcd(c_long(a), c_long(b))
+def gcd(a:int, b:int) -> c_ulonglong|int:
+    """
+    Uses the C library while both values fit in a C long, and Python's arbitrary precision math.gcd past that, where c_long would silently wrap.
+    """
+    if -_C_LONG_MAX <= a <= _C_LONG_MAX and -_C_LONG_MAX <= b <= _C_LONG_MAX:
+        return _c_lib.gcd(c_long(a), c_long(b))
+    return _big_gcd(a, b)
 
 
-def P(a:int, b:int) -> c_int:
-    return _c_lib.P(c_int(a), c_int(b))
+def P(a:int, b:int) -> c_int|int:
+    if a <= _MAX_EXACT_FACTORIAL:
+        return _c_lib.P(c_int(a), c_int(b))
+    return factorial_without(a, b)
 
 
-def C(a:int, b:int) -> c_int:
-    return _c_lib.C(c_int(a), c_int(b))
+def C(a:int, b:int) -> c_int|int:
+    if a <= _MAX_EXACT_FACTORIAL:
+        return _c_lib.C(c_int(a), c_int(b))
+    return comb(a, b)
 
 """
 def gcd(a, b):
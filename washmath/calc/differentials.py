@@ -1,4 +1,4 @@
-from .. import Fraction
+from .. import Fraction, Precision
 from ..classes.trig import E
 
 
@@ -8,7 +8,7 @@ def check_conditions(lst, ys, steps, until) -> bool:
 	return ys[-1] < until
 
 
-def euler(h:float, x0, y0, function, n:int=None, until=None, answer_only=True) -> Fraction | tuple[tuple[Fraction], tuple[Fraction]]:
+def euler(h:float, x0, y0, function, n:int=None, until=None, answer_only=True, precision:Precision=None) -> Fraction | float | tuple[tuple[Fraction], tuple[Fraction]]:
 	"""
 	:param float|int h: The horizontal step size
 	:param int n: The number of steps to take
@@ -16,18 +16,21 @@ def euler(h:float, x0, y0, function, n:int=None, until=None, answer_only=True) -
 	:param int|float y0: The initial value of the dependent variable
 	:param function: The function that is equivalent to the differential. Should take two arguments, the first being the independent variable, usually denoted as x, the second being the dependent variable, denoted as y
 	:param bool answer_only: If the method should only return the final y, or the arrays of all answers
+	:param Precision precision: How each x and y is stored. With a float h the exact denominators grow every step, so Precision.bounded or Precision.FLOAT keep the cost of a step fixed. Defaults to Precision.default()
 	"""
 	if n is None and until is None:
 		raise ValueError("Euler method needs number of steps (n) or until to define when the function is finished")
 
-	xs = [Fraction(x0)]
-	ys = [Fraction(y0)]
+	precision = Precision.resolve(precision)
+	h = precision.apply(Fraction(h))
+	xs = [precision.apply(Fraction(x0))]
+	ys = [precision.apply(Fraction(y0))]
 	indexes = [1]
 	while check_conditions(indexes, ys, n, until):
 		y = ys[-1] + (function(xs[-1], ys[-1]) * h)
 
-		xs.append(xs[-1] + h)
-		ys.append(y)
+		xs.append(precision.apply(xs[-1] + h))
+		ys.append(precision.apply(y))
 		indexes.append(indexes[-1] + 1)
 
 	if answer_only:
@@ -1,16 +1,34 @@
 from abc import abstractmethod
 from numpy import sqrt, cbrt
-from ..classes import Fraction, Trig, SIN, COS, TAN, CSC, SEC
+from ..classes import Fraction, Precision, Trig, SIN, COS, TAN, CSC, SEC
 
 
 class Polynomial(object):
     # Key is the power
     def __init__(self, factor_dict:dict, **kwargs):
+        """
+        :param dict factor_dict: The coefficients, keyed by their power
+        :param str variable: The name of the variable. Default is x
+        :param Precision precision: How the coefficients of this polynomial and the results of its arithmetic are stored. Defaults to Precision.default()
+        """
         self._dict = factor_dict
         try:
             self._variable = kwargs["variable"]
         except KeyError:
             self._variable = "x"
+        self._precision = kwargs.get("precision")
+        self._apply_precision()
+
+    def _new(self, new_dict:dict):
+        """
+        Builds the result of an operation with the same variable and precision
+        """
+        return Polynomial(new_dict, variable=self._variable, precision=self._precision)
+
+    def _apply_precision(self):
+        precision = Precision.resolve(self._precision)
+        if precision != Precision.EXACT:
+            self._dict = {power: precision.apply(coefficient) for power, coefficient in self._dict.items()}
 
     def __add__(self, other):
         if isinstance(other, float) and isinstance(other, int):
@@ -19,7 +37,7 @@ class Polynomial(object):
                 new_dict[0] = new_dict[0] + other
             except KeyError:
                 new_dict[0] = other
-            return Polynomial(new_dict, variable=self._variable)
+            return self._new(new_dict)
 
         elif isinstance(other, Polynomial):
             new_dict = self._dict.copy()
@@ -28,7 +46,7 @@ class Polynomial(object):
                     new_dict[other_power] = new_dict[other_power] + other_coefficient
                 except KeyError:
                     new_dict[other_power] = other_coefficient
-            return Polynomial(new_dict, variable=self._variable)
+            return self._new(new_dict)
 
     def __iadd__(self, other):
         if isinstance(other, float) and isinstance(other, int):
@@ -51,7 +69,7 @@ class Polynomial(object):
                 new_dict[0] = new_dict[0] - other
             except KeyError:
                 new_dict[0] = -other
-            return Polynomial(new_dict, variable=self._variable)
+            return self._new(new_dict)
 
         elif isinstance(other, Polynomial):
             new_dict = self._dict.copy()
@@ -60,7 +78,7 @@ class Polynomial(object):
                     new_dict[other_power] -= other_coefficient
                 except KeyError:
                     new_dict[other_power] = -other_coefficient
-            return Polynomial(new_dict, variable=self._variable)
+            return self._new(new_dict)
 
     def __isub__(self, other):
         if isinstance(other, float) and isinstance(other, int):
@@ -80,7 +98,7 @@ class Polynomial(object):
             new_dict = {}
             for power, coefficient in self._dict.items():
                 new_dict[power] = coefficient * other
-            return Polynomial(new_dict, variable=self._variable)
+            return self._new(new_dict)
         elif isinstance(other, Polynomial):
             new_dict = {}
 
@@ -93,7 +111,7 @@ class Polynomial(object):
                     except KeyError:
                         new_dict[combined_power] = combined_coefficient
 
-            return Polynomial(new_dict, variable=self._variable)
+            return self._new(new_dict)
 
     def __imul__(self, other):
         if isinstance(other, int) or isinstance(other, float):
@@ -112,6 +130,8 @@ class Polynomial(object):
                         new_dict[combined_power] = combined_coefficient
 
             self._dict = new_dict
+        self._apply_precision()
+        return self
 
     def __pow__(self, power):
         if isinstance(power, int):
@@ -184,7 +204,7 @@ class Polynomial(object):
             else:
                 new_dict[power-1] = coefficient * power
 
-        return Polynomial(new_dict, variable=self._variable)
+        return self._new(new_dict)
 
     def find_critical_points(self):
         return self.find_derivative().find_zeroes()
@@ -198,7 +218,7 @@ class Polynomial(object):
 
     def copy(self):
         new_dict = self._dict.copy()
-        return Polynomial(new_dict, variable=self._variable)
+        return Polynomial(new_dict, variable=self._variable, precision=self._precision)
 
     def _newton(self, x):
         px = self[x]
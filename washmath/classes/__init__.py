@@ -1,3 +1,5 @@
-from .fraction import Fraction
+from .fraction import Fraction, FractionAccumulator, fsum_exact, sort_exact, argsort_exact
+from .fraction_array import FractionArray
+from .precision import Precision
 from .trig import PI, Trig, SIN, COS, TAN, CSC, SEC, ATAN, E
 from .vector import Vector
@@ -1,7 +1,14 @@
-from numpy import lcm, int32, int64, gcd
-from numpy.core._exceptions import UFuncTypeError, _UFuncNoLoopError
-from warnings import warn
-from ..tools import is_basic_numeric
+from contextlib import contextmanager
+from contextvars import ContextVar
+from decimal import Decimal
+from itertools import compress
+from math import gcd
+from operator import eq, index
+from sys import hash_info
+try:
+	from gmpy2 import gcd as _gmpy2_gcd
+except ImportError:
+	_gmpy2_gcd = None
 
 
 class Number:
@@ -67,10 +74,10 @@ class Number:
 		else:
 			self._upper_pow *= power
 
-		_gcd = gcd(self._upper_pow, self._lower_pow)
+		_gcd = gcd(int(self._upper_pow), int(self._lower_pow))
 		if _gcd != 1:
-			self._upper_pow /= _gcd
-			self._lower_pow /= _gcd
+			self._upper_pow //= _gcd
+			self._lower_pow //= _gcd
 
 	def __repr__(self):
 		if self._upper_pow == 1 and self._lower_pow == 1:
@@ -88,169 +95,440 @@ class Number:
 # endregion
 
 
+_deferred_depth = ContextVar("deferred_depth", default=0)  # How many deferred_reduction blocks are open in this thread or task
+_HASH_MODULUS = hash_info.modulus
+_HASH_INF = hash_info.inf
+_GMPY2_GCD_BITS = 2048  # Past this size GMP's subquadratic gcd is faster than math.gcd, even after converting to and from mpz
+_INTERN_DENOMINATORS = (1, 2, 4)  # Whole numbers, halves, and quarters are shared
+_interned = {}  # (numerator, denominator) -> the shared Fraction with that value, filled by Fraction.set_intern_range
+_intern_bound = -1  # The largest absolute value in _interned, so larger values skip the gcd of the lookup
+
+
+def _too_large(numerator:int, denominator:int) -> bool:
+	"""
+	:return: If an unreduced fraction has to be reduced anyway, because its numerator or denominator has more than Fraction.DEFERRED_REDUCTION_BITS bits
+	"""
+	return numerator.bit_length() > Fraction.DEFERRED_REDUCTION_BITS or denominator.bit_length() > Fraction.DEFERRED_REDUCTION_BITS
+
+
+def _gcd(a:int, b:int) -> int:
+	"""
+	The gcd of two Python ints. Uses gmpy2 when it is installed and b is large enough for it to be faster, and math.gcd otherwise. Always returns a Python int.
+	"""
+	if _gmpy2_gcd is not None and b.bit_length() > _GMPY2_GCD_BITS:
+		return int(_gmpy2_gcd(a, b))
+	return gcd(a, b)
+
+
+def _write_int(buffer:bytearray, value:int) -> None:
+	"""
+	Appends an int of any size as its byte length, stored as a varint, followed by its little endian two's complement bytes. Small ints take two bytes.
+	"""
+	length = (value.bit_length() + 8) // 8
+	size = length
+	while size > 0x7f:
+		buffer.append(size & 0x7f | 0x80)
+		size >>= 7
+	buffer.append(size)
+	buffer += value.to_bytes(length, "little", signed=True)
+
+
+def _read_int(data, offset:int) -> tuple[int, int]:
+	"""
+	Reads an int written by _write_int.
+	:param data: bytes, a memoryview, or an mmap
+	:param int offset: Where the int starts
+	:return: The int and the offset right after it
+	"""
+	length = shift = 0
+	while True:
+		byte = data[offset]
+		offset += 1
+		length |= (byte & 0x7f) << shift
+		if byte < 0x80:
+			break
+		shift += 7
+	return int.from_bytes(data[offset:offset + length], "little", signed=True), offset + length
+
+
+def _float_ratio(value:float, exact=False) -> tuple[int, int]:
+	"""
+	:param float value: A finite float
+	:param bool exact: Use the exact binary value of the float instead of its shortest decimal representation
+	:return: The numerator and denominator of the float, already reduced
+	"""
+	if exact:
+		return float(value).as_integer_ratio()
+	return Decimal(float.__repr__(value)).as_integer_ratio()  # The shortest decimal, so 0.1 is 1/10
+
+
+def _limit_denominator(numerator:int, denominator:int, max_denominator:int) -> tuple[int, int]:
+	"""
+	Finds the closest fraction to numerator/denominator whose denominator is at most max_denominator, using the continued fraction expansion.
+	:return: The numerator and denominator of the closest fraction
+	"""
+	if max_denominator < 1:
+		raise ValueError("max_denominator must be at least 1")
+	if denominator <= max_denominator:
+		return numerator, denominator
+
+	p0, q0, p1, q1 = 0, 1, 1, 0
+	n, d = numerator, denominator
+	while True:
+		a = n // d
+		q2 = q0 + a * q1
+		if q2 > max_denominator:
+			break
+		p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+		n, d = d, n - a * d
+
+	k = (max_denominator - q0) // q1
+	# The closest fraction is either the last convergent or the best semiconvergent below it
+	if 2 * d * (q0 + k * q1) <= denominator:
+		return p1, q1
+	return p0 + k * p1, q0 + k * q1
+
+
+def _add_ratios(n1:int, d1:int, n2:int, d2:int) -> tuple[int, int]:
+	"""
+	Adds two ratios without reducing them. If one denominator divides the other, the larger one is kept instead of multiplying them, so unreduced sums stay small.
+	"""
+	if d1 == d2:
+		return n1 + n2, d1
+	if d1 > d2 and d1 % d2 == 0:
+		return n1 + n2 * (d1 // d2), d1
+	if d2 % d1 == 0:
+		return n1 * (d2 // d1) + n2, d2
+	return n1 * d2 + n2 * d1, d1 * d2
+
+
+def _as_ratio(value, name="numerator") -> tuple[int, int]:
+	"""
+	Splits a number into an integer numerator and denominator. The pair is not reduced.
+	:param value: An int, float, Fraction, or washmath.Number
+	:param str name: The name used in the error message, either numerator or denominator
+	:return: The numerator and denominator of the value
+	:raise AttributeError: If the value cannot be represented as a fraction
+	"""
+	if type(value) is int:
+		return value, 1
+	if isinstance(value, Fraction):
+		return value._numerator, value._denominator
+	if isinstance(value, float):
+		if value != value or value in (float("inf"), float("-inf")):
+			raise ValueError(f"Cannot convert {value} to a fraction")
+		return _float_ratio(value)
+	if isinstance(value, Number):
+		return _as_ratio(value.value, name)
+	if hasattr(value, "__index__"):  # numpy integers and bools
+		return index(value), 1
+	if hasattr(value, "as_integer_ratio"):  # decimal.Decimal and fractions.Fraction
+		return value.as_integer_ratio()
+	raise AttributeError(f"The {name} must be a washmath.Number, not {type(value).__name__}")
+
+
 class Fraction(object):
+	"""
+	An exact rational number. The numerator and denominator are always Python ints, and the sign is kept on the numerator.
+
+	Fractions are values: arithmetic, including the in-place operators, always returns a new Fraction and never changes its operands.
+	Because of that, Fraction(n, d) with int arguments and no other options returns a shared instance when the value is a small whole number, half, or quarter
+	(see set_intern_range), so repetitive data such as counts or survey scores holds one object per distinct value.
+	The numerator, denominator, and auto_reduce are read only on every Fraction, so sharing a value is never visible. Build a new Fraction to change them.
+	Fraction(0.1) reads a float as its shortest decimal, 1/10. Arithmetic and comparisons with a float use its exact binary value instead, so
+	Fraction(1, 10) - 0.1 is not 0, in agreement with Fraction(1, 10) != 0.1 and the hash. Convert the float with Fraction first to use its decimal value.
+	"""
+	__slots__ = ("_numerator", "_denominator", "_auto_reduce", "_persistent_denominator", "_reduced")
 	REGEX = r"([0-9]+.?[0-9]+)\s?/\s?([0-9]+.?[0-9]+)"
+	DEFERRED_REDUCTION_BITS = 256  # An unreduced fraction is reduced anyway once its numerator or denominator is this large
 
-	def __init__(self, numerator, denominator=1, auto_reduce=True, **kwargs):
+	def __new__(cls, numerator, denominator=1, auto_reduce=True, **kwargs):
 		"""
+		The fraction is built here rather than in __init__, so a shared value is returned as it is and never set again.
 		:param bool persistent_denominator: If the denominator should be kept as is if the numerator is 0. Default is False.
-		:param bool auto_reduce: If the fraction should be automatically reduced.
+		:param bool auto_reduce: If the fraction should be automatically reduced. If False, results of arithmetic with this fraction are not reduced either. They still print and hash as their reduced value.
 		"""
-		self._allowed_to_reduce = False
-		self.auto_reduce = auto_reduce
+		if cls is Fraction and auto_reduce is True and not kwargs and type(denominator) is int:
+			if type(numerator) is int:
+				shared = None
+				if denominator and abs(numerator) <= _intern_bound * abs(denominator):
+					factor = gcd(numerator, denominator) if denominator > 0 else -gcd(numerator, denominator)
+					shared = _interned.get((numerator // factor, denominator // factor))  # Reduced first, so 2/4 is the shared 1/2
+			elif type(numerator) is float and denominator == 1 and (numerator * 4).is_integer():  # Quarters are exact in binary, so this is the float's decimal value too
+				quarters = int(numerator * 4)
+				factor = gcd(quarters, 4)
+				shared = _interned.get((quarters // factor, 4 // factor))
+			else:
+				shared = None
+			if shared is not None:
+				return shared
+		self = object.__new__(cls)
+		self._auto_reduce = auto_reduce
 		self._persistent_denominator = kwargs.get("persistent_denominator", False)
 
-		if isinstance(denominator, Fraction):
-			self.numerator = numerator * denominator.denominator
+		if type(numerator) is int and type(denominator) is int:
+			self._set(numerator, denominator)
 		else:
-			self.numerator = numerator
-		self._allowed_to_reduce = True
-		if hasattr(self, "_denominator"):
-			try:
-				self.denominator *= denominator.denominator  # The numerator was a fraction, and the new denominator needs to be multiplied by the old one.
-			except TypeError as e:
-				self.denominator = denominator * self._denominator
+			upper_numerator, upper_denominator = _as_ratio(numerator, "numerator")
+			lower_numerator, lower_denominator = _as_ratio(denominator, "denominator")
+			self._set(upper_numerator * lower_denominator, upper_denominator * lower_numerator)
+		return self
+
+	@classmethod
+	def from_float(cls, value:float, max_denominator:int=None, exact=False, **kwargs):
+		"""
+		Creates a Fraction from a float using its integer ratio instead of scaling it by 10 until it is whole.
+		:param float value: The float to convert. Ints are accepted as well.
+		:param int max_denominator: If set, the closest fraction whose denominator is no larger than this is returned
+		:param bool exact: Use the exact binary value of the float, so 0.1 becomes 3602879701896397/36028797018963968. By default the shortest decimal that rounds to the float is used, so 0.1 becomes 1/10.
+		:raise ValueError: If the value is infinite or NaN
+		"""
+		if isinstance(value, float):
+			if value != value or value in (float("inf"), float("-inf")):
+				raise ValueError(f"Cannot convert {value} to a fraction")
+			numerator, denominator = _float_ratio(value, exact)
 		else:
-			self.denominator = denominator
+			numerator, denominator = _as_ratio(value)
+		if max_denominator is not None:
+			numerator, denominator = _limit_denominator(numerator, denominator, max_denominator)
+		return cls(numerator, denominator, **kwargs)
+
+	@staticmethod
+	def set_intern_range(low:int, high:int) -> None:
+		"""
+		Sets which values Fraction(n, d) shares instead of building a new object: the whole numbers, halves, and quarters from low to high, inclusive.
+		Fractions that were already shared keep their values. Pass high < low to turn interning off.
+		:param int low: The smallest shared value
+		:param int high: The largest shared value
+		"""
+		global _intern_bound
+		_interned.clear()
+		_intern_bound = max(abs(low), abs(high)) if high >= low else -1
+		for denominator in _INTERN_DENOMINATORS:
+			for numerator in range(low * denominator, high * denominator + 1):
+				if gcd(numerator, denominator) == 1:
+					_interned[numerator, denominator] = Fraction._from_ratio(numerator, denominator)
+
+	@staticmethod
+	@contextmanager
+	def deferred_reduction():
+		"""
+		Skips the gcd reduction of every Fraction built inside the block. Their stored terms stay unreduced; hashing, printing, or reading the numerator or denominator reduces a copy of them, and comparisons cross multiply.
+		Useful for long chains of additions, like a sum over a StatList, where only the final result needs to be reduced.
+		"""
+		token = _deferred_depth.set(_deferred_depth.get() + 1)
+		try:
+			yield
+		finally:
+			_deferred_depth.reset(token)
+
+	def _set(self, numerator:int, denominator:int) -> None:
+		"""
+		Stores a pair of ints, moving the sign to the numerator and reducing if auto_reduce is set and reduction is not deferred.
+		"""
+		if denominator == 0:
+			raise ZeroDivisionError("0 cannot be the denominator of a function")
+		if denominator < 0:
+			numerator = -numerator
+			denominator = -denominator
+
+		if (self._auto_reduce and not _deferred_depth.get()) or _too_large(numerator, denominator):
+			if not (numerator == 0 and self._persistent_denominator):
+				factor = _gcd(numerator, denominator)
+				if factor != 1:
+					numerator //= factor
+					denominator //= factor
+			self._reduced = True
+		else:
+			self._reduced = False
+		self._numerator = numerator
+		self._denominator = denominator
+
+	@classmethod
+	def _from_ratio(cls, numerator:int, denominator:int, auto_reduce=True, persistent_denominator=False):
+		"""
+		Builds a Fraction from two ints, skipping the type checks in __init__. Used for the results of arithmetic.
+		"""
+		fraction = object.__new__(cls)
+		fraction._auto_reduce = auto_reduce
+		fraction._persistent_denominator = persistent_denominator
+		fraction._set(numerator, denominator)
+		return fraction
+
+	def _updated(self, numerator:int, denominator:int):
+		"""
+		:return: The result of an in-place operator, a new Fraction with this fraction's settings, since Fractions are never changed by arithmetic
+		"""
+		return Fraction._from_ratio(numerator, denominator, self._auto_reduce, self._persistent_denominator)
+
+	def _terms(self) -> tuple[int, int]:
+		"""
+		:return: The reduced numerator and denominator. If the reduction was deferred they are reduced here without being stored, so reading a value never changes it
+		"""
+		numerator, denominator = self._numerator, self._denominator
+		if not self._reduced and not (numerator == 0 and self._persistent_denominator):
+			factor = _gcd(numerator, denominator)
+			if factor != 1:
+				numerator //= factor
+				denominator //= factor
+		return numerator, denominator
+
+	def _reduces_with(self, other) -> bool:
+		"""
+		:return: If the result of an operation with other should be reduced right away, which is only if both operands are auto reducing
+		"""
+		return self._auto_reduce and (not isinstance(other, Fraction) or other._auto_reduce)
+
+	@staticmethod
+	def _operand(other):
+		"""
+		:return: The numerator and denominator of the other operand, or None if it is not a number
+		"""
+		if isinstance(other, Fraction):
+			return other._numerator, other._denominator
+		if isinstance(other, float) and other - other == 0:  # Finite. inf and nan raise in _as_ratio
+			return other.as_integer_ratio()  # The exact binary value, the same one the comparisons and hash use
+		try:
+			return _as_ratio(other)
+		except (AttributeError, TypeError):
+			return None
 
 	# region Operator Overloads
 	def __add__(self, other):
-		if isinstance(other, Fraction):
-			if (self.denominator == other.denominator):
-				return Fraction(self.numerator + other.numerator, self.denominator, auto_reduce=self.auto_reduce)
-			else:
-				newDenominator = self.denominator * other.denominator
-				newSelf = self.numerator * other.denominator
-				newOther = other.numerator * self.denominator
-				return Fraction(newSelf + newOther, newDenominator, auto_reduce=self.auto_reduce)  # Now they have matching denominators
-		elif isinstance(other, (int, float)):
-			newNumerator = other * self.denominator
-			return Fraction(newNumerator + self.numerator, self.denominator)
+		operand = self._operand(other)
+		if operand is None:
+			return NotImplemented
+		numerator, denominator = _add_ratios(self._numerator, self._denominator, *operand)
+		return Fraction._from_ratio(numerator, denominator, self._reduces_with(other))
+
+	def __radd__(self, other):
+		return self + other
 
 	def __iadd__(self, other):
-		if isinstance(other, Fraction):
-			if (self.denominator == other.denominator):
-				self.numerator += other.numerator
-			else:
-				self.numerator = (self.numerator * other.denominator) + (other.numerator * self.denominator)
-				self.denominator *= other.denominator
-		elif isinstance(other, (int, float)):
-			newNumerator = other * self.denominator
-			self.numerator += newNumerator
-		return self
+		operand = self._operand(other)
+		if operand is None:
+			return NotImplemented
+		return self._updated(*_add_ratios(self._numerator, self._denominator, *operand))
 
 	def __sub__(self, other):
-		if isinstance(other, Fraction):
-			if (self.denominator == other.denominator):
-				return Fraction(self.numerator - other.numerator, self.denominator)
-			else:
-				newDenominator = self.denominator * other.denominator
-				newSelf = self.numerator * (newDenominator / self.denominator)
-				newOther = other.numerator * (newDenominator / other.denominator)
-				return Fraction(newSelf - newOther, newDenominator)
-		elif isinstance(other, (int, float)):
-			newNumerator = other * self.denominator
-			return Fraction(self.numerator - newNumerator, self.denominator)
+		operand = self._operand(other)
+		if operand is None:
+			return NotImplemented
+		numerator, denominator = operand
+		numerator, denominator = _add_ratios(self._numerator, self._denominator, -numerator, denominator)
+		return Fraction._from_ratio(numerator, denominator, self._reduces_with(other))
+
+	def __rsub__(self, other):
+		return -self + other
 
 	def __isub__(self, other):
-		if isinstance(other, Fraction):
-			if (self.denominator == other.denominator):
-				self.numerator -= other.numerator
-			else:
-				newDenominator = lcm(self.denominator, other.denominator)
-				newOther = other.numerator * (other.denominator / newDenominator)
-				self.numerator -= newOther
-		elif isinstance(other, (int, float)):
-			newNumerator = other * self.denominator
-			self.numerator -= newNumerator
-		return self
+		operand = self._operand(other)
+		if operand is None:
+			return NotImplemented
+		numerator, denominator = operand
+		return self._updated(*_add_ratios(self._numerator, self._denominator, -numerator, denominator))
 
 	def __mul__(self, other):
-		if isinstance(other, Fraction):
-			return Fraction(self.numerator * other.numerator, self.denominator * other.denominator, auto_reduce=self.auto_reduce)
-		elif isinstance(other, (int, float)):
-			return Fraction(self.numerator * other, self.denominator, self.auto_reduce)
+		operand = self._operand(other)
+		if operand is None:
+			return NotImplemented
+		numerator, denominator = operand
+		return Fraction._from_ratio(self._numerator * numerator, self._denominator * denominator, self._reduces_with(other))
+
+	def __rmul__(self, other):
+		return self * other
 
 	def __imul__(self, other):
-		if isinstance(other, Fraction):
-			self._allowed_to_reduce = False
-			self.numerator *= other.numerator
-			self._allowed_to_reduce = True
-			self.denominator *= other.denominator
-		elif isinstance(other, (int, float)):
-			self.numerator *= other
-		return self
+		operand = self._operand(other)
+		if operand is None:
+			return NotImplemented
+		numerator, denominator = operand
+		return self._updated(self._numerator * numerator, self._denominator * denominator)
 
 	def __truediv__(self, other):
-		if isinstance(other, Fraction):
-			return self * Fraction(other.denominator, other.numerator)
-		elif isinstance(other, (float, int)):
-			if self.numerator % other == 0:
-				return Fraction(self.numerator / other, self.denominator)
-			return Fraction(self.numerator, self.denominator * other)
-
-	def __idiv__(self, other):
-		if isinstance(other, Fraction):
-			self.numerator *= other.denominator
-			self.denominator *= other.numerator
-		elif isinstance(other, (float, int)):
-			if self.numerator % other == 0:
-				self.numerator /= other
-			else:
-				self.denominator *= other
-		return self
+		operand = self._operand(other)
+		if operand is None:
+			return NotImplemented
+		numerator, denominator = operand
+		return Fraction._from_ratio(self._numerator * denominator, self._denominator * numerator, self._reduces_with(other))
+
+	def __rtruediv__(self, other):
+		return self.inverse * other
+
+	def __itruediv__(self, other):
+		operand = self._operand(other)
+		if operand is None:
+			return NotImplemented
+		numerator, denominator = operand
+		return self._updated(self._numerator * denominator, self._denominator * numerator)
+
+	__idiv__ = __itruediv__
+
+	@staticmethod
+	def _integer_power(power):
+		"""
+		:return: The power as an int if it is a whole number, otherwise None
+		"""
+		if isinstance(power, int):
+			return power
+		if isinstance(power, float) and power.is_integer():
+			return int(power)
+		if isinstance(power, Fraction) and power.is_whole:
+			return power.numerator
+		return None
 
 	def __pow__(self, power, modulo=None):
 		if power == 0:
-			if self.numerator == 0:
+			if self._numerator == 0:
 				raise Exception("Cannot raise 0 to the zeroth power.")
 			return Fraction(1)
 		elif power == 1:
 			return self.copy()
-		elif power > 0:
-			newNumerator = self.numerator ** power
-			newDenominator = self.denominator ** power
-			return Fraction(newNumerator, newDenominator)
+
+		whole_power = self._integer_power(power)
+		if whole_power is None:
+			if self._numerator < 0:
+				raise ValueError("Can't take the root of a negative fraction.")
+			return Fraction(float(self) ** float(power))
+		elif whole_power > 0:
+			return Fraction(self._numerator ** whole_power, self._denominator ** whole_power)
 		else:
-			return Fraction(self.denominator, self.numerator) ** -power
+			return Fraction(self._denominator ** -whole_power, self._numerator ** -whole_power)
 
 	def __ipow__(self, power, modulo=None):
-		if self < 0 and power < 1:
-			raise ValueError("Can't take the root of a negative fraction.")
 		if power == 0:
-			if self.numerator == 0:
+			if self._numerator == 0:
 				raise Exception("Cannot raise 0 to the zeroth power.")
-			self.numerator = self.denominator = 1
-			return self
+			return self._updated(1, 1)
 		elif power == 1:
 			return self
-		elif power > 0:
-			self._allowed_to_reduce = False
-			self.numerator **= power
-			self._allowed_to_reduce = True
-			self.denominator **= power
-			return self
+
+		whole_power = self._integer_power(power)
+		if whole_power is None:
+			if self._numerator < 0:
+				raise ValueError("Can't take the root of a negative fraction.")
+			return self._updated(*_as_ratio(float(self) ** float(power)))
+		elif whole_power > 0:
+			return self._updated(self._numerator ** whole_power, self._denominator ** whole_power)
 		else:
-			numerator = self.denominator ** power
-			denominator = self.numerator ** power
-			self.numerator = numerator
-			self.denominator = denominator
-			return self
+			return self._updated(self._denominator ** -whole_power, self._numerator ** -whole_power)
 
 	def __float__(self):
-		return self.numerator / self.denominator
+		return self._numerator / self._denominator
 
 	def __int__(self):
-		return int(float(self))
+		if self._numerator < 0:
+			return -(-self._numerator // self._denominator)
+		return self._numerator // self._denominator
 
 	def __abs__(self):
-		return Fraction(abs(self.numerator), self.denominator)
+		return Fraction(abs(self._numerator), self._denominator, auto_reduce=self._auto_reduce)
 
 	def __pos__(self):
-		return Fraction(abs(self.numerator), self.denominator)
+		return self.copy()
 
 	def __neg__(self):
-		return Fraction(-abs(self.numerator), self.denominator)
+		return Fraction(-self._numerator, self._denominator, auto_reduce=self._auto_reduce)
 
 	def __str__(self):
 		return repr(self)
@@ -258,78 +536,103 @@ class Fraction(object):
 	# return f"{self.numerator:,}/{self.denominator:,}"
 
 	def __repr__(self):
-		if self.numerator == 0:
+		numerator, denominator = self._terms()
+		if numerator == 0:
 			return "0"
-		if self.denominator == 1:
-			return str(self.numerator)
-		return f"{self.numerator}/{self.denominator} ({float(self)})"
+		if denominator == 1:
+			return str(numerator)
+		return f"{numerator}/{denominator} ({float(self)})"
 
 	def __bool__(self):
-		return bool(self.numerator)
+		return bool(self._numerator)
 
-	def __lt__(self, other):
-		if isinstance(other, Fraction):
-			if self.denominator == other.denominator:
-				return self.numerator < other.numerator
-			else:
-				try:
-					newDenominator = lcm(self.denominator, other.denominator)
-				except _UFuncNoLoopError:
-					newDenominator = self.denominator * other.denominator
-				newSelf = self.numerator * (newDenominator / self.denominator)
-				newOther = other.numerator * (newDenominator / other.denominator)
-				return newSelf < newOther
-		return float(self) < other
-
-	def __gt__(self, other):
-		if isinstance(other, Fraction):
-			if self.denominator == other.denominator:
-				return self.numerator > other.numerator
-			else:
-				try:
-					newDenominator = lcm(self.denominator, other.denominator)
-				except _UFuncNoLoopError:
-					newDenominator = self.denominator * other.denominator
-				newSelf = self.numerator * (newDenominator / self.denominator)
-				newOther = other.numerator * (newDenominator / other.denominator)
-				return newSelf > newOther
-		return float(self) > other
+	def _compare_float(self, other:float):
+		"""
+		Compares with a float through float(self), which is correctly rounded, so it only needs an exact check when the two are equal as floats.
+		:return: -1, 0, or 1 like a cmp function, or None if other is NaN
+		"""
+		if other != other:
+			return None
+		try:
+			value = float(self)
+		except OverflowError:
+			value = float("inf") if self._numerator > 0 else float("-inf")
+		if value != other or value in (float("inf"), float("-inf")):
+			return (value > other) - (value < other)
+		numerator, denominator = other.as_integer_ratio()  # The exact binary value, the same one hash(other) uses, so 1/10 != 0.1 like fractions.Fraction
+		return self._order((numerator, denominator))
+
+	def _order(self, other):
+		"""
+		Compares exactly by cross multiplying. The denominators are positive, so a/b < c/d exactly when a*d < c*b.
+		:param other: A number, or a (numerator, denominator) tuple
+		:return: -1, 0, or 1 like a cmp function, None if other is NaN, or NotImplemented if other is not a number
+		"""
+		if isinstance(other, float):
+			return self._compare_float(other)
+		if isinstance(other, Fraction):  # Cross multiplying does not need either side reduced
+			numerator, denominator = other._numerator, other._denominator
+		elif isinstance(other, int):
+			numerator, denominator = other, 1
+		elif isinstance(other, tuple):
+			numerator, denominator = other
+		else:
+			try:
+				numerator, denominator = _as_ratio(other)
+			except (AttributeError, TypeError, ValueError):
+				return NotImplemented
+		if self._denominator == denominator:
+			left, right = self._numerator, numerator
+		else:
+			left, right = self._numerator * denominator, numerator * self._denominator
+		return (left > right) - (left < right)
 
-	def __eq__(self, other):
-		if other is None: return False
-		if isinstance(other, int):
-			return int(self) == other
-		elif isinstance(other, Fraction):
-			if self.denominator == other.denominator:
-				return self.numerator == other.numerator
-			else:
-				newDenominator = lcm(self.denominator, other.denominator)
-				newSelf = self.numerator * (newDenominator / self.denominator)
-				newOther = other.numerator * (newDenominator / other.denominator)
-				return newSelf == newOther
-		elif isinstance(other, bool):
-			return bool(self) == other
-		return float(self) == other
+	def __lt__(self, other):
+		order = self._order(other)
+		return order if order is NotImplemented else order is not None and order < 0
 
 	def __le__(self, other):
-		return (self < other) or (self == other)
+		order = self._order(other)
+		return order if order is NotImplemented else order is not None and order <= 0
+
+	def __gt__(self, other):
+		order = self._order(other)
+		return order if order is NotImplemented else order is not None and order > 0
 
 	def __ge__(self, other):
-		return (self > other) or (self == other)
+		order = self._order(other)
+		return order if order is NotImplemented else order is not None and order >= 0
+
+	def __eq__(self, other):
+		order = self._order(other)
+		return order if order is NotImplemented else order == 0
 
 	def __ne__(self, other):
-		return not (self == other)
+		order = self._order(other)
+		return order if order is NotImplemented else order != 0
 
 	def __hash__(self):
-		return hash((self.numerator, self.denominator))
+		"""
+		Uses the same hash as Python's numbers, so Fraction(2) hashes like 2 and Fraction(1, 2) like 0.5.
+		"""
+		numerator, denominator = self._terms()
+		try:
+			inverse = pow(denominator, -1, _HASH_MODULUS)
+		except ValueError:  # The denominator is a multiple of the modulus
+			value = _HASH_INF
+		else:
+			value = hash(hash(abs(numerator)) * inverse)
+		value = value if numerator >= 0 else -value
+		return -2 if value == -1 else value
 
 	def __format__(self, format_spec):
 		if format_spec == ",":
-			if self.numerator == 0:
+			numerator, denominator = self._terms()
+			if numerator == 0:
 				return "0"
-			if self.denominator == 1:
-				return f"{self.numerator:,}"
-			return f"{self.numerator:,}/{self.denominator:,}"
+			if denominator == 1:
+				return f"{numerator:,}"
+			return f"{numerator:,}/{denominator:,}"
 		return format(float(self), format_spec)
 
 	def __round__(self, ndigits=0):
@@ -338,94 +641,70 @@ class Fraction(object):
 	# endregion
 
 	@property
-	def numerator(self):
-		return self._numerator
-
-	@numerator.setter
-	def numerator(self, numerator):
-		if not is_basic_numeric(numerator) and not isinstance(numerator, (Number, Fraction)):
-			raise AttributeError(f"The numerator must be a washmath.Number, not {type(numerator).__name__}")
-
-		if isinstance(numerator, Number):
-			numerator = numerator.value
-
-		if isinstance(numerator, (int, float)):
-			self._numerator = numerator
-		# numerator = Number(int)
-		if isinstance(numerator, Fraction):
-			self._denominator = numerator.denominator * (self.denominator if hasattr(self, "_denominator") else 1)
-			self._numerator = numerator.numerator
-		elif isinstance(numerator, Number):
-			self._numerator = numerator
-		if self.auto_reduce:
-			self.reduce()
+	def auto_reduce(self) -> bool:
+		return self._auto_reduce
 
 	@property
-	def denominator(self):
-		return self._denominator
-
-	@denominator.setter
-	def denominator(self, denominator):
-		# if not is_basic_numeric(denominator):
-		if not is_basic_numeric(denominator) and not isinstance(denominator, (Number, Fraction)):
-			raise AttributeError(f"The denominator must be a washmath.Number, not {type(denominator).__name__}")
-		if denominator == 0:
-			raise ZeroDivisionError("0 cannot be the denominator of a function")
-
-		if denominator < 0:
-			denominator *= -1
-			self._numerator *= -1
-
-		if isinstance(denominator, Number):
-			denominator = denominator.value
-
-		if isinstance(denominator, (int, float)):
-			self._denominator = denominator
-		# denominator = Number(denominator)
-		if isinstance(denominator, Fraction):
-			self._numerator *= denominator.denominator
-			self._denominator = denominator.numerator
-		elif isinstance(denominator, Number):
-			whole_denominator = denominator ** denominator.get_radical
-			self._numerator *= denominator
-			self._denominator = whole_denominator
-		if self.auto_reduce:
-			self.reduce()
-
-	def copy(self):
-		return Fraction(self.numerator, self.denominator, auto_reduce=self.auto_reduce)
-
-	def reduce(self):
-		def equals(num: float) -> bool:
-			return int(num) == num
+	def numerator(self) -> int:
+		return self._terms()[0] if self._auto_reduce else self._numerator
 
-		if not self._allowed_to_reduce:
-			return
-
-		while self.numerator % 1 != 0 or self.denominator % 1 != 0:
-			self._numerator *= 10
-			self._denominator *= 10
+	@property
+	def denominator(self) -> int:
+		return self._terms()[1] if self._auto_reduce else self._denominator
 
-		try:
-			factor = gcd(int(self.numerator), int(self.denominator))
-			if (factor != 1 and factor != 0) and not (self._numerator == 0 and self._persistent_denominator):
-				self._numerator /= factor
-				self._denominator /= factor
-		except UFuncTypeError as e:
-			warn(str(e))
+	def to_bytes(self) -> bytes:
+		"""
+		:return: The numerator and denominator in a compact binary form, which Fraction.from_bytes reads back
+		"""
+		numerator, denominator = self._terms()
+		buffer = bytearray()
+		_write_int(buffer, numerator)
+		_write_int(buffer, denominator)
+		return bytes(buffer)
+
+	@classmethod
+	def from_bytes(cls, data):
+		"""
+		:param data: bytes written by Fraction.to_bytes
+		:return: The Fraction
+		"""
+		numerator, offset = _read_int(data, 0)
+		denominator, _ = _read_int(data, offset)
+		return cls(numerator, denominator)
 
-		if equals(self.numerator):
-			self._numerator = int(self.numerator)
+	def __reduce__(self):
+		return _restore_fraction, (self._numerator, self._denominator, self._auto_reduce, self._persistent_denominator)
 
-		if equals(self.denominator):
-			self._denominator = int(self.denominator)
+	def copy(self):
+		"""
+		:return: A Fraction with the same value and settings that is never shared
+		"""
+		return Fraction(self._numerator, self._denominator, auto_reduce=self._auto_reduce, persistent_denominator=self._persistent_denominator)
 
+	def reduce(self):
+		factor = _gcd(self._numerator, self._denominator)
+		if factor not in (0, 1) and not (self._numerator == 0 and self._persistent_denominator):
+			self._numerator //= factor
+			self._denominator //= factor
+		self._reduced = True
 		return self
 
+	def limit_denominator(self, max_denominator:int=1_000_000):
+		"""
+		Finds the closest fraction with a bounded denominator using the continued fraction expansion. Useful for keeping long computations from growing their denominators without bound.
+		:param int max_denominator: The largest denominator the result may have
+		:return: A new Fraction, or this one if its denominator is already small enough
+		:raise ValueError: If max_denominator is less than 1
+		"""
+		numerator, denominator = _limit_denominator(*self._terms(), max_denominator)
+		if denominator == self._terms()[1]:
+			return self
+		return Fraction._from_ratio(numerator, denominator, self._auto_reduce)
+
 	@property
 	def is_whole(self) -> bool:
 		"""Returns whether the fraction is a whole number or not"""
-		return self.denominator == 1
+		return self._terms()[1] == 1
 
 	def __invert__(self):
 		return self.inverse
@@ -436,7 +715,132 @@ class Fraction(object):
 
 	@property
 	def to_tex(self) -> str:
-		return f"\\frac{{{self.numerator:,}}}{{{self.denominator:,}}}"
+		numerator, denominator = self._terms()
+		return f"\\frac{{{numerator:,}}}{{{denominator:,}}}"
+
+
+def _restore_fraction(numerator:int, denominator:int, auto_reduce:bool, persistent_denominator:bool) -> Fraction:
+	"""
+	Rebuilds a pickled or copied Fraction through the constructor, so shared values stay shared and are never written to.
+	"""
+	if auto_reduce and not persistent_denominator:
+		return Fraction(numerator, denominator)
+	return Fraction(numerator, denominator, auto_reduce=auto_reduce, persistent_denominator=persistent_denominator)
+
+
+Fraction.set_intern_range(-128, 256)
+
+
+class FractionAccumulator(object):
+	"""
+	Adds many numbers exactly. The numerators are summed per denominator, and the groups are only combined into one Fraction when the total is read.
+	"""
+	__slots__ = ("_sums",)
+
+	def __init__(self, values=()):
+		"""
+		:param values: An iterable of ints, floats, and Fractions to start with
+		"""
+		self._sums = {}
+		self.extend(values)
+
+	def add(self, value) -> None:
+		"""
+		:param value: An int, float, or Fraction to add to the total
+		"""
+		if isinstance(value, Fraction):
+			numerator, denominator = value._numerator, value._denominator
+		else:
+			numerator, denominator = _as_ratio(value)
+		self._sums[denominator] = self._sums.get(denominator, 0) + numerator
+
+	def extend(self, values) -> None:
+		"""
+		:param values: An iterable of ints, floats, and Fractions to add to the total
+		"""
+		sums = self._sums
+		integers = 0
+		for value in values:
+			if type(value) is int:
+				integers += value
+				continue
+			if isinstance(value, Fraction):
+				numerator, denominator = value._numerator, value._denominator
+			else:
+				numerator, denominator = _as_ratio(value)
+			if denominator == 1:
+				integers += numerator
+			else:
+				sums[denominator] = sums.get(denominator, 0) + numerator
+		if integers:
+			sums[1] = sums.get(1, 0) + integers
+
+	def __iadd__(self, other):
+		self.add(other)
+		return self
+
+	@property
+	def total(self) -> Fraction:
+		"""
+		:return: The exact sum of every value added so far
+		"""
+		if len(self._sums) == 1:  # Every value was an int, or they all shared a denominator
+			(denominator, numerator), = self._sums.items()
+			return Fraction(numerator, denominator)
+
+		numerator, denominator = 0, 1
+		for group_denominator, group_numerator in self._sums.items():
+			numerator, denominator = _add_ratios(numerator, denominator, group_numerator, group_denominator)
+			if _too_large(numerator, denominator):
+				factor = _gcd(numerator, denominator)
+				numerator //= factor
+				denominator //= factor
+		return Fraction(numerator, denominator)
+
+
+def fsum_exact(values) -> Fraction:
+	"""
+	Adds an iterable of ints, floats, and Fractions exactly. Gives the same result as sum(values, start=Fraction(0)) without building a Fraction for every partial sum.
+	:param values: The numbers to add
+	:return: The sum as a reduced Fraction
+	"""
+	return FractionAccumulator(values).total
+
+
+def argsort_exact(values, reverse=False) -> list:
+	"""
+	Finds the order that sorts a sequence of Fractions, ints, and floats, the same way sort_exact does. The indices are sorted by the float of each value first,
+	and only runs of values with equal floats are then sorted with exact comparisons. The sort is stable, so equal values keep their order.
+	:param values: The sequence to sort, which is not changed
+	:param bool reverse: Sort from largest to smallest
+	:return: A list of indices into values, in sorted order
+	"""
+	keys = list(map(float, values))
+	order = sorted(range(len(values)), key=keys.__getitem__, reverse=reverse)
+	keys = [keys[i] for i in order]
+
+	ties = compress(range(1, len(keys)), map(eq, keys[1:], keys[:-1]))
+	run_start = previous = None
+	for i in ties:
+		if previous is None or i != previous + 1:
+			if run_start is not None:
+				order[run_start:previous + 1] = sorted(order[run_start:previous + 1], key=values.__getitem__, reverse=reverse)
+			run_start = i - 1
+		previous = i
+	if run_start is not None:
+		order[run_start:previous + 1] = sorted(order[run_start:previous + 1], key=values.__getitem__, reverse=reverse)
+	return order
+
+
+def sort_exact(values:list, reverse=False) -> None:
+	"""
+	Sorts a list of Fractions, ints, and floats in place. The list is sorted by float first, which Python compares natively, and since float() is correctly rounded,
+	only runs of values with equal floats can be out of order. Those runs are then sorted with exact comparisons. The sort is stable, like list.sort.
+	:param list values: The list to sort
+	:param bool reverse: Sort from largest to smallest
+	"""
+	order = argsort_exact(values, reverse)
+	values[:] = [values[i] for i in order]
 
 
 if __name__ == "__main__":
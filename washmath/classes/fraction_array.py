@@ -0,0 +1,300 @@
+import numpy as np
+from math import lcm
+from .fraction import Fraction, _as_ratio, _gcd
+
+
+_INT64_MAX = 2 ** 63 - 1
+_object_gcd = np.frompyfunc(_gcd, 2, 1)  # np.gcd for object arrays, using gmpy2 for large values if it is installed
+_COMMON_DENOMINATOR_BITS = 256  # Past this, scaling every numerator to the common denominator costs more than adding in pairs
+
+
+def _to_array(values) -> np.ndarray:
+	"""
+	Creates an int64 array, or an object array of Python ints if a value does not fit in 64 bits
+	"""
+	if isinstance(values, np.ndarray) and values.dtype != object:
+		return values.astype(np.int64)
+	try:
+		return np.array(values, dtype=np.int64)
+	except OverflowError:
+		return np.array([int(value) for value in values], dtype=object)
+
+
+def _scalar(value:int) -> np.ndarray:
+	"""
+	:return: A zero dimensional array holding the value, int64 if it fits
+	"""
+	if -_INT64_MAX <= value <= _INT64_MAX:
+		return np.array(value, dtype=np.int64)
+	return np.array(value, dtype=object)
+
+
+def _magnitude(array:np.ndarray) -> int:
+	"""
+	:return: The largest absolute value in the array as a Python int
+	"""
+	if not array.size:
+		return 0
+	return max(int(array.max()), -int(array.min()))
+
+
+def _widen(*arrays) -> tuple:
+	"""
+	Converts the arrays to object dtype so that the next operation is done with Python ints and cannot overflow
+	"""
+	return tuple(array if array.dtype == object else array.astype(object) for array in arrays)
+
+
+def _normalize(numerators:np.ndarray, denominators:np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+	"""
+	Moves the signs to the numerators, reduces every pair by its gcd and goes back to int64 if the values fit.
+	:raise ZeroDivisionError: If any denominator is 0
+	"""
+	if (denominators == 0).any():
+		raise ZeroDivisionError("0 cannot be the denominator of a function")
+	negative = denominators < 0
+	if negative.any():
+		numerators = np.where(negative, -numerators, numerators)
+		denominators = np.where(negative, -denominators, denominators)
+
+	factor = _object_gcd(numerators, denominators) if numerators.dtype == object else np.gcd(numerators, denominators)
+	numerators = numerators // factor
+	denominators = denominators // factor
+
+	if numerators.dtype == object and _magnitude(numerators) <= _INT64_MAX and _magnitude(denominators) <= _INT64_MAX:
+		numerators = numerators.astype(np.int64)
+		denominators = denominators.astype(np.int64)
+	return numerators, denominators
+
+
+def _add(n1, d1, n2, d2, subtract=False):
+	if _magnitude(n1) * _magnitude(d2) + _magnitude(n2) * _magnitude(d1) > _INT64_MAX or _magnitude(d1) * _magnitude(d2) > _INT64_MAX:
+		n1, d1, n2, d2 = _widen(n1, d1, n2, d2)
+	if subtract:
+		return _normalize(n1 * d2 - n2 * d1, d1 * d2)
+	return _normalize(n1 * d2 + n2 * d1, d1 * d2)
+
+
+def _multiply(n1, d1, n2, d2):
+	if _magnitude(n1) * _magnitude(n2) > _INT64_MAX or _magnitude(d1) * _magnitude(d2) > _INT64_MAX:
+		n1, d1, n2, d2 = _widen(n1, d1, n2, d2)
+	return _normalize(n1 * n2, d1 * d2)
+
+
+def _cross(n1, d1, n2, d2):
+	"""
+	:return: The two cross products, n1 * d2 and n2 * d1, which compare the same way as the fractions since the denominators are positive
+	"""
+	if _magnitude(n1) * _magnitude(d2) > _INT64_MAX or _magnitude(n2) * _magnitude(d1) > _INT64_MAX:
+		n1, d1, n2, d2 = _widen(n1, d1, n2, d2)
+	return n1 * d2, n2 * d1
+
+
+class FractionArray(object):
+	"""
+	An array of exact fractions stored as a numpy array of numerators and a numpy array of denominators. The arrays are int64 and switch to object arrays of Python ints when a value would overflow.
+	"""
+	__slots__ = ("_numerators", "_denominators")
+	__hash__ = None
+	__array_ufunc__ = None  # Makes numpy arrays defer to the reflected operators below
+
+	def __init__(self, values=(), denominators=None):
+		"""
+		:param values: An iterable of ints, floats, and Fractions. If denominators is given, these are the numerators and must be ints.
+		:param denominators: The denominators matching the given numerators
+		"""
+		if denominators is None:
+			pairs = [(value._numerator, value._denominator) if isinstance(value, Fraction) else _as_ratio(value) for value in values]
+			numerators = _to_array([numerator for numerator, _ in pairs])
+			denominators = _to_array([denominator for _, denominator in pairs])
+		else:
+			numerators = _to_array(values)
+			denominators = _to_array(denominators)
+			if numerators.shape != denominators.shape:
+				raise ValueError(f"The numerators and denominators must be the same length. {len(numerators)} != {len(denominators)}")
+		if numerators.dtype != denominators.dtype:
+			numerators, denominators = _widen(numerators, denominators)
+		self._numerators, self._denominators = _normalize(numerators, denominators)
+
+	@classmethod
+	def _from_arrays(cls, numerators:np.ndarray, denominators:np.ndarray):
+		"""
+		Wraps arrays that are already normalized without checking them again
+		"""
+		array = object.__new__(cls)
+		array._numerators = numerators
+		array._denominators = denominators
+		return array
+
+	@property
+	def numerators(self) -> np.ndarray:
+		return self._numerators
+
+	@property
+	def denominators(self) -> np.ndarray:
+		return self._denominators
+
+	@property
+	def dtype(self):
+		"""The dtype of the numerator and denominator arrays, either int64 or object"""
+		return self._numerators.dtype
+
+	def _operand(self, other):
+		"""
+		:return: The numerators and denominators of the other operand as arrays, or None if it is not supported
+		"""
+		if isinstance(other, FractionArray):
+			if len(other) != len(self):
+				raise ValueError(f"The FractionArrays must be the same length. {len(self)} != {len(other)}")
+			return other._numerators, other._denominators
+		if isinstance(other, (list, tuple, np.ndarray)):
+			return self._operand(FractionArray(other))
+		try:
+			numerator, denominator = _as_ratio(other)
+		except (AttributeError, TypeError):
+			return None
+		return _scalar(numerator), _scalar(denominator)
+
+	# region Operator Overloads
+	def __len__(self):
+		return len(self._numerators)
+
+	def __iter__(self):
+		for numerator, denominator in zip(self._numerators, self._denominators):
+			yield Fraction(int(numerator), int(denominator))
+
+	def __getitem__(self, item):
+		if isinstance(item, (int, np.integer)):
+			return Fraction(int(self._numerators[item]), int(self._denominators[item]))
+		return FractionArray._from_arrays(self._numerators[item], self._denominators[item])
+
+	def __repr__(self):
+		return f"FractionArray([{', '.join(str(fraction) for fraction in self)}])"
+
+	def __add__(self, other):
+		operand = self._operand(other)
+		if operand is None:
+			return NotImplemented
+		return FractionArray._from_arrays(*_add(self._numerators, self._denominators, *operand))
+
+	def __radd__(self, other):
+		return self + other
+
+	def __sub__(self, other):
+		operand = self._operand(other)
+		if operand is None:
+			return NotImplemented
+		return FractionArray._from_arrays(*_add(self._numerators, self._denominators, *operand, subtract=True))
+
+	def __rsub__(self, other):
+		return -self + other
+
+	def __mul__(self, other):
+		operand = self._operand(other)
+		if operand is None:
+			return NotImplemented
+		return FractionArray._from_arrays(*_multiply(self._numerators, self._denominators, *operand))
+
+	def __rmul__(self, other):
+		return self * other
+
+	def __truediv__(self, other):
+		operand = self._operand(other)
+		if operand is None:
+			return NotImplemented
+		numerators, denominators = operand
+		return FractionArray._from_arrays(*_multiply(self._numerators, self._denominators, denominators, numerators))
+
+	def __rtruediv__(self, other):
+		return self.inverse * other
+
+	def __neg__(self):
+		return FractionArray._from_arrays(-self._numerators, self._denominators)
+
+	def __pos__(self):
+		return self
+
+	def __abs__(self):
+		return FractionArray._from_arrays(np.abs(self._numerators), self._denominators)
+
+	def _compare(self, other):
+		operand = self._operand(other)
+		if operand is None:
+			return None
+		return _cross(self._numerators, self._denominators, *operand)
+
+	def __lt__(self, other):
+		cross = self._compare(other)
+		return NotImplemented if cross is None else cross[0] < cross[1]
+
+	def __le__(self, other):
+		cross = self._compare(other)
+		return NotImplemented if cross is None else cross[0] <= cross[1]
+
+	def __gt__(self, other):
+		cross = self._compare(other)
+		return NotImplemented if cross is None else cross[0] > cross[1]
+
+	def __ge__(self, other):
+		cross = self._compare(other)
+		return NotImplemented if cross is None else cross[0] >= cross[1]
+
+	def __eq__(self, other):
+		cross = self._compare(other)
+		return NotImplemented if cross is None else cross[0] == cross[1]
+
+	def __ne__(self, other):
+		cross = self._compare(other)
+		return NotImplemented if cross is None else cross[0] != cross[1]
+
+	# endregion
+
+	@property
+	def inverse(self):
+		return FractionArray._from_arrays(*_normalize(self._denominators, self._numerators))
+
+	def sum(self) -> Fraction:
+		"""
+		Adds every element exactly. When the distinct denominators have a small common multiple, every numerator is scaled to it and summed in one pass.
+		Otherwise pairs of elements are added together with one vectorized step per level, so there are log2(n) numpy passes instead of n Fraction additions.
+		:return: The sum as a single Fraction
+		"""
+		numerators, denominators = self._numerators, self._denominators
+		if not len(numerators):
+			return Fraction(0)
+
+		common = 1
+		for denominator in np.unique(denominators):
+			common = lcm(common, int(denominator))
+			if common.bit_length() > _COMMON_DENOMINATOR_BITS:
+				break
+		else:
+			if common > _INT64_MAX or _magnitude(numerators) * (common // int(denominators.min())) * len(numerators) > _INT64_MAX:
+				numerators, denominators = _widen(numerators, denominators)
+			scale = common // denominators
+			return Fraction(int((numerators * scale).sum()), common)
+
+		while len(numerators) > 1:
+			if len(numerators) % 2:
+				numerators = np.append(numerators, 0)
+				denominators = np.append(denominators, 1)
+			numerators, denominators = _add(numerators[::2], denominators[::2], numerators[1::2], denominators[1::2])
+		return Fraction(int(numerators[0]), int(denominators[0]))
+
+	def dot(self, other) -> Fraction:
+		"""
+		:param FractionArray other: An array of the same length
+		:return: The exact sum of the element-wise products
+		"""
+		return (self * other).sum()
+
+	def tolist(self) -> list[Fraction]:
+		return list(self)
+
+	def to_float(self) -> np.ndarray:
+		"""
+		:return: A float64 array of the values
+		"""
+		if self.dtype == object:
+			return np.array([numerator / denominator for numerator, denominator in zip(self._numerators, self._denominators)], dtype=np.float64)
+		return self._numerators / self._denominators
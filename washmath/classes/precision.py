@@ -0,0 +1,128 @@
+from contextvars import ContextVar
+from ..class_tools import is_numeric
+from .fraction import Fraction
+
+
+class Precision(object):
+	"""
+	How the results of a long computation are stored, so the cost of each step stays fixed. Used by calc.euler, Polynomial, and StatList.
+	- Precision.EXACT keeps values as they are, so Fraction arithmetic stays exact and the denominators can grow with every step.
+	- Precision.bounded(max_denominator) replaces every result with the closest Fraction whose denominator is at most max_denominator.
+	- Precision.FLOAT converts every result to a float.
+
+	Functions that take a precision argument use the default when it is None. The default is Precision.EXACT and can be changed for the whole process
+	with set_default, or for a block of code with a with statement: with Precision.bounded(10 ** 6): ...
+	The with statement is kept in a contextvars.ContextVar, so it only changes the default for its own thread or asyncio task.
+	"""
+	__slots__ = ("_mode", "_max_denominator")
+	EXACT_MODE = "exact"
+	BOUNDED_MODE = "bounded"
+	FLOAT_MODE = "float"
+
+	def __init__(self, mode:str, max_denominator:int=None):
+		"""
+		:param str mode: One of "exact", "bounded", or "float"
+		:param int max_denominator: The largest denominator kept by the bounded mode
+		:raise ValueError: If the mode is unknown, or max_denominator is not a positive int for the bounded mode
+		"""
+		if mode not in (Precision.EXACT_MODE, Precision.BOUNDED_MODE, Precision.FLOAT_MODE):
+			raise ValueError(f"The mode must be exact, bounded, or float, not {mode}")
+		if mode == Precision.BOUNDED_MODE and (not isinstance(max_denominator, int) or max_denominator < 1):
+			raise ValueError(f"The bounded mode needs a max_denominator of at least 1, not {max_denominator}")
+		self._mode = mode
+		self._max_denominator = max_denominator if mode == Precision.BOUNDED_MODE else None
+
+	@classmethod
+	def bounded(cls, max_denominator:int):
+		"""
+		:param int max_denominator: The largest denominator a result may have
+		:return: A policy that rounds every result to the closest Fraction with a denominator no larger than max_denominator
+		"""
+		return cls(Precision.BOUNDED_MODE, max_denominator)
+
+	@property
+	def mode(self) -> str:
+		return self._mode
+
+	@property
+	def max_denominator(self) -> int:
+		"""The largest denominator kept by the bounded mode, None for the other modes"""
+		return self._max_denominator
+
+	@property
+	def is_float(self) -> bool:
+		return self._mode == Precision.FLOAT_MODE
+
+	def apply(self, value):
+		"""
+		:param value: A number. Anything that is not an int, float, or Fraction, such as a Trig, is returned unchanged.
+		:return: The value stored the way this policy says. Ints are already exact, so only the float mode changes them.
+		"""
+		if self._mode == Precision.EXACT_MODE or not (isinstance(value, (int, float, Fraction)) or is_numeric(value)):
+			return value
+		if self._mode == Precision.FLOAT_MODE:
+			return float(value)
+		if isinstance(value, Fraction):
+			return value.limit_denominator(self._max_denominator)
+		if isinstance(value, float):
+			return Fraction.from_float(value, self._max_denominator)
+		return value
+
+	@staticmethod
+	def default():
+		"""
+		:return: The policy used when a precision argument is None: the one of the innermost with block in this context, or else the process default
+		"""
+		override = _override.get()
+		return _default if override is None else override
+
+	@staticmethod
+	def set_default(precision) -> None:
+		"""
+		:param Precision precision: The policy to use when a precision argument is None, in every thread, outside of with blocks
+		"""
+		global _default
+		if not isinstance(precision, Precision):
+			raise TypeError(f"The precision must be a Precision, not {type(precision).__name__}")
+		_default = precision
+
+	@staticmethod
+	def resolve(precision):
+		"""
+		:param Precision|None precision: The precision argument of a function
+		:return: The given policy, or the default if it is None
+		"""
+		if precision is None:
+			return Precision.default()
+		if not isinstance(precision, Precision):
+			raise TypeError(f"The precision must be a Precision, not {type(precision).__name__}")
+		return precision
+
+	def __enter__(self):
+		_tokens.set(_tokens.get() + (_override.set(self),))
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		tokens = _tokens.get()
+		_tokens.set(tokens[:-1])
+		_override.reset(tokens[-1])
+
+	def __eq__(self, other):
+		if not isinstance(other, Precision):
+			return NotImplemented
+		return self._mode == other._mode and self._max_denominator == other._max_denominator
+
+	def __hash__(self):
+		return hash((self._mode, self._max_denominator))
+
+	def __repr__(self):
+		if self._mode == Precision.BOUNDED_MODE:
+			return f"Precision.bounded({self._max_denominator})"
+		return f"Precision.{self._mode.upper()}"
+
+
+Precision.EXACT = Precision(Precision.EXACT_MODE)
+Precision.FLOAT = Precision(Precision.FLOAT_MODE)
+_default = Precision.EXACT
+_override = ContextVar("precision_override", default=None)  # The policy of the innermost with block in this thread or task
+_tokens = ContextVar("precision_tokens", default=())  # The tokens that undo each open with block, innermost last
@@ -1,4 +1,8 @@
 from .statlist import StatList
+from .sketch import QuantileSketch
+from .summary import StatSummary
+from .weighted import WeightedStatList
+from .covariance import covariance_matrix, correlation_matrix
 from .anova import ANOVA
 from .lsr import Least_Squares_Regression as LSR
 from .r import R
@@ -1,7 +1,7 @@
 from sys import argv
 from re import search as match
 from .statlist import StatList
-from ..fraction import Fraction
+from ..classes import Fraction
 
 
 if __name__ == "__main__":
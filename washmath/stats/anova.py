@@ -1,25 +1,22 @@
 from .statlist import StatList
-from ..classes import Fraction
+from ..classes import Fraction, fsum_exact
 
 
 __ALL__ = ["ANOVA"]
 
 
 def calculate_sst(statlists:list[StatList]) -> tuple[Fraction, Fraction]:
-	mean = Fraction(0)
+	mean = fsum_exact(statlist.mean for statlist in statlists) / len(statlists)
 
-	for statlist in statlists:
-		mean += statlist.mean
-
-	mean /= len(statlists)
-
-	lst_total = sum([(statlist.mean - mean)**2 * len(statlist) for statlist in statlists], start=Fraction(0))
+	with Fraction.deferred_reduction():
+		lst_total = fsum_exact([(statlist.mean - mean)**2 * len(statlist) for statlist in statlists])
 
 	return lst_total, mean
 
 
 def calculate_sse(statlists:list[StatList]) -> Fraction:
-	return sum([statlist.variance * (len(statlist)-1) for statlist in statlists], start=Fraction(0))
+	with Fraction.deferred_reduction():
+		return fsum_exact([statlist.variance * (len(statlist)-1) for statlist in statlists])
 
 
 class ANOVA(object):
@@ -0,0 +1,188 @@
+"""
+Bootstrap confidence intervals for StatList.bootstrap. The resamples are drawn as blocks of indices with numpy and only the requested statistic
+is calculated on them, along the rows of each block, so no StatList is built per resample.
+
+The order statistics (median, Q1, Q3, IQR, min, max, range) are found on the indices themselves. Drawing positions of the sorted values is the same
+as drawing values, so each resample is a block row of positions, np.partition selects the ranks that are averaged, and only those ranks are looked up.
+The ends of the interval are resamples, so for an exact list they are exact values of the list. The other statistics are calculated on the float64
+array of the values.
+
+Every block has its own seed, spawned from the one seed with numpy.random.SeedSequence, and the blocks do not depend on how many workers there are,
+so the same seed gives the same interval with any number of processes.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil, floor
+import numpy as np
+from ..classes import Fraction
+from .statlist import _middle_ranks
+
+_BLOCK_ELEMENTS = 1 << 22  # The most indices drawn at a time, 32 MiB of int64
+_BLOCK_ROWS = 256  # The most resamples in a block, so there are enough blocks to share between the workers
+
+
+def _order_statistic(name:str, length:int) -> list:
+	"""
+	:return: (coefficient, ranks) pairs, where the statistic is the sum of each coefficient times the mean of the sorted values at its ranks
+	"""
+	half = length // 2
+	first, third = _middle_ranks(0, half), _middle_ranks(half + length % 2, half)
+	return {
+		"median": lambda: [(1, _middle_ranks(0, length))],
+		"Q1": lambda: [(1, first)],
+		"Q3": lambda: [(1, third)],
+		"IQR": lambda: [(1, third), (-1, first)],
+		"min": lambda: [(1, [0])],
+		"max": lambda: [(1, [length - 1])],
+		"range": lambda: [(1, [length - 1]), (-1, [0])],
+	}[name]()
+
+
+def _moment(name:str, block:np.ndarray) -> np.ndarray:
+	"""
+	:param np.ndarray block: One resample per row
+	:return: The statistic of every row
+	"""
+	if name == "mean":
+		return block.mean(axis=1)
+	if name == "sum":
+		return block.sum(axis=1)
+	if name == "average_deviation":
+		return np.abs(block - block.mean(axis=1, keepdims=True)).mean(axis=1)
+	variances = block.var(axis=1, ddof=1)
+	if name == "variance":
+		return variances
+	if name == "standard_deviation":
+		return np.sqrt(variances)
+	return np.sqrt(variances / block.shape[1])  # standard_error
+
+
+ORDER_STATISTICS = frozenset(("median", "Q1", "Q3", "IQR", "min", "max", "range"))
+STATISTICS = ORDER_STATISTICS | {"mean", "sum", "variance", "standard_deviation", "standard_error", "average_deviation"}
+
+_data = None  # The values, or sorted values, of the list being resampled in a worker process, set once by _initialize
+
+
+def _initialize(data:np.ndarray) -> None:
+	global _data
+	_data = data
+
+
+def _resample_block(statistic, rows:int, seed, data:np.ndarray=None) -> np.ndarray:
+	"""
+	Module level so a ProcessPoolExecutor can pickle it
+	:param statistic: The name of a statistic, or a function taking a 2D float64 array and returning the statistic of each row
+	:param int rows: How many resamples to draw
+	:param numpy.random.SeedSequence seed: The seed of this block
+	:param np.ndarray data: The float64 values, sorted for an order statistic. The ones given to _initialize if None
+	:return: The statistic of each resample, and for an order statistic the ranks it is found from, one row per resample
+	"""
+	data = _data if data is None else data
+	length = len(data)
+	indices = np.random.default_rng(seed).integers(0, length, size=(rows, length))
+	if callable(statistic):
+		return np.asarray(statistic(data[indices]), dtype=np.float64)
+	if statistic not in ORDER_STATISTICS:
+		return _moment(statistic, data[indices])
+	groups = _order_statistic(statistic, length)
+	ranks = sorted({rank for _, group in groups for rank in group})
+	selected = np.partition(indices, ranks, axis=1)[:, ranks]
+	values = data[selected]
+	columns = {rank: column for column, rank in enumerate(ranks)}
+	replicates = sum(coefficient * values[:, [columns[rank] for rank in group]].mean(axis=1) for coefficient, group in groups)
+	return np.column_stack((replicates, selected))
+
+
+def _exact_replicate(statistic:str, sorted_values, ranks, precision):
+	"""
+	:param ranks: The ranks a replicate of an order statistic was found from, in the order _resample_block selected them
+	:return: The replicate calculated exactly from the sorted values of the list
+	"""
+	groups = _order_statistic(statistic, len(sorted_values))
+	columns = dict(zip(sorted({rank for _, group in groups for rank in group}), ranks))
+	value = sum(coefficient * Fraction(sum(Fraction(sorted_values[columns[rank]]) for rank in group), len(group)) for coefficient, group in groups)
+	return precision.apply(value)
+
+
+class Bootstrap(object):
+	"""
+	The bootstrap distribution of a statistic of a StatList and its percentile confidence interval, created by StatList.bootstrap
+	"""
+	__slots__ = ("statistic", "estimate", "low", "high", "ci", "distribution")
+
+	def __init__(self, statistic, estimate, low, high, ci, distribution:np.ndarray):
+		"""
+		:param statistic: The name of the statistic, or the function
+		:param estimate: The statistic of the whole list
+		:param low: The lower end of the confidence interval
+		:param high: The upper end of the confidence interval
+		:param ci: The confidence level, such as 0.95
+		:param np.ndarray distribution: The statistic of every resample, as floats
+		"""
+		self.statistic = statistic
+		self.estimate = estimate
+		self.low = low
+		self.high = high
+		self.ci = ci
+		self.distribution = distribution
+
+	@property
+	def interval(self) -> tuple:
+		return self.low, self.high
+
+	@property
+	def standard_error(self) -> float:
+		"""
+		:return: The standard deviation of the bootstrap distribution
+		"""
+		return float(self.distribution.std(ddof=1))
+
+	def __iter__(self):
+		return iter(self.interval)
+
+	def __repr__(self):
+		name = self.statistic if isinstance(self.statistic, str) else getattr(self.statistic, "__name__", "statistic")
+		return f"Bootstrap({name}={self.estimate}, {self.ci:.0%} CI=({self.low}, {self.high}), resamples={len(self.distribution)})"
+
+
+def bootstrap(statlist, statistic="median", n_resamples:int=10000, ci=0.95, seed=None, workers:int=None) -> Bootstrap:
+	"""
+	See StatList.bootstrap
+	"""
+	if isinstance(statistic, str) and statistic not in STATISTICS:
+		raise ValueError(f"Cannot bootstrap {statistic}. Use a function or one of {', '.join(sorted(STATISTICS))}")
+	if not 0 < ci < 1:
+		raise ValueError(f"ci must be between 0 and 1, not {ci}")
+	if n_resamples < 1:
+		raise ValueError(f"n_resamples must be at least 1, not {n_resamples}")
+	if len(statlist) < 2:
+		raise ValueError("Bootstrapping needs at least 2 values")
+
+	order = statistic in ORDER_STATISTICS
+	if statlist.precision.is_float:
+		data = statlist._statistic("_sorted_array" if order else "_array")
+	else:
+		data = np.asarray(statlist.sorted_view() if order else statlist, dtype=np.float64)
+	rows = max(1, min(_BLOCK_ROWS, _BLOCK_ELEMENTS // len(data)))
+	sizes = [min(rows, n_resamples - start) for start in range(0, n_resamples, rows)]
+	seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+	if workers is not None and workers > 1:
+		with ProcessPoolExecutor(workers, initializer=_initialize, initargs=(data,)) as executor:
+			blocks = list(executor.map(_resample_block, [statistic] * len(sizes), sizes, seeds))
+	else:
+		blocks = [_resample_block(statistic, size, block_seed, data) for size, block_seed in zip(sizes, seeds)]
+	results = np.concatenate(blocks)
+
+	distribution = results[:, 0] if order else results
+	tail = (1 - ci) / 2
+	ranking = np.argsort(distribution, kind="stable")
+	ends = ranking[[floor(tail * (n_resamples - 1)), ceil((1 - tail) * (n_resamples - 1))]]
+	if callable(statistic):
+		estimate = float(np.asarray(statistic(data[np.newaxis, :]))[0])
+	else:
+		estimate = getattr(statlist, statistic)
+	if order and not statlist.precision.is_float:
+		sorted_values = statlist.sorted_view()
+		low, high = (_exact_replicate(statistic, sorted_values, results[end, 1:].astype(np.int64).tolist(), statlist.precision) for end in ends)
+	else:
+		low, high = (float(distribution[end]) for end in ends)
+	return Bootstrap(statistic, estimate, low, high, ci, distribution)
@@ -0,0 +1,102 @@
+"""
+The covariance and correlation of every pair of several StatLists, found together instead of with StatList.covariance one pair at a time.
+With the float backend the lists are the columns of a centered matrix C and the covariance matrix is C.T @ C / n, one matrix product.
+Otherwise each list is centered once as a FractionArray and every pair is an exact FractionArray dot product.
+"""
+import numpy as np
+from ..classes import Fraction, Precision
+from .statlist import StatList
+
+
+def _columns(statlists) -> list:
+	"""
+	:return: The lists as StatLists
+	:raise ValueError: If there are no lists, or they are not all the same length with at least one value
+	"""
+	columns = [values if isinstance(values, StatList) else StatList(values) for values in statlists]
+	if not columns:
+		raise ValueError("At least one StatList is needed")
+	for values in columns:
+		if len(values) != len(columns[0]):
+			raise ValueError(f"The statlists must be the same length. {len(values)} != {len(columns[0])}")
+	if not len(columns[0]):
+		raise ValueError("Cannot find the covariance of empty StatLists")
+	return columns
+
+
+def _float_products(columns:list, chunk_size:int=None) -> np.ndarray:
+	"""
+	:param int chunk_size: If set, the centered matrix is built and multiplied this many rows at a time, so only chunk_size * len(columns) floats are copied at once
+	:return: The matrix of the sums of the products of the differences from the means
+	"""
+	arrays = [values._statistic("_array") if values.precision.is_float else np.asarray(values, dtype=np.float64) for values in columns]
+	means = np.array([array.mean() for array in arrays])
+	length = len(arrays[0])
+	chunk_size = chunk_size or length
+	products = np.zeros((len(arrays), len(arrays)))
+	for start in range(0, length, chunk_size):
+		block = np.column_stack([array[start:start + chunk_size] for array in arrays]) - means
+		products += block.T @ block
+	return products
+
+
+def _exact_products(columns:list, chunk_size:int=None) -> list:
+	"""
+	:param int chunk_size: If set, each list is centered this many values at a time instead of all at once
+	:return: The sums of the products of the differences from the means, as a list of lists of Fractions
+	"""
+	arrays = [values.to_fraction_array() for values in columns]
+	means = [array.sum() / len(array) for array in arrays]
+	length = len(arrays[0])
+	chunk_size = chunk_size or length
+	products = [[Fraction(0)] * len(arrays) for _ in arrays]
+	for start in range(0, length, chunk_size):
+		centered = [array[start:start + chunk_size] - mean for array, mean in zip(arrays, means)]
+		for i, row in enumerate(centered):
+			for j in range(i, len(centered)):
+				products[i][j] += row.dot(centered[j])
+	for i in range(len(arrays)):
+		for j in range(i):
+			products[i][j] = products[j][i]
+	return products
+
+
+def covariance_matrix(*statlists, sample:bool=False, precision:Precision=None, chunk_size:int=None):
+	"""
+	:param statlists: StatLists, or sequences of numbers, of the same length
+	:param bool sample: Divide by n - 1, like StatList.variance, instead of n, like StatList.covariance
+	:param Precision precision: How the results are calculated and stored. Defaults to the precision of the first StatList
+	:param int chunk_size: Work on this many rows at a time, to save memory when there are many long lists
+	:return: The covariance of every pair of lists, the variances on the diagonal. A float64 numpy array for the float backend, and a list of lists otherwise
+	:raise ValueError: If the lists are not the same length, or sample is True and there is only one row
+	"""
+	columns = _columns(statlists)
+	precision = Precision.resolve(precision if precision is not None else columns[0].precision)
+	divisor = len(columns[0]) - 1 if sample else len(columns[0])
+	if not divisor:
+		raise ValueError("The sample covariance needs at least 2 values in each list")
+	if precision.is_float:
+		return _float_products(columns, chunk_size) / divisor
+	return [[precision.apply(product / divisor) for product in row] for row in _exact_products(columns, chunk_size)]
+
+
+def correlation_matrix(*statlists, precision:Precision=None, chunk_size:int=None):
+	"""
+	:param statlists: StatLists, or sequences of numbers, of the same length
+	:param Precision precision: How the results are calculated and stored. Defaults to the precision of the first StatList
+	:param int chunk_size: Work on this many rows at a time, to save memory when there are many long lists
+	:return: The correlation coefficient of every pair of lists, the same value as stats.R. A float64 numpy array for the float backend, and a list of lists otherwise
+	:raise ValueError: If the lists are not the same length, or the values of a list are all the same
+	"""
+	columns = _columns(statlists)
+	precision = Precision.resolve(precision if precision is not None else columns[0].precision)
+	products = _float_products(columns, chunk_size) if precision.is_float else _exact_products(columns, chunk_size)
+	for i in range(len(columns)):
+		if not products[i][i]:
+			raise ValueError(f"StatList {i} has no correlation, since all of its values are the same")
+	if precision.is_float:
+		scale = np.sqrt(np.diag(products))
+		correlations = products / np.outer(scale, scale)
+		np.fill_diagonal(correlations, 1.0)
+		return np.clip(correlations, -1.0, 1.0)
+	return [[Fraction(1) if i == j else precision.apply(product / (products[i][i] * products[j][j]) ** 0.5) for j, product in enumerate(row)] for i, row in enumerate(products)]
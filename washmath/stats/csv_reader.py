@@ -0,0 +1,95 @@
+"""
+Reads the numeric columns of a csv file for StatList.fromCsv. The file is memory-mapped and parsed a chunk of lines at a time,
+each chunk with one call to numpy.fromstring, so the whole file is never split into Python strings.
+"""
+from io import BytesIO
+from mmap import mmap, ACCESS_READ
+from os.path import getsize
+import numpy as np
+
+CHUNK_SIZE = 1 << 26  # 64 MiB of the file is parsed at a time
+
+
+def _is_number(cell:str) -> bool:
+	try:
+		float(cell)
+	except ValueError:
+		return False
+	return True
+
+
+def _chunks(data, start:int, chunk_size:int):
+	"""
+	:return: A generator of pieces of data from start to the end, each ending at a line break
+	"""
+	while start < len(data):
+		end = min(start + chunk_size, len(data))
+		if end < len(data):
+			line_break = data.find(b"\n", end - 1)
+			end = len(data) if line_break == -1 else line_break + 1
+		yield data[start:end]
+		start = end
+
+
+def _parse_chunk(chunk:bytes, delimiter:str, width:int) -> np.ndarray:
+	"""
+	:return: The lines of the chunk as a 2D float64 array with width columns
+	:raise ValueError: If a cell is not a number or a line has the wrong number of cells
+	"""
+	chunk = chunk.rstrip(b"\r\n")
+	rows = chunk.count(b"\n") + 1 if chunk else 0
+	try:
+		values = np.fromstring(chunk.replace(b"\n", delimiter.encode()), dtype=np.float64, sep=delimiter)
+	except ValueError:
+		values = None
+	if values is not None and values.size == rows * width:
+		return values.reshape(rows, width)
+	# Blank lines or a bad cell. loadtxt skips the blank lines, and says which line is wrong
+	values = np.loadtxt(BytesIO(chunk), delimiter=delimiter, dtype=np.float64, ndmin=2)
+	if values.size and values.shape[1] != width:
+		raise ValueError(f"Every line must have {width} values, not {values.shape[1]}")
+	return values.reshape(-1, width)
+
+
+def read_columns(path:str, delimiter:str=",", columns=None, chunk_size:int=CHUNK_SIZE):
+	"""
+	If any cell of the first line is not a number, the first line is the header. A column whose header cell is a number keeps it as its first value and has no title.
+	:param str path: The path to the file
+	:param str delimiter: The delimiter of the file
+	:param columns: The indices or titles of the columns to read, in the order to return them. Every column if None
+	:param int chunk_size: About how many bytes are parsed at a time
+	:return: The titles and the float64 array of each column. None if the file is empty
+	:raise ValueError: If a cell is not a number, or a column is not in the file
+	"""
+	if not getsize(path):
+		return None
+	with open(path, "rb") as file, mmap(file.fileno(), 0, access=ACCESS_READ) as data:
+		line_break = data.find(b"\n")
+		header_end = len(data) if line_break == -1 else line_break + 1
+		header = [cell.strip() for cell in data[:header_end].decode("utf-8").rstrip("\r\n").split(delimiter)]
+		width = len(header)
+		if all(map(_is_number, header)):
+			titles, first, start = [""] * width, [None] * width, 0
+		else:
+			titles = [cell if not _is_number(cell) else "" for cell in header]
+			first = [float(cell) if _is_number(cell) else None for cell in header]
+			start = header_end
+		parts = [_parse_chunk(chunk, delimiter, width) for chunk in _chunks(data, start, chunk_size)]
+
+	rows = np.concatenate(parts) if parts else np.empty((0, width))
+	if columns is None:
+		columns = range(width)
+	indices = []
+	for column in columns:
+		if isinstance(column, str):
+			if column not in titles:
+				raise ValueError(f"There is no column titled {column} in {path}")
+			column = titles.index(column)
+		elif not -width <= column < width:
+			raise ValueError(f"Column {column} is out of range for {width} columns")
+		indices.append(column % width)
+	arrays = []
+	for index in indices:
+		array = rows[:, index]
+		arrays.append(array if first[index] is None else np.concatenate(([first[index]], array)))
+	return [titles[index] for index in indices], arrays
@@ -0,0 +1,204 @@
+from numbers import Integral
+import numpy as np
+from ..class_tools import is_numeric
+from ..classes import Fraction, FractionArray
+from .statlist import StatList
+
+
+class StatExpression(object):
+	"""
+	Element-wise arithmetic on a StatList that is only evaluated when evaluate is called, created by StatList.lazy.
+	Unlike on a StatList, + and - add and subtract element-wise, so ((x.lazy() - x.mean) ** 2 / n).evaluate() builds one StatList instead of three.
+	The whole chain runs on the float64 array of the float backend, or on a FractionArray for the exact backends.
+
+	While every step is a multiplication, division, addition, or subtraction by a number, the result is a * x + b, and the statistics of x that were
+	already calculated are carried over without looking at the values again: the mean becomes a * mean + b, the variance a ** 2 * variance, and so on.
+	"""
+	__slots__ = ("_source", "_steps", "_scale", "_shift")
+
+	def __init__(self, source, steps=(), scale=1, shift=0):
+		"""
+		:param StatList source: The data
+		:param steps: (function, operand) pairs applied in order, where the operand is a number or an array of the same length
+		:param scale: a, if the steps so far are a * x + b. None otherwise
+		:param shift: b, if the steps so far are a * x + b
+		"""
+		self._source = source
+		self._steps = tuple(steps)
+		self._scale = scale
+		self._shift = shift
+
+	def __len__(self):
+		return len(self._source)
+
+	def _operand(self, other):
+		"""
+		:return: A number, with a float converted the way the StatList stores its values, or a sequence of the same length as an array for the backend
+		:raise ValueError: If the sequence is not the same length
+		"""
+		if is_numeric(other):
+			return self._source._convert(other) if isinstance(other, float) else other
+		if isinstance(other, StatExpression):
+			other = other.evaluate()
+		if len(other) != len(self):
+			raise ValueError(f"The length of the operand does not match the length of the StatList. {len(other)} != {len(self)}")
+		if self._source.precision.is_float:
+			return np.asarray(other, dtype=np.float64)
+		return other if isinstance(other, FractionArray) else FractionArray(other)
+
+	def _then(self, function, other, scale=None):
+		"""
+		:param function: Takes the values so far and the operand
+		:param scale: A function giving the new (a, b) from the old ones and the operand, if a number operand keeps the result affine
+		:return: A new expression with one more step
+		"""
+		operand = self._operand(other)
+		affine = self._scale is not None and scale is not None and is_numeric(operand)
+		new_scale, new_shift = scale(self._scale, self._shift, operand) if affine else (None, None)
+		return StatExpression(self._source, self._steps + ((function, operand),), new_scale, new_shift)
+
+	# region Operator Overloads
+	def __add__(self, other):
+		return self._then(_add, other, lambda a, b, c: (a, b + c))
+
+	def __radd__(self, other):
+		return self + other
+
+	def __sub__(self, other):
+		return self._then(_subtract, other, lambda a, b, c: (a, b - c))
+
+	def __rsub__(self, other):
+		return -self + other
+
+	def __mul__(self, other):
+		return self._then(_multiply, other, lambda a, b, c: (a * c, b * c))
+
+	def __rmul__(self, other):
+		return self * other
+
+	def __truediv__(self, other):
+		return self._then(_divide, other, lambda a, b, c: (a / c, b / c) if isinstance(c, (float, Fraction)) else (Fraction(a, c), Fraction(b, c)))
+
+	def __rtruediv__(self, other):
+		return self._then(_divide_into, other)
+
+	def __pow__(self, other):
+		return self._then(_power, other)
+
+	def __neg__(self):
+		return self * -1
+
+	def __pos__(self):
+		return self
+
+	def __abs__(self):
+		return self._then(_absolute, 0)
+
+	# endregion
+
+	def _values(self):
+		"""
+		:return: The result of every step, as a float64 array or a FractionArray
+		"""
+		if self._source.precision.is_float:
+			values = self._source._statistic("_array")
+		else:
+			values = self._source.to_fraction_array()
+		for function, operand in self._steps:
+			values = function(values, operand)
+		return values
+
+	def _derived_statistics(self) -> dict:
+		"""
+		:return: The statistics of a * x + b found from the statistics of x that were already calculated, keyed by the attribute they are cached in
+		"""
+		a, b = self._scale, self._shift
+		cached = self._source.__dict__
+		if a is None or a == 0 or not len(self) or type(self._source) is not StatList:
+			return {}  # A subclass such as WeightedStatList calculates its statistics differently, so they would not describe the StatList that is returned
+		size = abs(a)
+		low, high = ("_min", "_max") if a > 0 else ("_max", "_min")
+		first, third = ("_Q1", "_Q3") if a > 0 else ("_Q3", "_Q1")
+		derived = {
+			"_sum": lambda: a * cached["_sum"] + b * len(self),
+			"_mean": lambda: a * cached["_mean"] + b,
+			"_mode": lambda: a * cached["_mode"] + b,
+			"_min": lambda: a * cached[low] + b,
+			"_max": lambda: a * cached[high] + b,
+			"_median": lambda: a * cached["_median"] + b,
+			"_Q1": lambda: a * cached[first] + b,
+			"_Q3": lambda: a * cached[third] + b,
+			"_range": lambda: size * cached["_range"],
+			"_IQR": lambda: size * cached["_IQR"],
+			"_variance": lambda: a * a * cached["_variance"],
+			"_standardDeviation": lambda: size * cached["_standardDeviation"],
+			"_standardError": lambda: size * cached["_standardError"],
+			"_averageDeviation": lambda: size * cached["_averageDeviation"],
+		}
+		sources = {"_min": low, "_max": high, "_Q1": first, "_Q3": third}
+		precision = self._source.precision
+		return {name: precision.apply(statistic()) for name, statistic in derived.items() if sources.get(name, name) in cached and cached[sources.get(name, name)] is not None}
+
+	def evaluate(self, title="", incremental=False):
+		"""
+		:param str title: The title of the new StatList
+		:param bool incremental: If the new StatList keeps running moments, see StatList
+		:return: A StatList of the results, with the same precision as the source
+		"""
+		source = self._source
+		values = self._values()
+		statistics = self._derived_statistics()
+		if source.precision.is_float:
+			statistics["_array"] = values
+			values = values.tolist()
+		else:
+			values = [source.precision.apply(value) for value in values]
+		return StatList._from_summary(values, statistics, title=title, allow_fractions=source.allow_fractions, precision=source.precision, incremental=incremental)
+
+	def __repr__(self):
+		return f"StatExpression(steps={len(self._steps)}, affine={self._scale is not None})"
+
+
+def _add(values, operand):
+	return values + operand
+
+
+def _subtract(values, operand):
+	return values - operand
+
+
+def _multiply(values, operand):
+	return values * operand
+
+
+def _divide(values, operand):
+	return values / operand
+
+
+def _divide_into(values, operand):
+	return operand / values
+
+
+def _power(values, operand):
+	"""
+	Raises a FractionArray to a whole number power exactly by squaring, and any other power one element at a time
+	"""
+	if not isinstance(values, FractionArray):
+		return values ** operand
+	if isinstance(operand, Integral) and not isinstance(operand, bool):
+		if operand < 0:
+			values, operand = values.inverse, -operand
+		result = FractionArray([1] * len(values))
+		while operand:
+			if operand & 1:
+				result = result * values
+			values = values * values
+			operand >>= 1
+		return result
+	if isinstance(operand, FractionArray):
+		return FractionArray([value ** exponent for value, exponent in zip(values, operand)])
+	return FractionArray([value ** operand for value in values])
+
+
+def _absolute(values, _):
+	return abs(values)
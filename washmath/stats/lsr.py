@@ -26,8 +26,9 @@ class Least_Squares_Regression(object):
 		self.x = x
 		self.y = y
 
-		s_xy = sum([(x1-x.mean) * (y1-y.mean) for x1, y1 in zip(x, y)], start=Fraction(0))
-		s_xx = sum([(x1-x.mean) * (x1-x.mean) for x1 in x], start=Fraction(0))
+		x_differences = self.x.to_fraction_array() - self.x.mean
+		s_xy = x_differences.dot(self.y.to_fraction_array() - self.y.mean)
+		s_xx = x_differences.dot(x_differences)
 		self._b1 = s_xy / s_xx
 		self._b0 = self.y.mean - (self._b1 * self.x.mean)
 		self._r = R(self.x, self.y).r
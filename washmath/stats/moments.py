@@ -0,0 +1,88 @@
+from ..classes import Fraction
+
+
+class RunningMoments(object):
+	"""
+	The count, sum, mean, sum of squared differences from the mean (M2), min, and max of a stream of values, updated in O(1) per value with Welford's method.
+	Two sets of moments are combined with Chan's method. The arithmetic is exact when the values are Fractions or ints, and float otherwise.
+	"""
+	__slots__ = ("count", "sum", "mean", "m2", "min", "max")
+
+	def __init__(self, values=(), exact=True):
+		"""
+		:param values: An iterable of numbers to start with
+		:param bool exact: Keep the sum, mean, and M2 as Fractions. If False they are floats
+		"""
+		self.count = 0
+		self.sum = Fraction(0) if exact else 0.0
+		self.mean = Fraction(0) if exact else 0.0
+		self.m2 = Fraction(0) if exact else 0.0
+		self.min = None
+		self.max = None
+		for value in values:
+			self.add(value)
+
+	@classmethod
+	def from_array(cls, array):
+		"""
+		:param numpy.ndarray array: A float64 array
+		:return: The float moments of the array, calculated with numpy instead of one value at a time
+		"""
+		moments = cls(exact=False)
+		if len(array):
+			moments.count = len(array)
+			moments.sum = float(array.sum())
+			moments.mean = moments.sum / moments.count
+			moments.m2 = float(((array - moments.mean) ** 2).sum())
+			moments.min = float(array.min())
+			moments.max = float(array.max())
+		return moments
+
+	def add(self, value) -> None:
+		"""
+		:param value: The next number in the stream
+		"""
+		self.count += 1
+		self.sum += value
+		delta = value - self.mean
+		self.mean += delta / self.count
+		self.m2 += delta * (value - self.mean)
+		if self.min is None or value < self.min:
+			self.min = value
+		if self.max is None or value > self.max:
+			self.max = value
+
+	def copy(self):
+		"""
+		:return: Moments with the same values, which can be changed without changing these
+		"""
+		moments = RunningMoments.__new__(RunningMoments)
+		moments.count, moments.sum, moments.mean, moments.m2, moments.min, moments.max = self.count, self.sum, self.mean, self.m2, self.min, self.max
+		return moments
+
+	def merge(self, other) -> None:
+		"""
+		Adds every value counted by other, as if they had been added one at a time
+		:param RunningMoments other: The moments of another part of the stream
+		"""
+		if not other.count:
+			return
+		if not self.count:
+			self.count, self.sum, self.mean, self.m2, self.min, self.max = other.count, other.sum, other.mean, other.m2, other.min, other.max
+			return
+		count = self.count + other.count
+		delta = other.mean - self.mean
+		self.mean += delta * other.count / count
+		self.m2 += other.m2 + delta * delta * self.count * other.count / count
+		self.count = count
+		self.sum += other.sum
+		self.min = other.min if other.min < self.min else self.min
+		self.max = other.max if other.max > self.max else self.max
+
+	@property
+	def variance(self):
+		"""
+		:return: The sample variance, M2 / (count - 1)
+		:raise ZeroDivisionError: If fewer than 2 values were added
+		"""
+		return self.m2 / (self.count - 1)
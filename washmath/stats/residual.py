@@ -4,7 +4,7 @@ __author__ = "Len Washington III"
 
 from .statlist import StatList
 from .lsr import Least_Squares_Regression
-from ..classes import Fraction
+from ..classes import Fraction, fsum_exact
 
 
 class Residual(object):
@@ -31,7 +31,8 @@ class Residual(object):
 	@property
 	def sse(self) -> Fraction:
 		# return sum([(yi - self.prediction.y_intercept - (self.prediction.slope*xi))**2 for xi, yi in zip(self.x, self.y)], start=Fraction(0))
-		return sum([(yi - self.prediction.predict(xi))**2 for xi, yi in zip(self.x, self.y)], start=Fraction(0))
+		with Fraction.deferred_reduction():
+			return fsum_exact([(yi - self.prediction.predict(xi))**2 for xi, yi in zip(self.x, self.y)])
 
 	def _diff_sum(self) -> Fraction:
 		"""
@@ -0,0 +1,239 @@
+from collections import Counter, deque
+from heapq import heappush, heappop
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from ..classes import Fraction, FractionArray, fsum_exact
+
+_BLOCK_ELEMENTS = 1 << 22  # The most values of the windows that are centered at a time by Rolling.var
+
+
+class Rolling(object):
+	"""
+	Statistics of every full window of a StatList, created by StatList.rolling. Each method returns one value per window, n - window + 1 in all,
+	as a float64 numpy array for the float backend or a FractionArray otherwise. Every window is updated from the last one in O(1) amortized time
+	(O(log window) for the median) instead of being calculated again, except the float variance, which centers each window to stay accurate.
+	"""
+	__slots__ = ("_statlist", "window")
+
+	def __init__(self, statlist, window:int):
+		"""
+		:param StatList statlist: The data
+		:param int window: How many consecutive values are in each window
+		:raise ValueError: If the window is not between 1 and the length of the list
+		"""
+		if not isinstance(window, int) or not 1 <= window <= len(statlist):
+			raise ValueError(f"The window must be an int from 1 to {len(statlist)}, not {window}")
+		self._statlist = statlist
+		self.window = window
+
+	def _result(self, values):
+		"""
+		:return: The values as a float64 array for the float backend, and otherwise as a FractionArray after applying the precision
+		"""
+		precision = self._statlist.precision
+		if precision.is_float:
+			return np.asarray(values, dtype=np.float64)
+		return FractionArray([precision.apply(value) for value in values])
+
+	def _sums(self) -> tuple:
+		"""
+		:return: The sum and the sum of squares of every window, shifted by the first value for the float backend so that the cumulative sums do not lose precision
+		"""
+		window = self.window
+		if self._statlist.precision.is_float:
+			values = self._statlist._statistic("_array")
+			shifted = values - values[0]
+			sums = np.concatenate(([0.0], shifted.cumsum()))
+			squares = np.concatenate(([0.0], (shifted * shifted).cumsum()))
+			return sums[window:] - sums[:-window], squares[window:] - squares[:-window]
+		values = self._statlist
+		total = fsum_exact(values[:window])
+		squares = fsum_exact(value * value for value in values[:window])
+		sums, square_sums = [total], [squares]
+		for new, old in zip(values[window:], values):
+			total += new - old
+			squares += new * new - old * old
+			sums.append(total)
+			square_sums.append(squares)
+		return sums, square_sums
+
+	def mean(self):
+		sums, _ = self._sums()
+		if self._statlist.precision.is_float:
+			return sums / self.window + self._statlist._statistic("_array")[0]
+		return self._result([Fraction(total, self.window) for total in sums])
+
+	def var(self):
+		"""
+		:return: The sample variance of every window, dividing by window - 1 like StatList.variance
+		:raise ValueError: If the window is 1
+		"""
+		if self.window < 2:
+			raise ValueError("The variance needs a window of at least 2")
+		if self._statlist.precision.is_float:
+			return self._float_var()
+		sums, squares = self._sums()
+		return self._result([(square - total * total / self.window) / (self.window - 1) for total, square in zip(sums, squares)])
+
+	def _float_var(self) -> np.ndarray:
+		"""
+		Centers every window on its own mean before squaring, a block of windows at a time, so a large offset or a trend does not cancel
+		the way the difference of cumulative sums of squares does. O(window) per window, but vectorized.
+		"""
+		windows = sliding_window_view(self._statlist._statistic("_array"), self.window)
+		block = max(1, _BLOCK_ELEMENTS // self.window)
+		variances = np.empty(len(windows))
+		for start in range(0, len(windows), block):
+			part = windows[start:start + block]
+			centered = part - part.mean(axis=1, keepdims=True)
+			variances[start:start + block] = np.einsum("ij,ij->i", centered, centered) / (self.window - 1)
+		return variances
+
+	def std(self):
+		"""
+		:return: The sample standard deviation of every window
+		:raise ValueError: If the window is 1
+		"""
+		variances = self.var()
+		if self._statlist.precision.is_float:
+			return np.sqrt(variances)
+		return self._result([variance ** 0.5 for variance in variances])
+
+	def _extreme(self, smallest:bool):
+		"""
+		Keeps the indices of the values that can still be the extreme of a window in a deque, in order. Each index is added and removed once.
+		"""
+		values = self._statlist._statistic("_array").tolist() if self._statlist.precision.is_float else self._statlist
+		window = self.window
+		candidates = deque()
+		extremes = []
+		for i, value in enumerate(values):
+			while candidates and (values[candidates[-1]] >= value if smallest else values[candidates[-1]] <= value):
+				candidates.pop()
+			candidates.append(i)
+			if candidates[0] <= i - window:
+				candidates.popleft()
+			if i >= window - 1:
+				extremes.append(values[candidates[0]])
+		return self._result(extremes)
+
+	def min(self):
+		return self._extreme(smallest=True)
+
+	def max(self):
+		return self._extreme(smallest=False)
+
+	def median(self):
+		"""
+		Keeps the smaller half of the window in a max heap and the larger half in a min heap. A value that leaves the window is only counted as removed,
+		and is popped once it reaches the top of its heap.
+		"""
+		values = self._statlist._statistic("_array").tolist() if self._statlist.precision.is_float else self._statlist
+		window = self.window
+		low, high = [], []  # low holds the negated smaller half, so its top is the largest value of that half
+		removed = Counter()
+		sizes = [0, 0]  # The number of values of the window in low and high
+
+		def prune(heap, negated):
+			while heap and removed[-heap[0] if negated else heap[0]]:
+				removed[-heap[0] if negated else heap[0]] -= 1
+				heappop(heap)
+
+		def balance():
+			if sizes[0] > sizes[1] + 1:
+				heappush(high, -heappop(low))
+				sizes[0] -= 1
+				sizes[1] += 1
+				prune(low, True)
+			elif sizes[0] < sizes[1]:
+				heappush(low, -heappop(high))
+				sizes[0] += 1
+				sizes[1] -= 1
+				prune(high, False)
+
+		medians = []
+		for i, value in enumerate(values):
+			if not low or value <= -low[0]:
+				heappush(low, -value)
+				sizes[0] += 1
+			else:
+				heappush(high, value)
+				sizes[1] += 1
+			balance()
+			if i >= window:
+				old = values[i - window]
+				removed[old] += 1
+				if old <= -low[0]:
+					sizes[0] -= 1
+					prune(low, True)
+				else:
+					sizes[1] -= 1
+					prune(high, False)
+				balance()
+			if i >= window - 1:
+				medians.append(-low[0] if window % 2 else (-low[0] + high[0]) / 2)
+		return self._result(medians)
+
+
+class EWM(object):
+	"""
+	Exponentially weighted statistics of a StatList, created by StatList.ewm. Each value updates the last result, m = (1 - alpha) * m + alpha * x,
+	so every method returns one value per value of the list in O(n). The variance is the biased exponentially weighted variance of the same recursion.
+	The results are a float64 array for the float backend and a FractionArray otherwise. With Precision.EXACT the denominators grow with every value,
+	so a bounded precision is recommended for long exact lists.
+	"""
+	__slots__ = ("_statlist", "alpha")
+
+	def __init__(self, statlist, alpha=None, span=None):
+		"""
+		:param StatList statlist: The data
+		:param alpha: The weight of each new value, between 0 and 1
+		:param span: Sets alpha to 2 / (span + 1) instead
+		:raise ValueError: If neither or both of alpha and span are given, or alpha is not in (0, 1]
+		"""
+		if (alpha is None) == (span is None):
+			raise ValueError("Give exactly one of alpha and span")
+		if span is not None:
+			if span < 1:
+				raise ValueError(f"The span must be at least 1, not {span}")
+			alpha = Fraction(2, span + 1) if isinstance(span, int) else 2 / (span + 1)
+		if not 0 < alpha <= 1:
+			raise ValueError(f"alpha must be greater than 0 and at most 1, not {alpha}")
+		self._statlist = statlist
+		self.alpha = float(alpha) if statlist.precision.is_float else Fraction(alpha)
+
+	def _moments(self, variance:bool) -> tuple:
+		"""
+		:return: The weighted mean after each value, and the weighted variance if variance is True
+		"""
+		precision = self._statlist.precision
+		values = self._statlist._statistic("_array").tolist() if precision.is_float else self._statlist
+		alpha = self.alpha
+		means, variances = [], []
+		mean, spread = values[0] if values else 0, 0
+		for value in values:
+			difference = value - mean
+			increment = alpha * difference
+			mean = precision.apply(mean + increment)
+			means.append(mean)
+			if variance:
+				spread = precision.apply((1 - alpha) * (spread + difference * increment))
+				variances.append(spread)
+		return means, variances
+
+	def _result(self, values):
+		if self._statlist.precision.is_float:
+			return np.asarray(values, dtype=np.float64)
+		return FractionArray(values)
+
+	def mean(self):
+		return self._result(self._moments(variance=False)[0])
+
+	def var(self):
+		return self._result(self._moments(variance=True)[1])
+
+	def std(self):
+		variances = self._moments(variance=True)[1]
+		if self._statlist.precision.is_float:
+			return np.sqrt(np.asarray(variances))
+		return self._result([self._statlist.precision.apply(variance ** 0.5) for variance in variances])
@@ -0,0 +1,254 @@
+"""
+The binary format used by StatList.to_bytes, from_bytes, save, and load. Every number is little endian.
+
+	header     4s magic, B format version, B value encoding, B precision mode, B flags (SUMMARY, NO_FRACTIONS, INCREMENTAL), Q max denominator, Q length, I title length
+	title      UTF-8, followed by padding so the values start on a multiple of 8 bytes
+	values     INT64:   the numerators as int64, then the denominators as int64
+	           VARINT:  Q byte length, then a numerator and denominator pair per value, written with fraction._write_int
+	           FLOAT64: the values as float64
+	summary    Only if the SUMMARY flag is set. Q byte length, then one tagged value per name in SUMMARY_ATTRIBUTES, None for a statistic the list is too short for
+
+The int64 and float64 columns are read with numpy.frombuffer, so loading them from a memory-mapped file does not copy the file.
+
+StatSummary.to_bytes and from_bytes use a smaller format:
+
+	header     4s magic, B format version, B flags (SUMMARY_EXACT, SUMMARY_SKETCH)
+	moments    One tagged value for each of the count, sum, mean, M2, min, and max
+	sketch     Only if the SUMMARY_SKETCH flag is set. The compression and the number of centroids as varints, then the centroid means and weights as float64
+"""
+from struct import Struct
+from numpy import frombuffer, array as np_array, integer, floating
+from ..classes import Fraction, Precision
+from ..classes.fraction import _as_ratio, _write_int, _read_int
+
+MAGIC = b"WMSL"
+VERSION = 1
+INT64, VARINT, FLOAT64 = 0, 1, 2
+SUMMARY = 0x01
+NO_FRACTIONS = 0x02  # allow_fractions was False
+INCREMENTAL = 0x04
+SUMMARY_MAGIC = b"WMSS"
+SUMMARY_EXACT = 0x01
+SUMMARY_SKETCH = 0x02
+_HEADER = Struct("<4sBBBBQQI")
+_SUMMARY_HEADER = Struct("<4sBB")
+_MOMENTS = ("count", "sum", "mean", "m2", "min", "max")
+_LENGTH = Struct("<Q")
+_FLOAT = Struct("<d")
+_INT64_MAX = 2 ** 63 - 1
+_PRECISION_MODES = (Precision.EXACT_MODE, Precision.BOUNDED_MODE, Precision.FLOAT_MODE)
+SUMMARY_ATTRIBUTES = (
+	"_sum", "_mean", "_mode", "_min", "_max", "_median", "_standardDeviation", "_Q1", "_Q3", "_range", "_IQR",
+	"_outlier_range", "_averageDeviation", "_variance", "_standardError",
+)  # The outliers are found again from the outlier range when loading, since they can be as long as the data
+_NONE, _INT, _FRACTION, _FLOAT_TAG, _TUPLE = range(5)
+
+
+def _write_value(buffer:bytearray, value) -> None:
+	"""
+	Appends a tag byte and the value. Supports None, ints, Fractions, floats, and tuples of those.
+	"""
+	if value is None:
+		buffer.append(_NONE)
+	elif isinstance(value, Fraction):
+		buffer.append(_FRACTION)
+		numerator, denominator = value._terms()
+		_write_int(buffer, numerator)
+		_write_int(buffer, denominator)
+	elif isinstance(value, (int, integer)):
+		buffer.append(_INT)
+		_write_int(buffer, int(value))
+	elif isinstance(value, (float, floating)):
+		buffer.append(_FLOAT_TAG)
+		buffer += _FLOAT.pack(value)
+	elif isinstance(value, tuple):
+		buffer.append(_TUPLE)
+		_write_int(buffer, len(value))
+		for item in value:
+			_write_value(buffer, item)
+	else:
+		raise TypeError(f"Cannot write a {type(value).__name__} to a StatList summary")
+
+
+def _read_value(data, offset:int) -> tuple:
+	"""
+	:return: The value written by _write_value at the offset, and the offset right after it
+	"""
+	tag = data[offset]
+	offset += 1
+	if tag == _NONE:
+		return None, offset
+	if tag == _INT:
+		return _read_int(data, offset)
+	if tag == _FRACTION:
+		numerator, offset = _read_int(data, offset)
+		denominator, offset = _read_int(data, offset)
+		return Fraction(numerator, denominator), offset
+	if tag == _FLOAT_TAG:
+		return _FLOAT.unpack_from(data, offset)[0], offset + _FLOAT.size
+	if tag == _TUPLE:
+		length, offset = _read_int(data, offset)
+		items = []
+		for _ in range(length):
+			item, offset = _read_value(data, offset)
+			items.append(item)
+		return tuple(items), offset
+	raise ValueError(f"Unknown value tag {tag} in a StatList summary")
+
+
+def _padding(offset:int) -> int:
+	return -offset % 8
+
+
+def dumps(statlist, summary=True, compact=False) -> bytes:
+	"""
+	:param StatList statlist: The data to write
+	:param bool summary: Also write the calculated statistics, so loading does not calculate them again
+	:param bool compact: Write the values as varints, which is smaller for small numerators and denominators but cannot be memory-mapped as columns
+	:return: The StatList in the binary format
+	"""
+	title = statlist.title.encode("utf-8")
+	precision = statlist.precision
+	body = bytearray()
+	if precision.is_float or all(isinstance(value, float) for value in statlist):
+		encoding = FLOAT64
+		body += np_array([float(value) for value in statlist], dtype="<f8").tobytes()
+	else:
+		ratios = [_as_ratio(value) for value in statlist]
+		if not compact and all(-_INT64_MAX <= numerator <= _INT64_MAX and denominator <= _INT64_MAX for numerator, denominator in ratios):
+			encoding = INT64
+			body += np_array([numerator for numerator, _ in ratios], dtype="<i8").tobytes()
+			body += np_array([denominator for _, denominator in ratios], dtype="<i8").tobytes()
+		else:
+			encoding = VARINT
+			pairs = bytearray()
+			for numerator, denominator in ratios:
+				_write_int(pairs, numerator)
+				_write_int(pairs, denominator)
+			body += _LENGTH.pack(len(pairs))
+			body += pairs
+
+	flags = 0 if statlist.allow_fractions else NO_FRACTIONS
+	if statlist.incremental:
+		flags |= INCREMENTAL
+	if summary and len(statlist):
+		flags |= SUMMARY
+		block = bytearray()
+		for name in SUMMARY_ATTRIBUTES:
+			try:
+				value = statlist._statistic(name)
+			except (ArithmeticError, IndexError, ValueError):  # Such as the quartiles or variance of a single value, which are left to raise again when read
+				value = None
+			_write_value(block, value)
+		body += _LENGTH.pack(len(block))
+		body += block
+
+	header = _HEADER.pack(MAGIC, VERSION, encoding, _PRECISION_MODES.index(precision.mode), flags, precision.max_denominator or 0, len(statlist), len(title))
+	padding = bytes(_padding(len(header) + len(title)))
+	return header + title + padding + bytes(body)
+
+
+def loads(data, cls):
+	"""
+	:param data: bytes, a memoryview, or an mmap holding a StatList written by dumps
+	:param type cls: The StatList class to create
+	:return: The StatList. If the data has a summary, its statistics are used instead of being calculated again.
+	:raise ValueError: If the data is not in this format
+	"""
+	if len(data) < _HEADER.size:
+		raise ValueError("The data is too short to be a StatList")
+	magic, version, encoding, mode, flags, max_denominator, length, title_length = _HEADER.unpack_from(data, 0)
+	if magic != MAGIC:
+		raise ValueError("The data is not a StatList")
+	if version > VERSION:
+		raise ValueError(f"The StatList was written by a newer version of the format, {version} > {VERSION}")
+	offset = _HEADER.size
+	title = bytes(data[offset:offset + title_length]).decode("utf-8")
+	offset += title_length
+	offset += _padding(offset)
+	mode = _PRECISION_MODES[mode]
+	precision = Precision.bounded(max_denominator) if mode == Precision.BOUNDED_MODE else Precision(mode)
+	allow_fractions = not flags & NO_FRACTIONS
+	incremental = bool(flags & INCREMENTAL)
+
+	if encoding == FLOAT64:
+		values = frombuffer(data, dtype="<f8", count=length, offset=offset).tolist()
+		offset += 8 * length
+	elif encoding == INT64:
+		numerators = frombuffer(data, dtype="<i8", count=length, offset=offset).tolist()
+		denominators = frombuffer(data, dtype="<i8", count=length, offset=offset + 8 * length).tolist()
+		values = list(map(Fraction, numerators, denominators))
+		offset += 16 * length
+	elif encoding == VARINT:
+		offset += _LENGTH.size
+		values = []
+		for _ in range(length):
+			numerator, offset = _read_int(data, offset)
+			denominator, offset = _read_int(data, offset)
+			values.append(Fraction(numerator, denominator))
+	else:
+		raise ValueError(f"Unknown value encoding {encoding}")
+
+	if not flags & SUMMARY:
+		return cls(values, title=title, allow_fractions=allow_fractions, precision=precision, incremental=incremental)
+
+	offset += _LENGTH.size
+	summary = {}
+	for name in SUMMARY_ATTRIBUTES:
+		value, offset = _read_value(data, offset)
+		if value is not None:
+			summary[name] = value
+	return cls._from_summary(values, summary, title=title, allow_fractions=allow_fractions, precision=precision, incremental=incremental)
+
+
+def dumps_summary(summary) -> bytes:
+	"""
+	:param StatSummary summary: The summary to write
+	:return: The summary in the binary format
+	"""
+	flags = SUMMARY_EXACT if summary.exact else 0
+	sketch = summary.sketch
+	if sketch is not None:
+		flags |= SUMMARY_SKETCH
+	body = bytearray(_SUMMARY_HEADER.pack(SUMMARY_MAGIC, VERSION, flags))
+	for name in _MOMENTS:
+		_write_value(body, getattr(summary.moments, name))
+	if sketch is not None:
+		centroids = sketch.centroids  # Merges the buffer first
+		_write_int(body, sketch.compression)
+		_write_int(body, centroids)
+		body += sketch._means.astype("<f8").tobytes()
+		body += sketch._weights.astype("<f8").tobytes()
+	return bytes(body)
+
+
+def loads_summary(data, cls):
+	"""
+	:param data: bytes written by dumps_summary
+	:param type cls: The StatSummary class to create
+	:return: The StatSummary
+	:raise ValueError: If the data is not in this format
+	"""
+	if len(data) < _SUMMARY_HEADER.size:
+		raise ValueError("The data is too short to be a StatSummary")
+	magic, version, flags = _SUMMARY_HEADER.unpack_from(data, 0)
+	if magic != SUMMARY_MAGIC:
+		raise ValueError("The data is not a StatSummary")
+	if version > VERSION:
+		raise ValueError(f"The StatSummary was written by a newer version of the format, {version} > {VERSION}")
+	summary = cls(exact=bool(flags & SUMMARY_EXACT))
+	offset = _SUMMARY_HEADER.size
+	for name in _MOMENTS:
+		value, offset = _read_value(data, offset)
+		setattr(summary.moments, name, value)
+	if flags & SUMMARY_SKETCH:
+		from .sketch import QuantileSketch
+		compression, offset = _read_int(data, offset)
+		centroids, offset = _read_int(data, offset)
+		summary.sketch = QuantileSketch(compression=compression)
+		summary.sketch._means = frombuffer(data, dtype="<f8", count=centroids, offset=offset).astype(float)
+		summary.sketch._weights = frombuffer(data, dtype="<f8", count=centroids, offset=offset + 8 * centroids).astype(float)
+		for name in _MOMENTS:  # The sketch keeps its own float copy of the moments
+			value = getattr(summary.moments, name)
+			setattr(summary.sketch._moments, name, value if name == "count" or value is None else float(value))
+	return summary
@@ -0,0 +1,227 @@
+from itertools import islice
+from math import pi
+import numpy as np
+from .moments import RunningMoments
+from .statlist import _summary_table
+
+
+class QuantileSketch(object):
+	"""
+	The quantiles of a stream that is too large to keep, estimated with a merging t-digest. The values are grouped into centroids, a mean and a weight each,
+	and the centroids are kept small near the ends of the distribution, so the tail quantiles such as p95 and p99 are more accurate than the median.
+	The memory is bounded by the compression, not the length of the stream. The count, sum, mean, variance, min, and max are kept exactly with RunningMoments.
+
+	Q1, median, Q3, IQR, outlier_range, and dataSummary work like they do on a StatList, so a stream can be summarized the same way as a list.
+	Q1 and Q3 are the 25th and 75th percentiles.
+	"""
+	__slots__ = ("title", "compression", "_means", "_weights", "_buffer", "_moments")
+	_BUFFER_FACTOR = 10  # Values are added to a buffer and merged into the centroids once it holds this many times the compression
+
+	def __init__(self, values=(), compression:int=100, title=""):
+		"""
+		:param values: An iterable of numbers to start with
+		:param int compression: Bounds the number of centroids to about compression / 2. Higher is more accurate and uses more memory.
+			The error of a quantile q is roughly proportional to sqrt(q * (1 - q)) / compression of the ranks
+		:param str title: A title or name for the stream
+		:raise ValueError: If the compression is less than 10
+		"""
+		if compression < 10:
+			raise ValueError(f"The compression must be at least 10, not {compression}")
+		self.title = title
+		self.compression = compression
+		self._means = np.empty(0)
+		self._weights = np.empty(0)
+		self._buffer = []
+		self._moments = RunningMoments(exact=False)
+		self.update(values)
+
+	def add(self, value) -> None:
+		"""
+		:param value: The next number in the stream
+		"""
+		value = float(value)
+		self._moments.add(value)
+		self._buffer.append(value)
+		if len(self._buffer) >= self._BUFFER_FACTOR * self.compression:
+			self._compress()
+
+	def update(self, values) -> None:
+		"""
+		Adds many values at once. An iterator is read a buffer at a time, so it does not have to fit in memory.
+		:param values: A numpy array or an iterable of numbers
+		"""
+		if isinstance(values, np.ndarray):
+			self._add_array(np.asarray(values, dtype=np.float64).ravel())
+			return
+		iterator = iter(values)
+		while True:
+			chunk = np.fromiter(islice(iterator, self._BUFFER_FACTOR * self.compression), dtype=np.float64)
+			if not len(chunk):
+				return
+			self._add_array(chunk)
+
+	def _add_array(self, array:np.ndarray) -> None:
+		self._moments.merge(RunningMoments.from_array(array))
+		self._compress(array)
+
+	def merge(self, other) -> None:
+		"""
+		Adds every value seen by other, such as the sketch of another part of the stream
+		:param QuantileSketch other: The sketch to add
+		"""
+		other._compress()
+		self._moments.merge(other._moments)
+		self._compress(other._means, other._weights)
+
+	def _compress(self, means:np.ndarray=None, weights:np.ndarray=None) -> None:
+		"""
+		Merges the buffer, and the given means and weights, into the centroids. Neighboring values are put in the same centroid while the k1 scale function,
+		compression / (2 pi) * asin(2q - 1), changes by less than 1 across it, which keeps the centroids at the ends small.
+		:param numpy.ndarray means: More values, or the means of more centroids
+		:param numpy.ndarray weights: The weight of each mean. 1 for each if None
+		"""
+		parts = [self._means, np.array(self._buffer, dtype=np.float64)]
+		part_weights = [self._weights, np.ones(len(self._buffer))]
+		if means is not None:
+			parts.append(means)
+			part_weights.append(np.ones(len(means)) if weights is None else weights)
+		self._buffer = []
+		means, weights = np.concatenate(parts), np.concatenate(part_weights)
+		if not len(means):
+			return
+		order = means.argsort(kind="stable")
+		means, weights = means[order], weights[order]
+		total = weights.sum()
+		centers = (weights.cumsum() - weights / 2) / total
+		groups = np.floor(self.compression / (2 * pi) * np.arcsin(2 * centers - 1)).astype(np.int64)
+		starts = np.flatnonzero(np.diff(groups, prepend=groups[0] - 1))
+		self._weights = np.add.reduceat(weights, starts)
+		self._means = np.add.reduceat(means * weights, starts) / self._weights
+
+	def __len__(self):
+		return self._moments.count
+
+	@property
+	def centroids(self) -> int:
+		"""The number of centroids kept, after merging the buffer"""
+		self._compress()
+		return len(self._means)
+
+	def quantile(self, probability:float) -> float:
+		"""
+		:param float probability: A number from 0 to 1, such as 0.99 for the 99th percentile
+		:return: The estimated quantile. While every centroid holds one value it is exact, interpolated the same way as StatList.quantiles
+		:raise ValueError: If nothing was added or the probability is not between 0 and 1
+		"""
+		return self.quantiles([probability])[0]
+
+	def quantiles(self, probabilities) -> list:
+		"""
+		:param probabilities: An iterable of numbers from 0 to 1
+		:return: The estimated quantile for each probability, in the same order
+		:raise ValueError: If nothing was added or a probability is not between 0 and 1
+		"""
+		if not len(self):
+			raise ValueError("Cannot find the quantiles of an empty QuantileSketch")
+		probabilities = np.asarray(list(probabilities), dtype=np.float64)
+		if ((probabilities < 0) | (probabilities > 1)).any():
+			raise ValueError(f"The probabilities must be between 0 and 1, not {probabilities[(probabilities < 0) | (probabilities > 1)][0]}")
+		self._compress()
+		last = len(self) - 1
+		# The rank at the middle of each centroid, with the min and max at the first and last ranks
+		ranks = np.concatenate(([0.0], self._weights.cumsum() - (self._weights + 1) / 2, [last]))
+		means = np.concatenate(([self.min], self._means, [self.max]))
+		return np.interp(probabilities * last, ranks, means).tolist()
+
+	@property
+	def sum(self) -> float:
+		return self._moments.sum
+
+	@property
+	def mean(self) -> float:
+		return self._moments.mean
+
+	@property
+	def min(self) -> float:
+		return self._moments.min
+
+	@property
+	def max(self) -> float:
+		return self._moments.max
+
+	@property
+	def range(self) -> float:
+		return self.max - self.min
+
+	@property
+	def variance(self) -> float:
+		"""
+		:raise ZeroDivisionError: If fewer than 2 values were added
+		"""
+		return self._moments.variance
+
+	@property
+	def standard_deviation(self) -> float:
+		return self.variance ** 0.5
+
+	@property
+	def median(self) -> float:
+		return self.quantile(0.5)
+
+	@property
+	def Q1(self) -> float:
+		return self.quantile(0.25)
+
+	@property
+	def Q3(self) -> float:
+		return self.quantile(0.75)
+
+	@property
+	def IQR(self) -> float:
+		return self.Q3 - self.Q1
+
+	@property
+	def outlier_range(self) -> tuple:
+		"""
+		:return: The outlier range, calculated from the estimated quartiles the same way as StatList.outlier_range
+		"""
+		Q1, Q3 = self.quantiles([0.25, 0.75])
+		outlier = 1.5 * (Q3 - Q1)
+		return outlier - Q1, outlier + Q3
+
+	def isOutlier(self, point) -> bool:
+		"""
+		:param float point: The point you want to check to see if it is an outlier
+		:return: If the given point is an outlier
+		"""
+		low, high = self.outlier_range
+		return low > point or high < point
+
+	def dataSummary(self, tab=True, vertical=True):
+		"""
+		Gives the rows of StatList.dataSummary that can be found from a stream. The mode, outliers, and average deviation need every value, so they are left out.
+		:param boolean tab: Return the data in an organized table format if True. False returns a list of lists
+		:param boolean vertical: Defines the orientation of the table. Default is vertical.
+		:return: Data in a table format
+		"""
+		Q1, median, Q3 = self.quantiles([0.25, 0.5, 0.75])
+		data = [
+			["Statistics", self.title],
+			["Length", len(self)],
+			["Sum", self.sum],
+			["Minimum", self.min],
+			["Q1", Q1],
+			["Median", median],
+			["Q3", Q3],
+			["Maximum", self.max],
+			["Mean", self.mean],
+			["Range", self.range],
+			["InterQuartile Range", Q3 - Q1],
+			["Outlier Range", self.outlier_range],
+			["Variance", self.variance],
+			["Standard Deviation", self.standard_deviation],
+		]
+		return _summary_table(data, tab, vertical)
+
+	def __repr__(self):
+		return f"QuantileSketch(count={len(self)}, compression={self.compression}, centroids={self.centroids})"
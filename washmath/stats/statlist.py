@@ -6,7 +6,10 @@ __version__ = "3.0.0"
 
 
 from ..tools import *
-from ..classes import Fraction
+from ..class_tools import is_numeric
+from ..classes import Fraction, FractionArray, Precision, fsum_exact, sort_exact, argsort_exact
+from .moments import RunningMoments
+from collections import Counter
 try:
 	from matplotlib import pyplot as plt
 	import numpy as np
@@ -16,24 +19,138 @@ except ImportError:
 	print("Numpy or Matplotlib not installed. Cannot run plot functions")
 
 
+def _middle_ranks(start:int, length:int) -> list:
+	"""
+	:return: The ranks whose values are averaged for the median of length sorted values starting at rank start
+	"""
+	if not length:
+		return []
+	if length % 2 == 0:
+		return [start + length // 2 - 1, start + length // 2]
+	return [start + length // 2]
+
+
+def _select_exact(values, ranks) -> dict:
+	"""
+	Finds the values at the given ranks of the sorted order without sorting, in O(n). Like sort_exact, the values are first selected by float,
+	with numpy's introselect, and only the values whose float equals the float at a rank are compared exactly.
+	:param values: A list or tuple of Fractions, ints, and floats
+	:param ranks: The positions wanted in the sorted order
+	:return: A dict from each rank to the value sort_exact would put there
+	"""
+	keys = np.fromiter(map(float, values), dtype=np.float64, count=len(values))
+	ranks = sorted(set(ranks))
+	partitioned = np.partition(keys, ranks)
+	selected = {}
+	for rank in ranks:
+		key = float(partitioned[rank])
+		position = rank - int(np.count_nonzero(keys < key))
+		below, equal, above = [], [], []
+		for index in np.flatnonzero(keys == key).tolist():
+			value = values[index]
+			(below if value < key else above if value > key else equal).append(value)
+		if position < len(below):
+			selected[rank] = sorted(below)[position]
+		elif position < len(below) + len(equal):
+			selected[rank] = equal[position - len(below)]
+		else:
+			selected[rank] = sorted(above)[position - len(below) - len(equal)]
+	return selected
+
+
+def _summary_table(data:list, tab=True, vertical=True):
+	"""
+	:param list data: [name, value] rows, the first being the title row
+	:return: The rows of a dataSummary, as a table if tab is True
+	"""
+	if not vertical:
+		data = [[i[0][x] for i in zip(data)] for x in range(len(data[0]))]
+	if tab:
+		from tabulate import tabulate
+		data = tabulate(data)
+	return data
+
+
 class StatList(list):
 	"""
 	A class used to help with statistical analysis of a list of data. Used in almost all classes in this package. Most functions do not rely on outside packages
+	The statistics are calculated the first time they are read and cached until the list is changed.
 	"""
-
-	def __init__(self, *values, title="", allow_fractions=True):
-		"""
-		:param list lst: The collection of elements that you want to analyze
+	# The attribute each statistic is cached in, and the method that calculates it
+	_STATISTICS = {
+		"_containing_fractions": "_check_if_containing_fractions",
+		"_array": "_setArray",
+		"_sorted_array": "_setSortedArray",
+		"_sorted": "_setSorted",
+		"_sum": "_setSum",
+		"_mean": "_setMean",
+		"_frequencies": "_setFrequencies",
+		"_mode": "_setMode",
+		"_min": "_setMin",
+		"_max": "_setMax",
+		"_median": "_setMedian",
+		"_standardDeviation": "_setStandardDeviation",
+		"_Q1": "_setQ1",
+		"_Q3": "_setQ3",
+		"_range": "_setRange",
+		"_IQR": "_setIQR",
+		"_outlier_range": "_setOutlierRange",
+		"_outliers": "_setOutliers",
+		"_averageDeviation": "_setAverageDeviation",
+		"_variance": "_setVariance",
+		"_standardError": "_setStandardError",
+	}
+	# The cached statistics that depend on the order of the values. The mode does through the order its ties are broken in
+	_ORDERED_STATISTICS = frozenset(("_array", "_frequencies", "_mode"))
+
+	def __init__(self, *values, title="", allow_fractions=True, max_denominator=None, precision:Precision=None, incremental=False):
+		"""
+		:param list lst: The collection of elements that you want to analyze. Can be given as one iterable or as separate arguments
 		:param str title: A title or name you want to give the data set
-		:param boolean allow_fraction: Whether the list will be allowed to hold Fraction objects
+		:param boolean allow_fraction: Whether the list will be allowed to hold Fraction objects. If False, the values are floats and every statistic is calculated with NumPy, the same as precision=Precision.FLOAT
+		:param int max_denominator: If set, floats are converted to the closest Fraction whose denominator is no larger than this. Same as precision=Precision.bounded(max_denominator)
+		:param Precision precision: How the values and the statistics calculated from them are stored. Defaults to Precision.default()
+		:param bool incremental: Keep running moments, so appending a value updates the sum, mean, variance, standard deviation, standard error, min, and max in O(1) instead of clearing them
 		"""
-		super().__init__([None] * len(values))
+		if len(values) == 1 and not is_numeric(values[0]) and hasattr(values[0], "__iter__"):
+			values = tuple(values[0])
 		self.allow_fractions = allow_fractions
-		for i, value in enumerate(values):
-			self[i] = Fraction(value)
-		self._containing_fractions = self._check_if_containing_fractions()
+		if precision is None and max_denominator is not None:
+			precision = Precision.bounded(max_denominator)
+		if not allow_fractions:
+			if precision is not None and not precision.is_float:
+				raise ValueError(f"A StatList that does not allow fractions stores floats, so its precision must be Precision.FLOAT, not {precision}")
+			precision = Precision.FLOAT
+		self.precision = Precision.resolve(precision)
+		super().__init__(map(float if self.precision.is_float else self._convert, values))
 		self.title = title
-		self.calculate_attributes()
+		self.incremental = incremental
+		self._moments = None
+
+	def _convert(self, value):
+		"""
+		:return: The value the way this StatList stores it, a float for Precision.FLOAT and a Fraction otherwise
+		"""
+		if self.precision.is_float:
+			return float(value)
+		if isinstance(value, float):
+			return Fraction.from_float(value, self.precision.max_denominator)
+		return self.precision.apply(Fraction(value))
+
+	def _stored(self, value):
+		"""
+		:return: A float converted the way the list stores it, so a search for 0.1 finds the Fraction 1/10 that StatList([0.1]) holds. Anything else as it is
+		"""
+		return self._convert(value) if isinstance(value, float) and value == value else value
+
+	def __contains__(self, value):
+		return super().__contains__(self._stored(value))
+
+	def index(self, value, *args) -> int:
+		return super().index(self._stored(value), *args)
+
+	def count(self, value) -> int:
+		return super().count(self._stored(value))
 
 	def __str__(self) -> str:
 		"""
@@ -46,21 +163,37 @@ class StatList(list):
 			return f"Statistical list of {self.title}: {super().__str__()}"
 
 	def __eq__(self, other):
+		"""
+		Compares value by value. A float in other is converted the way this list stores it, so StatList([0.1]) == [0.1] even though the Fraction 1/10 is not equal to the float 0.1
+		"""
+		if hasattr(other, "__iter__") and not isinstance(other, (StatList, list, tuple)):
+			other = list(other)
 		if isinstance(other, (StatList, list, tuple)):
 			if len(self) != len(other):
 				return False
 			for x, y in zip(self, other):
-				if x != y:
+				if x != self._stored(y):
 					return False
 			return True
-		elif hasattr(other, "__iter__"):
-			return super() == list(other)
 		else:
 			return False
 
 	def __hash__(self):
 		return hash(([i for i in self], self.title))
 
+	def _like(self, values):
+		"""
+		:return: A new StatList of the values with the same precision and allow_fractions as this one, for the results of the operators
+		"""
+		return StatList(values, allow_fractions=self.allow_fractions, precision=self.precision)
+
+	def _evaluate(self, expression):
+		"""
+		:param StatExpression expression: A lazy expression of this list
+		:return: The StatList of its results, with the same title, precision, allow_fractions, and incremental mode as this one
+		"""
+		return expression.evaluate(title=self.title, incremental=self.incremental)
+
 	def __add__(self, other):
 		"""
 		:param other: A StatList, list, or tuple
@@ -68,13 +201,13 @@ class StatList(list):
 		:raise: TypeError if other is not of type StatList, list, or tuple
 		"""
 		if isinstance(other, StatList):
-			return StatList(self.getList() + other.getList())
+			return self._like(self.getList() + other.getList())
 		elif isinstance(other, (list, tuple)):
 			lst = self.getList()
 			lst.extend(other)
-			return StatList(lst)
+			return self._like(lst)
 		elif is_numeric(other):
-			return StatList(self.getList() + [other])
+			return self._like(self.getList() + [other])
 		else:
 			raise TypeError(f"unsupported operand type(s) for +: 'StatList' and 'f{type(other).__name__}'")
 
@@ -91,11 +224,11 @@ class StatList(list):
 					lst.remove(i)
 				except ValueError:
 					print(f"{i} is not in the original list")
-			return StatList(lst)
+			return self._like(lst)
 		elif is_numeric(other):
 			lst = self.getList()
-			lst.remove(other)
-			return StatList(lst)
+			lst.remove(self._stored(other))
+			return self._like(lst)
 		else:
 			raise TypeError(f"unsupported operand type(s) for -: 'StatList' and 'f{type(other).__name__}'")
 
@@ -108,11 +241,11 @@ class StatList(list):
 		if isinstance(other, (StatList, list, tuple)):
 			if len(other) == len(self):
 				lst = [x * y for (x, y) in zip(self, other)]
-				return StatList(lst)
+				return self._like(lst)
 			else:
 				raise ValueError(f"The length of the given StatList does not match the length of the original StatList")
 		elif is_numeric(other):
-			return StatList([i * other for i in self])
+			return self._evaluate(self.lazy() * other)  # Carries over the statistics that were already calculated
 		else:
 			raise TypeError(f"unsupported operand type(s) for *: 'StatList' and 'f{type(other).__name__}'")
 
@@ -125,11 +258,11 @@ class StatList(list):
 		if isinstance(other, (StatList, list, tuple)):
 			if len(other) == len(self):
 				lst = [x / y for (x, y) in zip(self, other)]
-				return StatList(lst)
+				return self._like(lst)
 			else:
 				raise ValueError(f"The length of the given iterative does not match the length of the original StatList")
 		elif is_numeric(other):
-			return StatList([i / other for i in self])
+			return self._evaluate(self.lazy() / other)
 		else:
 			raise TypeError(f"unsupported operand type(s) for /: 'StatList' and 'f{type(other).__name__}'")
 
@@ -143,9 +276,9 @@ class StatList(list):
 			if len(other) != len(self):
 				raise ValueError(f"The length of the given StatList does not match the length of the original StatList")
 			lst = [x // y for (x, y) in zip(self, other)]
-			return StatList(lst)
+			return self._like(lst)
 		elif is_numeric(other):
-			return StatList([i // other for i in self])
+			return self._like([i // other for i in self])
 		else:
 			raise TypeError(f"unsupported operand type(s) for //: 'StatList' and 'f{type(other).__name__}'")
 
@@ -158,11 +291,11 @@ class StatList(list):
 		if isinstance(other, (StatList, list, tuple)):
 			if len(other) == len(self):
 				lst = [x % y for (x, y) in zip(self, other)]
-				return StatList(lst)
+				return self._like(lst)
 			else:
 				raise ValueError(f"The length of the given StatList does not match the length of the original StatList")
 		elif is_numeric(other):
-			return StatList([i % other for i in self])
+			return self._like([i % other for i in self])
 		else:
 			raise TypeError(f"unsupported operand type(s) for %: 'StatList' and 'f{other.__name__}'")
 
@@ -175,11 +308,11 @@ class StatList(list):
 		if isinstance(other, (StatList, list, tuple)):
 			if len(other) == len(self):
 				lst = [x ** y for (x, y) in zip(self, other)]
-				return StatList(lst)
+				return self._like(lst)
 			else:
 				raise ValueError(f"The length of the given iterative does not match the length of the original StatList")
 		elif is_numeric(other):
-			return StatList([i ** other for i in self])
+			return self._like([i ** other for i in self])
 		else:
 			raise TypeError(f"unsupported operand type(s) for /: 'StatList' and 'f{other.__name__}'")
 
@@ -263,10 +396,22 @@ class StatList(list):
 		return super().copy()
 
 	def __setitem__(self, key, value):
-		if not self.allow_fractions:
-			if isinstance(value, object):
-				__value = float(value)
+		if isinstance(key, slice):
+			value = list(map(self._convert, value))
+		else:
+			value = self._convert(value)
 		super().__setitem__(key, value)
+		self._invalidate()
+
+	def __delitem__(self, key):
+		super().__delitem__(key)
+		self._invalidate()
+
+	def to_fraction_array(self) -> FractionArray:
+		"""
+		:return: The data as a FractionArray, for exact vectorized arithmetic
+		"""
+		return FractionArray(self)
 
 	def _check_if_containing_fractions(self) -> bool:
 		self._containing_fractions = any([isinstance(i, Fraction) for i in self])
@@ -274,112 +419,343 @@ class StatList(list):
 
 	@property
 	def containing_fractions(self):
-		return self._containing_fractions
+		return self._statistic("_containing_fractions")
 
 	def append(self, __object) -> None:
-		if not self.allow_fractions:
-			if isinstance(__object, Fraction):
-				__object = float(Fraction)
+		__object = self._convert(__object)
 		super().append(__object)
-		self._containing_fractions = self._check_if_containing_fractions()
-		self.calculate_attributes()
+		self._invalidate(keep_moments=True)
+		if self._moments is not None:
+			self._moments.add(__object)
 
 	def clear(self) -> None:
 		super().clear()
-		self._containing_fractions = self._check_if_containing_fractions()
-		self.calculate_attributes()
+		self._invalidate()
 
 	# TODO: Add fraction checking for extension methods
 	def extend(self, __iterable) -> None:
-		super().extend(__iterable)
-		self._containing_fractions = self._check_if_containing_fractions()
-		self.calculate_attributes()
+		values = list(map(self._convert, __iterable))
+		super().extend(values)
+		self._invalidate(keep_moments=True)
+		if self._moments is not None:
+			self._moments.merge(RunningMoments(values, exact=not self.precision.is_float))
 
 	def insert(self, __index: int, __object) -> None:
-		if not self.allow_fractions:
-			if isinstance(__object, Fraction):
-				__object = float(Fraction)
+		__object = self._convert(__object)
 		super().insert(__index, __object)
-		self._containing_fractions = self._check_if_containing_fractions()
-		self.calculate_attributes()
+		self._invalidate(keep_moments=True)
+		if self._moments is not None:
+			self._moments.add(__object)
 
-	def pop(self, __index: int = ...):
+	def pop(self, __index: int = -1):
 		value = super().pop(__index)
-		self._containing_fractions = self._check_if_containing_fractions()
-		self.calculate_attributes()
+		self._invalidate()
 		return value
 
 	def remove(self, __value) -> None:
-		super().remove(__value)
-		self._containing_fractions = self._check_if_containing_fractions()
-		self.calculate_attributes()
+		super().remove(self._stored(__value))
+		self._invalidate()
 
 	def reverse(self) -> None:
-		super().remove()
-		self._containing_fractions = self._check_if_containing_fractions()
-		self.calculate_attributes()
-
-	def sort(self, *, key=lambda value: float(value), reverse: bool = ...) -> None:
-		"""if self.allow_fractions:
-			if key is None:
-				key = lambda value: float(value)"""
-		super().sort(key, reverse)
-		self._containing_fractions = self._check_if_containing_fractions()
-		self.calculate_attributes()
+		super().reverse()
+		self._invalidate_order()
+
+	def sort(self, *, key=None, reverse: bool = False) -> None:
+		"""
+		Sorts the list in place. Without a key, the values are sorted exactly with washmath.classes.fraction.argsort_exact.
+		"""
+		if key is None and not self.precision.is_float:
+			list.__setitem__(self, slice(None), [self[i] for i in argsort_exact(self, reverse)])
+		else:
+			super().sort(key=key, reverse=reverse)
+		self._invalidate_order()
+
+	def sorted_view(self) -> tuple:
+		"""
+		The values from smallest to largest. They are sorted once and shared by min, max, median, Q1, Q3, and quantiles until the list is changed.
+		:return: A tuple of the sorted values
+		"""
+		return self._statistic("_sorted")
+
+	def quantiles(self, probabilities) -> list:
+		"""
+		Finds any number of quantiles from the one shared sort, interpolating linearly between the closest ranks like numpy.quantile does by default
+		:param probabilities: An iterable of numbers from 0 to 1, such as [0.1, 0.5, 0.9] for the 10th, 50th, and 90th percentiles
+		:return: The quantile for each probability, in the same order
+		:raise ValueError: If the list is empty or a probability is not between 0 and 1
+		"""
+		if self.precision.is_float:
+			return self._array_quantiles(probabilities)
+		values = self.sorted_view()
+		if not values:
+			raise ValueError("Cannot find the quantiles of an empty StatList")
+		last = len(values) - 1
+		quantiles = []
+		for probability in probabilities:
+			if not 0 <= probability <= 1:
+				raise ValueError(f"The probabilities must be between 0 and 1, not {probability}")
+			position = Fraction(probability) * last  # Exact, so 0.1 of 11 values is exactly the second one
+			lower = int(position)
+			weight = position - lower
+			if weight == 0:
+				quantiles.append(values[lower])
+			else:
+				quantiles.append(self.precision.apply(values[lower] + (values[lower + 1] - values[lower]) * weight))
+		return quantiles
+
+	def _array_quantiles(self, probabilities) -> list:
+		"""
+		quantiles for the float backend, interpolating every probability at once
+		"""
+		values = self._statistic("_sorted_array")
+		if not len(values):
+			raise ValueError("Cannot find the quantiles of an empty StatList")
+		probabilities = np.asarray(list(probabilities), dtype=np.float64)
+		if ((probabilities < 0) | (probabilities > 1)).any():
+			raise ValueError(f"The probabilities must be between 0 and 1, not {probabilities[(probabilities < 0) | (probabilities > 1)][0]}")
+		positions = probabilities * (len(values) - 1)
+		lower = positions.astype(np.int64)
+		upper = np.minimum(lower + 1, len(values) - 1)
+		return (values[lower] + (values[upper] - values[lower]) * (positions - lower)).tolist()
+
+	def lazy(self):
+		"""
+		Starts a chain of element-wise arithmetic that is evaluated in one pass, such as ((x.lazy() - x.mean) ** 2 / n).evaluate().
+		If the chain is a * x + b, the statistics of this list that were already calculated are carried over to the result instead of being calculated again.
+		:return: A washmath.stats.expression.StatExpression of this list
+		"""
+		from .expression import StatExpression
+		return StatExpression(self)
+
+	def map(self, function, vectorized=False, title=""):
+		"""
+		:param function: Takes each value, or the whole float64 array or FractionArray if vectorized is True
+		:param bool vectorized: Call the function once with every value, such as numpy.log on the float backend
+		:param str title: The title of the new StatList
+		:return: A StatList of the results, with the same precision as this one
+		"""
+		if vectorized:
+			values = function(self._statistic("_array") if self.precision.is_float else self.to_fraction_array())
+		else:
+			values = map(function, self)
+		return StatList(values, title=title, allow_fractions=self.allow_fractions, precision=self.precision)
+
+	def rolling(self, window:int):
+		"""
+		Statistics of every window of consecutive values, such as statlist.rolling(10).mean(). Each window is updated from the last one instead of being calculated again.
+		:param int window: How many values are in each window
+		:return: A washmath.stats.rolling.Rolling with mean, var, std, min, max, and median methods, each giving one value per full window
+		:raise ValueError: If the window is not between 1 and the length of the list
+		"""
+		from .rolling import Rolling
+		return Rolling(self, window)
+
+	def ewm(self, alpha=None, span=None):
+		"""
+		Exponentially weighted statistics, such as statlist.ewm(span=10).mean()
+		:param alpha: The weight of each new value, between 0 and 1
+		:param span: Sets alpha to 2 / (span + 1) instead
+		:return: A washmath.stats.rolling.EWM with mean, var, and std methods, each giving one value per value of the list
+		"""
+		from .rolling import EWM
+		return EWM(self, alpha, span)
+
+	def bootstrap(self, stat="median", n_resamples:int=10000, ci=0.95, seed=None, workers:int=None):
+		"""
+		Estimates a percentile confidence interval for a statistic by resampling the list with replacement. The resamples are drawn as blocks of indices
+		and only the requested statistic is calculated on them, on the float64 values, or on the indices themselves for the order statistics.
+		:param stat: The name of a statistic, one of mean, sum, median, Q1, Q3, IQR, min, max, range, variance, standard_deviation, standard_error,
+			and average_deviation, or a function taking a 2D float64 array and returning the statistic of each row. It must be module level if workers is set
+		:param int n_resamples: How many resamples to draw
+		:param ci: The confidence level, between 0 and 1
+		:param seed: An int or numpy.random.SeedSequence. The same seed gives the same result with any number of workers
+		:param int workers: Spread the resamples over this many processes. Done in this process if None
+		:return: A washmath.stats.bootstrap.Bootstrap with the estimate, the interval, and the distribution. The ends of the interval of an order statistic
+			of an exact list are exact, and otherwise floats
+		:raise ValueError: If the statistic is unknown, or the list has fewer than 2 values
+		"""
+		from .bootstrap import bootstrap
+		return bootstrap(self, stat, n_resamples, ci, seed, workers)
 
 	def calculate_attributes(self) -> None:
-		self._setSum()
-		self._setMean()
-		self._setMode()
-		self._setMin()
-		self._setMax()
-		self._median = removeDecimal(self._getMedian(self.copy()))
-		self._setStandardDeviation()
-		self._setQ1()
-		self._setQ3()
-		self._setRange()
-		self._setIQR()
-		self._setOutlierRange()
-		self._setOutliers()
-		self._setAverageDeviation()
-		self._setVariance()
-		self._setStandardError()
+		"""
+		Calculates every statistic now instead of when it is first read
+		"""
+		self._invalidate()
+		for name in self._STATISTICS:
+			self._statistic(name)
+
+	def _statistic(self, name:str):
+		"""
+		:param str name: The attribute the statistic is cached in, a key of _STATISTICS
+		:return: The cached statistic, calculated first if the list changed since it was last read
+		"""
+		try:
+			return self.__dict__[name]
+		except KeyError:
+			getattr(self, self._STATISTICS[name])()
+			return self.__dict__[name]
+
+	def _invalidate(self, keep_moments=False) -> None:
+		"""
+		Clears the cached statistics. Called by every method that changes the values.
+		:param bool keep_moments: If the running moments of the incremental mode are kept, because the change only added values and the caller will add them to the moments
+		"""
+		for name in self._STATISTICS:
+			self.__dict__.pop(name, None)
+		if not keep_moments:
+			self._moments = None
+
+	def _invalidate_order(self) -> None:
+		"""
+		Clears the cached statistics that depend on the order of the values. Called by the methods that only reorder them, so the rest stay cached.
+		"""
+		for name in self._ORDERED_STATISTICS:
+			self.__dict__.pop(name, None)
+
+	def _running_moments(self) -> RunningMoments:
+		"""
+		:return: The running moments of the values, built from the whole list if they were dropped by a change that did not only add values, such as a removal
+		"""
+		if self._moments is None:
+			self._moments = RunningMoments(self, exact=not self.precision.is_float)
+		return self._moments
 
 	def _setSum(self):
-		self._sum = sum(self, start=Fraction(0))
+		if self.incremental:
+			self._sum = self._running_moments().sum
+			return
+		if self.precision.is_float:
+			self._sum = float(self._statistic("_array").sum())
+			return
+		self._sum = fsum_exact(self)
 
 	def _setMean(self):
-		self._mean = Fraction(self.sum, len(self))
+		if self.incremental:
+			self._mean = self.precision.apply(self._running_moments().mean)
+			return
+		if self.precision.is_float:
+			self._mean = float(self._statistic("_array").mean())
+			return
+		self._mean = self.precision.apply(Fraction(self.sum, len(self)))
+
+	def _setFrequencies(self):
+		"""
+		How many times each distinct value appears, counted in one pass. The values are in the order they first appear, so ties are broken the same way by both backends.
+		"""
+		if self.precision.is_float:
+			values, first, counts = np.unique(self._statistic("_array"), return_index=True, return_counts=True)
+			order = first.argsort()
+			self._frequencies = Counter(dict(zip(values[order].tolist(), counts[order].tolist())))
+			return
+		self._frequencies = Counter(self)
 
 	def _setMode(self):
-		mode = None
-		times = 0
+		if self.precision.is_float:
+			values, first, counts = np.unique(self._statistic("_array"), return_index=True, return_counts=True)
+			if not len(values):
+				self._mode = None
+				return
+			tied = counts == counts.max()
+			self._mode = float(values[tied][first[tied].argmin()])
+			return
+		most_common = self._statistic("_frequencies").most_common(1)
+		self._mode = most_common[0][0] if most_common else None
 
-		try:
-			for unique_value in set(self):
-				count = super().count(unique_value)
-				if count > times:
-					mode = unique_value
-					times = count
-		except np.core._exceptions.UFuncTypeError as e:
-			from warnings import warn
-			warn(f"The most could not be calculated due to: {e}")
+	def _setArray(self):
+		"""
+		The values of a float StatList as a contiguous float64 array, which every statistic of the float backend is calculated from
+		"""
+		self._array = np.fromiter(self, dtype=np.float64, count=len(self))
+
+	def _setSortedArray(self):
+		self._sorted_array = np.sort(self._statistic("_array"))
 
-		self._mode = mode
+	def _setSorted(self):
+		if self.precision.is_float:
+			self._sorted = tuple(self._statistic("_sorted_array").tolist())
+			return
+		values = self.getList()
+		sort_exact(values)
+		self._sorted = tuple(values)
+
+	def _setMedian(self):
+		if self._selects_order_statistics():
+			self._select_order_statistics()
+			return
+		if self.precision.is_float:
+			self._median = self._median_of_sorted_array(self._statistic("_sorted_array"))
+			return
+		self._median = removeDecimal(self._median_of_sorted(self.sorted_view()))
 
 	def _setMin(self):
-		copy = self.copy()
-		copy.sort()
-		self._min = copy[0]
+		if self.incremental:
+			self._min = self._running_moments().min
+			return
+		if self.precision.is_float:
+			self._min = float(self._statistic("_array").min())
+			return
+		if self._selects_order_statistics():
+			self._select_order_statistics()
+			return
+		self._min = self.sorted_view()[0]
 
 	def _setMax(self):
-		lst = self.copy()
-		lst.sort()
-		self._max = lst[-1]
+		if self.incremental:
+			self._max = self._running_moments().max
+			return
+		if self.precision.is_float:
+			self._max = float(self._statistic("_array").max())
+			return
+		if self._selects_order_statistics():
+			self._select_order_statistics()
+			return
+		self._max = self.sorted_view()[-1]
+
+	def _selects_order_statistics(self) -> bool:
+		"""
+		:return: If the order statistics should be found by selection, because nothing has sorted the list yet. Once the sorted view exists, reading them from it is cheaper.
+		"""
+		return len(self) > 1 and ("_sorted_array" if self.precision.is_float else "_sorted") not in self.__dict__
+
+	def _select_order_statistics(self) -> None:
+		"""
+		Finds the median, Q1, and Q3, and the min and max of an exact list, with one selection in O(n) instead of a sort.
+		The float backend partitions its array with np.partition, and an exact list uses _select_exact.
+		"""
+		length = len(self)
+		half = length // 2
+		ranks = {
+			"_median": _middle_ranks(0, length),
+			"_Q1": _middle_ranks(0, half),
+			"_Q3": _middle_ranks(half + length % 2, half),
+		}
+		if self.precision.is_float:
+			wanted = sorted({rank for positions in ranks.values() for rank in positions})
+			partitioned = np.partition(self._statistic("_array"), wanted)
+			for name, positions in ranks.items():
+				self.__dict__[name] = self._median_of_sorted_array(partitioned[positions])
+			return
+		if not self.incremental:
+			ranks["_min"], ranks["_max"] = [0], [length - 1]
+		selected = _select_exact(self, [rank for positions in ranks.values() for rank in positions])
+		for name, positions in ranks.items():
+			self.__dict__[name] = self._median_of_sorted([selected[rank] for rank in positions])
+		self._median = removeDecimal(self._median)
 
 	@staticmethod
 	def _getMedian(lst) -> float:
-		lst.sort()
+		"""
+		:param lst: A list or tuple, which is not changed
+		:return: The median, found by selection instead of sorting
+		"""
+		return StatList._median_of_sorted([selected for _, selected in sorted(_select_exact(lst, _middle_ranks(0, len(lst))).items())])
+
+	@staticmethod
+	def _median_of_sorted(lst) -> float:
+		"""
+		:param lst: A list or tuple that is already sorted
+		"""
 		if len(lst) % 2 == 0:
 			value1 = lst[len(lst) // 2]
 			value2 = lst[len(lst) // 2 - 1]
@@ -393,32 +769,52 @@ class StatList(list):
 		else:
 			return lst[(len(lst) // 2)]
 
+	@staticmethod
+	def _median_of_sorted_array(values:np.ndarray) -> float:
+		"""
+		:param np.ndarray values: A sorted float64 array
+		"""
+		middle = len(values) // 2
+		if len(values) % 2 == 0:
+			return float(values[middle - 1] + values[middle]) / 2
+		return float(values[middle])
+
 	def _setStandardDeviation(self):
 		if len(self) == 1:
 			self._standardDeviation = 0
 			return
-		squares = [(Fraction(point) - self.mean) ** 2 for point in self]
-		self._standardDeviation = sum(squares, start=Fraction(0, 1))
+		if self.incremental:
+			self._standardDeviation = self.precision.apply(self._running_moments().variance ** 0.5)
+			return
+		if self.precision.is_float:
+			self._standardDeviation = float(self._statistic("_array").std(ddof=1))
+			return
+		differences = self.to_fraction_array() - self.mean
+		self._standardDeviation = differences.dot(differences)
 		self._standardDeviation /= (len(self) - 1)  # I have len(self) - 1 but some sources say just len(self), including Google Sheets, look into which is right
-		self._standardDeviation **= 0.5
+		self._standardDeviation = self.precision.apply(self._standardDeviation ** 0.5)
 
 	def _setQ1(self):
-		lst = self.getList()
-		lst.sort()
-		if len(lst) % 2 == 1:
-			lst = lst[:int(len(lst) / 2)]
-		else:
-			lst = lst[:(len(lst) // 2)]
-		self._Q1 = self._getMedian(lst)
+		if self._selects_order_statistics():
+			self._select_order_statistics()
+			return
+		if self.precision.is_float:
+			values = self._statistic("_sorted_array")
+			self._Q1 = self._median_of_sorted_array(values[:len(values) // 2])
+			return
+		lst = self.sorted_view()
+		self._Q1 = self._median_of_sorted(lst[:len(lst) // 2])
 
 	def _setQ3(self):
-		lst = self.getList()
-		lst.sort()
-		if len(lst) % 2 == 1:
-			lst = lst[int(len(lst) / 2) + 1:]
-		else:
-			lst = lst[(len(lst) // 2):]
-		self._Q3 = self._getMedian(lst)
+		if self._selects_order_statistics():
+			self._select_order_statistics()
+			return
+		if self.precision.is_float:
+			values = self._statistic("_sorted_array")
+			self._Q3 = self._median_of_sorted_array(values[len(values) // 2 + len(values) % 2:])
+			return
+		lst = self.sorted_view()
+		self._Q3 = self._median_of_sorted(lst[len(lst) // 2 + len(lst) % 2:])
 
 	def _setRange(self):
 		self._range = self.max - self.min
@@ -427,22 +823,39 @@ class StatList(list):
 		self._IQR = self.Q3 - self.Q1
 
 	def _setOutlierRange(self):
-		outlier = Fraction(3, 2) * self.IQR
+		outlier = (1.5 if self.precision.is_float else Fraction(3, 2)) * self.IQR
 		self._outlier_range = (outlier - self.Q1, outlier + self.Q3)
 
 	def _setOutliers(self):
+		if self.precision.is_float:
+			values = self._statistic("_array")
+			low, high = self.outlier_range
+			self._outliers = tuple(values[(values < low) | (values > high)].tolist())
+			return
 		self._outliers = tuple(point for point in self if self.isOutlier(point))
 
 	def _setAverageDeviation(self):
-		lst = [abs(-self.mean + point) for point in self]
-		self._averageDeviation = Fraction(sum(lst, start=Fraction(0, 1)), len(self))
+		if self.precision.is_float:
+			self._averageDeviation = float(np.abs(self._statistic("_array") - self.mean).mean())
+			return
+		differences = abs(self.to_fraction_array() - self.mean)
+		self._averageDeviation = self.precision.apply(Fraction(differences.sum(), len(self)))
 
 	def _setVariance(self):
-		lst = [(-self.mean + point) ** 2 for point in self]
-		self._variance = sum(lst, start=Fraction(0,1)) / (len(self) - 1)
+		if self.incremental:
+			self._variance = self.precision.apply(self._running_moments().variance)
+			return
+		if self.precision.is_float:
+			self._variance = float(self._statistic("_array").var(ddof=1))
+			return
+		differences = self.to_fraction_array() - self.mean
+		self._variance = self.precision.apply(differences.dot(differences) / (len(self) - 1))
 
 	def _setStandardError(self):
-		self._standardError = Fraction(self.standard_deviation, np.sqrt(len(self)))
+		if self.precision.is_float:
+			self._standardError = self.standard_deviation / np.sqrt(len(self))
+			return
+		self._standardError = self.precision.apply(Fraction(self.standard_deviation, np.sqrt(len(self))))
 
 	@property
 	def sum(self) -> int:
@@ -450,7 +863,7 @@ class StatList(list):
 		:rtype: :float:
 		:return: The sum of all the data in the collection
 		"""
-		return self._sum
+		return self._statistic("_sum")
 
 	@property
 	def mean(self):
@@ -458,7 +871,7 @@ class StatList(list):
 		:rtype: :float:
 		:return: The average/mean of all the data in the collection
 		"""
-		return self._mean
+		return self._statistic("_mean")
 
 	@property
 	def average(self):
@@ -474,7 +887,25 @@ class StatList(list):
 		:rtype: float
 		:return: The most common data point in a collection
 		"""
-		return self._mode
+		return self._statistic("_mode")
+
+	def modes(self) -> list:
+		"""
+		Every value tied for the most appearances, so a multimodal data set is not reduced to one of its modes
+		:return: The modes in the order they first appear in the list. Empty if the list is empty
+		"""
+		frequencies = self._statistic("_frequencies")
+		if not frequencies:
+			return []
+		times = max(frequencies.values())
+		return [value for value, count in frequencies.items() if count == times]
+
+	def most_common(self, k:int=None) -> list:
+		"""
+		:param int k: How many values to return. Every distinct value if None
+		:return: (value, count) pairs from the most to the least common. Values that appear the same number of times are in the order they first appear
+		"""
+		return self._statistic("_frequencies").most_common(k)
 
 	@property
 	def min(self):
@@ -482,7 +913,7 @@ class StatList(list):
 		:rtype: float or int
 		:return: The minimum data point in the collection
 		"""
-		return self._min
+		return self._statistic("_min")
 
 	@property
 	def max(self):
@@ -490,7 +921,7 @@ class StatList(list):
 		:rtype: float or int
 		:return: The maximum data point in the collection
 		"""
-		return self._max
+		return self._statistic("_max")
 
 	@property
 	def median(self) -> int:
@@ -498,7 +929,7 @@ class StatList(list):
 		:rtype: int or float
 		:return: The middle point of the collection
 		"""
-		return self._median
+		return self._statistic("_median")
 
 	@property
 	def standard_deviation(self):
@@ -506,35 +937,35 @@ class StatList(list):
 		:rtype: float
 		:return: The standard deviation of the collection
 		"""
-		return self._standardDeviation
+		return self._statistic("_standardDeviation")
 
 	@property
 	def Q1(self):
 		"""
 		:return: The 1st Quartile in the data collection
 		"""
-		return self._Q1
+		return self._statistic("_Q1")
 
 	@property
 	def Q3(self):
 		"""
 		:return: The third quartile in the data set
 		"""
-		return self._Q3
+		return self._statistic("_Q3")
 
 	@property
 	def range(self):
 		"""
 		:return: The range of the data set
 		"""
-		return self._range
+		return self._statistic("_range")
 
 	@property
 	def IQR(self):
 		"""
 		:return: The interquartile range of the collection
 		"""
-		return self._IQR
+		return self._statistic("_IQR")
 
 	@property
 	def outlier_range(self):
@@ -543,7 +974,7 @@ class StatList(list):
 		:rtype: tuple
 		:return: The points that would be considered outliers in the data set
 		"""
-		return self._outlier_range
+		return self._statistic("_outlier_range")
 
 	@property
 	def outliers(self):
@@ -551,7 +982,7 @@ class StatList(list):
 		:rtype: tuple
 		:return: All the outliers in the dataset
 		"""
-		return self._outliers
+		return self._statistic("_outliers")
 
 	@property
 	def average_deviation(self):
@@ -559,11 +990,11 @@ class StatList(list):
 		Returns the average deviation, also known as mean absolute deviation.
 		:return: The average deviation
 		"""
-		return self._averageDeviation
+		return self._statistic("_averageDeviation")
 
 	@property
 	def variance(self):
-		return self._variance
+		return self._statistic("_variance")
 
 	@property
 	def standard_error(self):
@@ -571,7 +1002,7 @@ class StatList(list):
 		Returns the standard, calculated using the standard deviation / sqrt(number of elements)
 		:return: The average deviation
 		"""
-		return self._standardError
+		return self._statistic("_standardError")
 
 	def covariance(self, other) -> Fraction:
 		"""
@@ -581,9 +1012,7 @@ class StatList(list):
 			raise ValueError(f"The other variable must be a Statlist, not {type(other).__name__}")
 		if len(self) != len(other):
 			raise ValueError(f"The statlists must be the same length. {len(self)} !+ {len(other)}")
-		value = Fraction(0)
-		for x1, x2 in zip(self, other):
-			value += Fraction(x1 - self.mean) * Fraction(x2 - other.mean)
+		value = (self.to_fraction_array() - self.mean).dot(other.to_fraction_array() - other.mean)
 		return value / len(self)
 
 	def isOutlier(self, point) -> bool:
@@ -600,7 +1029,13 @@ class StatList(list):
 		:param boolean vertical: Defines the orientation of the table. Default is vertical.
 		:return: Data in a table format
 		"""
-		data = [
+		return _summary_table(self._summary_rows(), tab, vertical)
+
+	def _summary_rows(self) -> list:
+		"""
+		:return: The [name, value] rows of dataSummary
+		"""
+		return [
 			["Statistics", self.title],
 			["Length", len(self)],
 			["Sum", self.sum],
@@ -619,12 +1054,6 @@ class StatList(list):
 			["Standard Deviation", self.standard_deviation],
 			["Average Deviation", self.average_deviation]
 		]
-		if not vertical:
-			data = [[i[0][x] for i in zip(data)] for x in range(len(data[0]))]
-		if tab:
-			from tabulate import tabulate
-			data = tabulate(data)
-		return data
 
 	def standardDeviationSums(self, other) -> Fraction:
 		"""
@@ -636,12 +1065,112 @@ class StatList(list):
 			raise ValueError(f"Length of lst1 does not equal the length of lst2: {len(self)}!={len(other)}")
 		elif not isinstance(other, StatList):
 			raise TypeError(f"other is not of type 'StatList'\nAdd StatList() around the parameter you pass")
-		summation = Fraction(0)
-		for x, y in zip(self, other):
-			x_diff = Fraction(x) - self.mean
-			y_diff = Fraction(y) - other.mean
-			summation += (x_diff * y_diff)
-		return summation
+		return (self.to_fraction_array() - self.mean).dot(other.to_fraction_array() - other.mean)
+
+	@classmethod
+	def _from_summary(cls, values:list, summary:dict, title="", allow_fractions=True, precision:Precision=None, incremental=False):
+		"""
+		Creates a StatList with statistics that were already calculated, such as the summary block of a saved StatList, instead of calculating them again
+		:param list values: The data, already converted
+		:param dict summary: The value of every attribute set by calculate_attributes, keyed by the attribute name
+		"""
+		statlist = cls.__new__(cls)
+		list.__init__(statlist, values)
+		statlist.allow_fractions = allow_fractions
+		statlist.precision = Precision.resolve(precision)
+		statlist.title = title
+		statlist.incremental = incremental
+		statlist._moments = None
+		for name, value in summary.items():
+			setattr(statlist, name, value)
+		return statlist
+
+	@classmethod
+	def from_chunks(cls, chunks, executor=None, title="", precision:Precision=None, incremental=False):
+		"""
+		Creates a StatList from shards of the data. Each chunk is converted and summarized with a StatSummary on the executor, and the summaries are merged,
+		so the sum, mean, variance, standard deviation, min, and max of the whole list are already known instead of being calculated again.
+		:param chunks: An iterable of iterables of numbers, concatenated in order
+		:param concurrent.futures.Executor executor: Such as a ProcessPoolExecutor. The chunks are converted in this process if None
+		:param str title: A title or name you want to give the data set
+		:param Precision precision: How the values and statistics are stored. Defaults to Precision.default()
+		:param bool incremental: Keep running moments, starting from the merged summary
+		:return: The StatList of every value in every chunk
+		"""
+		from itertools import repeat
+		from .summary import StatSummary, _summarize_chunk
+		precision = Precision.resolve(precision)
+		mapper = map if executor is None else executor.map
+		values = []
+		summary = StatSummary(exact=not precision.is_float)
+		for chunk, part in mapper(_summarize_chunk, chunks, repeat(precision)):
+			values.extend(chunk)
+			summary.merge(part)
+
+		statistics = {}
+		if values:
+			statistics["_sum"], statistics["_min"], statistics["_max"] = summary.sum, summary.min, summary.max
+			if precision.is_float:
+				statistics["_mean"] = summary.mean
+			else:
+				statistics["_mean"] = precision.apply(Fraction(summary.sum, len(values)))
+		if len(values) > 1:
+			variance = summary.m2 / (len(values) - 1)
+			statistics["_variance"] = precision.apply(variance)
+			statistics["_standardDeviation"] = precision.apply(variance ** 0.5)
+		statlist = cls._from_summary(values, statistics, title=title, precision=precision, incremental=incremental)
+		if incremental:
+			statlist._moments = summary.moments
+		return statlist
+
+	def to_bytes(self, summary=True, compact=False) -> bytes:
+		"""
+		Writes the data in a compact binary format. The values are stored as int64 numerator and denominator columns, or as varints if they do not fit in 64 bits.
+		See washmath.stats.serialization for the layout.
+		:param bool summary: Also store the calculated statistics, so from_bytes does not have to calculate them again
+		:param bool compact: Always store the values as varints, which takes about a third of the space for small values
+		:return: The StatList as bytes
+		"""
+		from .serialization import dumps
+		return dumps(self, summary, compact)
+
+	@classmethod
+	def from_bytes(cls, data):
+		"""
+		:param data: bytes, a memoryview, or an mmap written by to_bytes
+		:return: The StatList
+		:raise ValueError: If the data was not written by to_bytes
+		"""
+		from .serialization import loads
+		return loads(data, cls)
+
+	def save(self, path:str, summary=True, compact=False) -> None:
+		"""
+		Writes the StatList to a file in the format of to_bytes
+		:param str path: The path to the file
+		:param bool summary: Also store the calculated statistics
+		:param bool compact: Store the values as varints instead of int64 columns
+		"""
+		with open(path, "wb") as file:
+			file.write(self.to_bytes(summary, compact))
+
+	@classmethod
+	def load(cls, path:str, mmap=False):
+		"""
+		Reads a StatList written by save
+		:param str path: The path to the file
+		:param bool mmap: Memory-map the file instead of reading it into memory first. Recommended for large files
+		:return: The StatList
+		"""
+		with open(path, "rb") as file:
+			if not mmap:
+				return cls.from_bytes(file.read())
+			from mmap import mmap as memory_map, ACCESS_READ
+			with memory_map(file.fileno(), 0, access=ACCESS_READ) as mapped:
+				return cls.from_bytes(mapped)
+
+	def __reduce__(self):
+		return type(self).from_bytes, (self.to_bytes(summary=False, compact=True),)
 
 	@classmethod
 	def create(cls):
@@ -661,46 +1190,83 @@ class StatList(list):
 	@staticmethod
 	def sortMultipleLists(sort, dependent):
 		"""
-		Sorts two StatLists so the index matches when one is sorted
+		Sorts two StatLists so the index matches when one is sorted. Same as StatList.cosort(sort, dependent)
 		:param stats.StatList.StatList sort: The list that is getting sorted
 		:param stats.StatList.StatList dependent: The list that will get sorted based off of the other list
 		:returns: The StatLists, one sorted and the other matching the changed indexes
 		:rtype: (stats.StatList.StatList, stats.StatList.StatList)
 		"""
-		new_x, new_y = [], []
-		for (x, y) in zip(sort, dependent):
-			new_x.append(x)
-			new_x.sort()
-			new_y.insert(new_x.index(x), y)
-		return StatList(new_x), StatList(new_y)
+		return StatList.cosort(sort, dependent)
 
 	@staticmethod
-	def fromCsv(path: str, delimiter=",") -> tuple:
+	def cosort(key_list, *others, reverse=False) -> tuple:
+		"""
+		Sorts key_list and puts every other list in the same order, so the values that were at the same index stay paired, duplicates included.
+		The order is found once, with a stable argsort: numpy for the float backend and argsort_exact otherwise.
+		The new lists hold the same value objects, and keep every cached statistic that does not depend on the order, so nothing is converted or calculated again.
+		:param key_list: The StatList, or sequence, to sort by
+		:param others: More lists of the same length
+		:param bool reverse: Sort from largest to smallest
+		:return: A tuple of the sorted key_list followed by each of the others, as StatLists
+		:raise ValueError: If the lists are not all the same length
+		"""
+		lists = [values if isinstance(values, StatList) else StatList(values) for values in (key_list,) + others]
+		for values in lists[1:]:
+			if len(values) != len(key_list):
+				raise ValueError(f"Every list must be the same length as the key list. {len(values)} != {len(key_list)}")
+		key_list = lists[0]
+		if key_list.precision.is_float:
+			array = key_list._statistic("_array")
+			order = np.argsort(-array if reverse else array, kind="stable")
+		else:
+			order = np.array(argsort_exact(key_list, reverse), dtype=np.int64)
+		return tuple(values._permuted(order) for values in lists)
+
+	def _permuted(self, order:np.ndarray):
+		"""
+		:param numpy.ndarray order: The index of the value to put at each position
+		:return: A StatList of the same values in the given order, keeping the cached statistics that do not depend on the order
+		"""
+		values = [self[i] for i in order.tolist()]
+		statistics = {}
+		if type(self) is StatList:  # A subclass such as WeightedStatList has statistics that would not describe the StatList that is returned
+			statistics = {name: value for name, value in self.__dict__.items() if name in self._STATISTICS and name not in StatList._ORDERED_STATISTICS}
+			if "_array" in self.__dict__:
+				statistics["_array"] = self._array[order]
+		statlist = StatList._from_summary(values, statistics, title=self.title, allow_fractions=self.allow_fractions, precision=self.precision, incremental=self.incremental)
+		if self.incremental and self._moments is not None:
+			statlist._moments = self._moments.copy()  # The moments do not depend on the order
+		return statlist
+
+	@staticmethod
+	def fromCsv(path: str, delimiter=",", max_denominator=None, columns=None, precision:Precision=None, executor=None) -> tuple:
 		"""
 		Returns a number of StatLists from a csv file. Works for tsv is the delimiter is set.
+		The file is memory-mapped and parsed in chunks with numpy, see washmath.stats.csv_reader. If any cell of the first line is not a number, it is the header of titles.
 		:param str path: The path to the file
 		:param str delimiter: The delimiter of the file. Default is ',' for comma-separated values (csv)
-		:return: A tuple of StatList
-		"""
-		data = open(path).readlines()
-		if not len(data):
+		:param int max_denominator: If set, values are converted to the closest Fraction whose denominator is no larger than this
+		:param columns: The indices or titles of the columns to read, in the order to return them. Every column if None
+		:param Precision precision: How the values are stored. Precision.FLOAT keeps the parsed floats and skips the conversion to Fractions. Defaults to Precision.default()
+		:param concurrent.futures.Executor executor: Converts the columns to StatLists in parallel, such as a ProcessPoolExecutor. Done in this process if None
+		:return: A tuple of StatList. None if the file is empty
+		:raise ValueError: If a cell is not a number, or a column is not in the file
+		"""
+		from itertools import repeat
+		from .csv_reader import read_columns
+		read = read_columns(path, delimiter, columns)
+		if read is None:
 			return
-		for line in data:
-			length = len(line.split(delimiter))
-		hold = [[] for _ in range(length)]
-		for line in data:
-			tmp = line.split(delimiter)
-			tmp = [i.strip().replace("\n", "") for i in tmp]
-			for i in range(len(tmp)):
-				try:
-					hold[i].append(Fraction(float(tmp[i])))
-				except ValueError:
-					hold[i].append(tmp[i])
-		final = []
-		for i in hold:
-			title = i.pop(0)
-			if not isinstance(title, str):
-				i.insert(title, 0)
-				title = ""
-			final.append(StatList(*i, title=title))
-		return tuple(final)
+		titles, arrays = read
+		mapper = map if executor is None else executor.map
+		return tuple(mapper(_column_statlist, arrays, titles, repeat(max_denominator), repeat(precision)))
+
+
+def _column_statlist(array:np.ndarray, title:str, max_denominator:int, precision:Precision) -> StatList:
+	"""
+	Converts one column read by StatList.fromCsv. Module level so a ProcessPoolExecutor can pickle it.
+	"""
+	statlist = StatList(array.tolist(), title=title, max_denominator=max_denominator, precision=precision)
+	if statlist.precision.is_float:
+		statlist._array = np.ascontiguousarray(array)
+	return statlist
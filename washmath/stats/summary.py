@@ -0,0 +1,205 @@
+from itertools import repeat
+import numpy as np
+from ..classes import Fraction, FractionArray, Precision, fsum_exact
+from .moments import RunningMoments
+from .sketch import QuantileSketch
+
+
+
+def _float_moments(moments:RunningMoments) -> RunningMoments:
+	"""
+	:return: A copy of the moments with the sum, mean, and M2 as floats
+	"""
+	moments = moments.copy()
+	moments.sum, moments.mean, moments.m2 = float(moments.sum), float(moments.mean), float(moments.m2)
+	return moments
+
+
+class StatSummary(object):
+	"""
+	The count, sum, mean, M2, min, and max of part of a data set, and optionally a QuantileSketch of it, without the values themselves.
+	Summaries of shards merge into the summary of the whole data set, in any grouping, so shards can be summarized in parallel processes
+	or on different machines and combined afterwards. An exact summary keeps the sum, mean, and M2 as Fractions, so merging loses nothing.
+	"""
+	__slots__ = ("exact", "moments", "sketch")
+
+	def __init__(self, values=(), exact=True, sketch=False, compression:int=100):
+		"""
+		:param values: An iterable of ints, floats, and Fractions
+		:param bool exact: Keep the sum, mean, and M2 as Fractions. If False they are floats and are calculated with numpy
+		:param bool sketch: Also keep a QuantileSketch, so merged summaries can estimate the median and other quantiles
+		:param int compression: The compression of the sketch
+		"""
+		values = list(values)
+		self.exact = exact
+		array = np.fromiter(map(float, values), dtype=np.float64, count=len(values)) if not exact or sketch else None
+		if not exact:
+			self.moments = RunningMoments.from_array(array)
+		else:
+			self.moments = RunningMoments()
+			if values:
+				moments = self.moments
+				moments.count = len(values)
+				moments.sum = fsum_exact(values)
+				moments.mean = Fraction(moments.sum, moments.count)
+				differences = FractionArray(values) - moments.mean
+				moments.m2 = differences.dot(differences)
+				moments.min, moments.max = min(values), max(values)
+		self.sketch = QuantileSketch(array, compression) if sketch else None
+
+	@classmethod
+	def combine(cls, summaries):
+		"""
+		:param summaries: An iterable of StatSummaries, which are not changed
+		:return: A new summary of everything they summarize
+		:raise ValueError: If there are no summaries
+		"""
+		summaries = iter(summaries)
+		try:
+			combined = cls.from_bytes(next(summaries).to_bytes())
+		except StopIteration:
+			raise ValueError("Cannot combine an empty iterable of StatSummaries") from None
+		for summary in summaries:
+			combined.merge(summary)
+		return combined
+
+	@classmethod
+	def reduce(cls, chunks, executor=None, exact=True, sketch=False, compression:int=100):
+		"""
+		Summarizes each chunk, on the executor if one is given, and merges the summaries in order
+		:param chunks: An iterable of iterables of numbers
+		:param concurrent.futures.Executor executor: Such as a ProcessPoolExecutor. The chunks are summarized in this process if None
+		:return: The summary of every value in every chunk
+		"""
+		mapper = map if executor is None else executor.map
+		combined = cls(exact=exact, sketch=sketch, compression=compression)
+		for summary in mapper(cls, chunks, repeat(exact), repeat(sketch), repeat(compression)):
+			combined.merge(summary)
+		return combined
+
+	def merge(self, other) -> None:
+		"""
+		Adds everything summarized by other. An exact summary merged with a float one becomes a float summary, and the sketch is kept only if both have one.
+		:param StatSummary other: The summary of another shard
+		"""
+		moments = other.moments
+		if self.exact and not other.exact:
+			self.exact = False
+			self.moments = _float_moments(self.moments)
+		elif other.exact and not self.exact:
+			moments = _float_moments(moments)  # A copy, so other stays exact
+		self.moments.merge(moments)
+		if self.sketch is not None and other.sketch is not None:
+			self.sketch.merge(other.sketch)
+		else:
+			self.sketch = None
+
+	def __len__(self):
+		return self.moments.count
+
+	@property
+	def count(self) -> int:
+		return self.moments.count
+
+	@property
+	def sum(self):
+		return self.moments.sum
+
+	@property
+	def mean(self):
+		return self.moments.mean
+
+	@property
+	def m2(self):
+		"""The sum of the squared differences from the mean"""
+		return self.moments.m2
+
+	@property
+	def min(self):
+		return self.moments.min
+
+	@property
+	def max(self):
+		return self.moments.max
+
+	@property
+	def variance(self):
+		"""
+		:raise ZeroDivisionError: If fewer than 2 values were summarized
+		"""
+		return self.moments.variance
+
+	@property
+	def standard_deviation(self):
+		return self.variance ** 0.5
+
+	def quantiles(self, probabilities) -> list:
+		"""
+		:param probabilities: An iterable of numbers from 0 to 1
+		:return: The quantiles estimated by the sketch
+		:raise ValueError: If the summary has no sketch
+		"""
+		if self.sketch is None:
+			raise ValueError("The StatSummary has no sketch. Create it with sketch=True to estimate quantiles")
+		return self.sketch.quantiles(probabilities)
+
+	def to_bytes(self) -> bytes:
+		"""
+		:return: The summary in a compact binary format, see washmath.stats.serialization
+		"""
+		from .serialization import dumps_summary
+		return dumps_summary(self)
+
+	@classmethod
+	def from_bytes(cls, data):
+		"""
+		:param data: bytes written by to_bytes
+		:return: The StatSummary
+		:raise ValueError: If the data was not written by to_bytes
+		"""
+		from .serialization import loads_summary
+		return loads_summary(data, cls)
+
+	def save(self, path:str) -> None:
+		"""
+		Writes the summary to a file, such as one shard's file in a directory shared by several machines
+		:param str path: The path to the file
+		"""
+		with open(path, "wb") as file:
+			file.write(self.to_bytes())
+
+	@classmethod
+	def load(cls, path:str):
+		"""
+		:param str path: A file written by save
+		:return: The StatSummary
+		"""
+		with open(path, "rb") as file:
+			return cls.from_bytes(file.read())
+
+	@classmethod
+	def load_directory(cls, directory:str, pattern:str="*.wmss"):
+		"""
+		:param str directory: A directory that each shard saved its summary to
+		:param str pattern: The glob pattern of the summary files
+		:return: The summaries of every matching file, combined
+		:raise ValueError: If no file matches
+		"""
+		from pathlib import Path
+		return cls.combine(cls.load(path) for path in sorted(Path(directory).glob(pattern)))
+
+	def __reduce__(self):
+		return type(self).from_bytes, (self.to_bytes(),)
+
+	def __repr__(self):
+		return f"StatSummary(count={self.count}, mean={self.mean}, exact={self.exact}, sketch={self.sketch is not None})"
+
+
+def _summarize_chunk(values, precision:Precision) -> tuple:
+	"""
+	Converts a chunk for StatList.from_chunks and summarizes it. Module level so a ProcessPoolExecutor can pickle it.
+	:return: The converted values as a StatList, and their StatSummary
+	"""
+	from .statlist import StatList
+	statlist = StatList(values, precision=precision)
+	return statlist, StatSummary(statlist, exact=not precision.is_float)
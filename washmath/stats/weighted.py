@@ -0,0 +1,308 @@
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
+from math import floor
+import numpy as np
+from ..classes import Fraction, FractionArray, Precision, fsum_exact
+from .statlist import StatList
+
+
+class WeightedStatList(StatList):
+	"""
+	A StatList of distinct values and the weight of each one, such as data that was already aggregated into (value, count) pairs.
+	Every statistic is calculated from the pairs, with the same result as the StatList of each value repeated count times, without expanding them.
+	The statistics have the same names as on a StatList, so dataSummary works the same way. len() is the number of pairs and total_weight is the sum of the weights.
+
+	Frequency weights are counts, so the variance divides by total_weight - 1. With frequency=False they are importance (reliability) weights,
+	the variance divides by total_weight - sum(w ** 2) / total_weight, and the standard error uses the effective sample size total_weight ** 2 / sum(w ** 2).
+	"""
+	_STATISTICS = {
+		**StatList._STATISTICS,
+		"_total_weight": "_setTotalWeight",
+		"_weighted_sorted": "_setWeightedSorted",
+	}
+
+	def __init__(self, values=(), weights=None, title="", frequency=True, allow_fractions=True, max_denominator=None, precision:Precision=None):
+		"""
+		:param values: An iterable of numbers
+		:param weights: The weight of each value, all 1 if None
+		:param str title: A title or name you want to give the data set
+		:param bool frequency: If the weights are counts. If False they are importance weights
+		:param boolean allow_fractions: If False, the values and weights are floats and the statistics are calculated with NumPy
+		:param int max_denominator: If set, floats are converted to the closest Fraction whose denominator is no larger than this
+		:param Precision precision: How the values, weights, and statistics are stored. Defaults to Precision.default()
+		:raise ValueError: If there is not one positive weight per value
+		"""
+		super().__init__(list(values), title=title, allow_fractions=allow_fractions, max_denominator=max_denominator, precision=precision)
+		self.frequency = frequency
+		self.weights = [self._check_weight(weight) for weight in weights] if weights is not None else [self._convert(1)] * len(self)
+		if len(self.weights) != len(self):
+			raise ValueError(f"There must be one weight per value. {len(self.weights)} != {len(self)}")
+
+	@classmethod
+	def from_counts(cls, counts, **kwargs):
+		"""
+		:param counts: A dict or Counter from each value to its weight, or an iterable of (value, weight) pairs
+		:param kwargs: The other arguments of WeightedStatList
+		:return: The WeightedStatList of the pairs
+		"""
+		pairs = list(counts.items() if hasattr(counts, "items") else counts)
+		return cls([value for value, _ in pairs], [weight for _, weight in pairs], **kwargs)
+
+	def _check_weight(self, weight):
+		weight = self._convert(weight)
+		if not weight > 0:
+			raise ValueError(f"The weights must be positive, not {weight}")
+		return weight
+
+	def __reduce__(self):
+		return _restore_weighted, (type(self), list(self), self.weights, self.title, self.frequency, self.precision)
+
+	def to_bytes(self, summary=True, compact=False) -> bytes:
+		"""
+		:raise TypeError: The binary format has no weights, so a WeightedStatList is pickled instead
+		"""
+		raise TypeError("A WeightedStatList cannot be written with to_bytes, which would drop the weights. Pickle it instead")
+
+	# region Operators
+	def _like(self, values):
+		"""
+		The element-wise operators keep each value's weight. + and -, which add or remove values, raise instead
+		:raise TypeError: If the result does not have one value per pair
+		"""
+		values = list(values)
+		if len(values) != len(self):
+			raise TypeError("+ and - on a WeightedStatList would lose the weights. Use extend, append, or remove, which keep them")
+		return WeightedStatList(values, self.weights, frequency=self.frequency, allow_fractions=self.allow_fractions, precision=self.precision)
+
+	def _evaluate(self, expression):
+		weighted = self._like(expression.evaluate())
+		weighted.title = self.title
+		return weighted
+
+	# endregion
+
+	# region Changes that keep the weights in line with the values
+	def __setitem__(self, key, value):
+		if isinstance(key, slice) and len(value) != len(range(*key.indices(len(self)))):
+			raise ValueError("A slice of a WeightedStatList can only be replaced by the same number of values, which keep their weights")
+		super().__setitem__(key, value)
+
+	def __delitem__(self, key):
+		super().__delitem__(key)
+		del self.weights[key]
+
+	def append(self, __object, weight=1) -> None:
+		self.weights.append(self._check_weight(weight))
+		list.append(self, self._convert(__object))
+		self._invalidate()
+
+	def extend(self, __iterable, weights=None) -> None:
+		values = list(map(self._convert, __iterable))
+		weights = [self._check_weight(weight) for weight in weights] if weights is not None else [self._convert(1)] * len(values)
+		if len(weights) != len(values):
+			raise ValueError(f"There must be one weight per value. {len(weights)} != {len(values)}")
+		list.extend(self, values)
+		self.weights.extend(weights)
+		self._invalidate()
+
+	def insert(self, __index: int, __object, weight=1) -> None:
+		self.weights.insert(__index, self._check_weight(weight))
+		list.insert(self, __index, self._convert(__object))
+		self._invalidate()
+
+	def pop(self, __index: int = -1):
+		self.weights.pop(__index)
+		return super().pop(__index)
+
+	def remove(self, __value) -> None:
+		del self[self.index(__value)]
+
+	def clear(self) -> None:
+		self.weights.clear()
+		super().clear()
+
+	def reverse(self) -> None:
+		self.weights.reverse()
+		super().reverse()
+
+	def sort(self, *, key=None, reverse: bool = False) -> None:
+		"""
+		Sorts the values in place, moving each weight with its value
+		"""
+		order = sorted(range(len(self)), key=self.__getitem__ if key is None else lambda i: key(self[i]), reverse=reverse)
+		list.__setitem__(self, slice(None), [self[i] for i in order])
+		self.weights[:] = [self.weights[i] for i in order]
+		self._invalidate_order()
+
+	def _invalidate_order(self) -> None:
+		"""
+		Clears every cached statistic, since the cached array no longer lines up with the reordered weights
+		"""
+		self._invalidate()
+
+	# endregion
+
+	@property
+	def total_weight(self):
+		""":return: The total weight, which is the length of the expanded list for frequency weights"""
+		return self._statistic("_total_weight")
+
+	def _weight_array(self):
+		if self.precision.is_float:
+			return np.asarray(self.weights, dtype=np.float64)
+		return FractionArray(self.weights)
+
+	def _effective_size(self):
+		"""
+		:return: The total weight for frequency weights, and total_weight ** 2 / sum(w ** 2) for importance weights
+		"""
+		if self.frequency:
+			return self.total_weight
+		weights = self._weight_array()
+		return self.total_weight * self.total_weight / (weights * weights).sum()
+
+	def _setTotalWeight(self):
+		if self.precision.is_float:
+			self._total_weight = float(np.sum(self.weights))
+			return
+		self._total_weight = fsum_exact(self.weights)
+
+	def _setSum(self):
+		if self.precision.is_float:
+			self._sum = float(self._statistic("_array") @ self._weight_array())
+			return
+		self._sum = self.to_fraction_array().dot(self._weight_array())
+
+	def _setMean(self):
+		self._mean = self.precision.apply(self.sum / self.total_weight)
+
+	def _setFrequencies(self):
+		frequencies = Counter()
+		for value, weight in zip(self, self.weights):
+			frequencies[value] += weight
+		self._frequencies = frequencies
+
+	def _setMode(self):
+		most_common = self._statistic("_frequencies").most_common(1)
+		self._mode = most_common[0][0] if most_common else None
+
+	def _selects_order_statistics(self) -> bool:
+		return False  # The selection in StatList does not know about the weights
+
+	def _setWeightedSorted(self):
+		"""
+		The values from smallest to largest and the running total of their weights, which is one past the last rank each value covers in the expanded list
+		"""
+		if self.precision.is_float:
+			order = self._statistic("_array").argsort(kind="stable")
+			self._weighted_sorted = (self._statistic("_array")[order], self._weight_array()[order].cumsum())
+			return
+		order = sorted(range(len(self)), key=self.__getitem__)
+		self._weighted_sorted = ([self[i] for i in order], list(accumulate(self.weights[i] for i in order)))
+
+	def _value_at(self, position):
+		"""
+		:param position: A rank of the expanded list from 0 to total_weight - 1, interpolated linearly between whole ranks
+		:return: The value at that rank
+		"""
+		values, ends = self._statistic("_weighted_sorted")
+		last = len(values) - 1
+		lower = floor(position)
+		if self.precision.is_float:
+			low, high = np.searchsorted(ends, [lower, lower + 1], side="right").tolist()
+		else:
+			low, high = bisect_right(ends, lower), bisect_right(ends, lower + 1)
+		value = values[min(low, last)]
+		weight = position - lower
+		if not weight:
+			return value
+		value = value + (values[min(high, last)] - value) * weight
+		return float(value) if self.precision.is_float else self.precision.apply(value)
+
+	def _quartile_position(self):
+		"""
+		:return: The rank of Q1, the median of the lower half of the expanded list. Q3 is at total_weight - 1 minus it
+		:raise ValueError: If the total weight is less than 2
+		"""
+		half = floor(self.total_weight / 2)
+		if half < 1:
+			raise ValueError("The quartiles need a total weight of at least 2")
+		return Fraction(half - 1, 2) if not self.precision.is_float else (half - 1) / 2
+
+	def _setMedian(self):
+		last = self.total_weight - 1
+		self._median = self._value_at(last / 2 if self.precision.is_float else Fraction(last, 2))
+
+	def _setQ1(self):
+		self._Q1 = self._value_at(self._quartile_position())
+
+	def _setQ3(self):
+		self._Q3 = self._value_at(self.total_weight - 1 - self._quartile_position())
+
+	def quantiles(self, probabilities) -> list:
+		"""
+		:param probabilities: An iterable of numbers from 0 to 1
+		:return: The quantile of the expanded list for each probability, interpolated the same way as StatList.quantiles
+		:raise ValueError: If the list is empty or a probability is not between 0 and 1
+		"""
+		if not len(self):
+			raise ValueError("Cannot find the quantiles of an empty WeightedStatList")
+		last = self.total_weight - 1
+		quantiles = []
+		for probability in probabilities:
+			if not 0 <= probability <= 1:
+				raise ValueError(f"The probabilities must be between 0 and 1, not {probability}")
+			quantiles.append(self._value_at(probability * last if self.precision.is_float else Fraction(probability) * last))
+		return quantiles
+
+	def _setVariance(self):
+		if self.frequency:
+			divisor = self.total_weight - 1
+		else:
+			weights = self._weight_array()
+			divisor = self.total_weight - (weights * weights).sum() / self.total_weight
+		if self.precision.is_float:
+			differences = self._statistic("_array") - self.mean
+			self._variance = float((differences * differences) @ self._weight_array() / divisor)
+			return
+		differences = self.to_fraction_array() - self.mean
+		self._variance = self.precision.apply((differences * differences).dot(self._weight_array()) / divisor)
+
+	def _setStandardDeviation(self):
+		self._standardDeviation = self.precision.apply(self.variance ** 0.5)
+
+	def _setStandardError(self):
+		if self.precision.is_float:
+			self._standardError = self.standard_deviation / np.sqrt(self._effective_size())
+			return
+		self._standardError = self.precision.apply(Fraction(self.standard_deviation, np.sqrt(float(self._effective_size()))))
+
+	def _setAverageDeviation(self):
+		if self.precision.is_float:
+			self._averageDeviation = float(np.abs(self._statistic("_array") - self.mean) @ self._weight_array() / self.total_weight)
+			return
+		differences = abs(self.to_fraction_array() - self.mean)
+		self._averageDeviation = self.precision.apply(differences.dot(self._weight_array()) / self.total_weight)
+
+	def outlier_weight(self):
+		"""
+		:return: The total weight of the outliers, which is how many outliers the expanded list has for frequency weights. outliers has each value once
+		"""
+		low, high = self.outlier_range
+		if self.precision.is_float:
+			values = self._statistic("_array")
+			return float(self._weight_array()[(values < low) | (values > high)].sum())
+		return fsum_exact(weight for value, weight in zip(self, self.weights) if value < low or value > high)
+
+	def _summary_rows(self) -> list:
+		rows = super()._summary_rows()
+		rows[1] = ["Length", self.total_weight]
+		for row in rows:
+			if row[0] == "Number of Outliers":
+				row[1] = self.outlier_weight()
+		return rows
+
+
+def _restore_weighted(cls, values, weights, title, frequency, precision):
+	return cls(values, weights, title=title, frequency=frequency, precision=precision)